@@ -0,0 +1,143 @@
+# application_engine/db_pool.py
+"""
+Shared PostgreSQL connection pools.
+
+One thread-safe pool per connection config (DB_CONFIG by default) is shared
+by the API, the bot thread and the Gradio callbacks, so a query costs a
+round trip instead of a fresh TCP + auth handshake:
+
+    with get_connection() as conn:
+        cur = conn.cursor()
+        ...
+
+The block commits on success and rolls back on error before the connection
+goes back to the pool. FastAPI handlers use run_db() to run a DB function on
+a bounded thread pool instead of blocking the event loop.
+"""
+
+import os
+import time
+import atexit
+import asyncio
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+from application_engine.db_config import DB_CONFIG
+
+POOL_MAX = int(os.getenv("PG_POOL_MAX", "10"))
+# Connections idle longer than this are pinged before reuse (the server or a
+# proxy may have dropped them without the client noticing)
+POOL_CHECK_IDLE = float(os.getenv("PG_POOL_CHECK_IDLE", "30"))
+
+_pools = {}
+_lock = threading.Lock()
+_executor = None
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of up to `maxconn` connections, opened on demand and
+    kept open once returned (and pinged before reuse after POOL_CHECK_IDLE
+    seconds idle). getconn() waits while all of them are in use
+    (psycopg2's own pools raise instead, and close every connection above
+    their minimum when it is returned).
+    """
+
+    def __init__(self, maxconn, **config):
+        self.config = config
+        self._idle = []
+        self._idle_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(maxconn)
+
+    def getconn(self):
+        self._slots.acquire()
+        try:
+            while True:
+                with self._idle_lock:
+                    if not self._idle:
+                        break
+                    conn, idle_since = self._idle.pop()
+                if self._usable(conn, idle_since):
+                    return conn
+            return psycopg2.connect(**self.config)
+        except Exception:
+            self._slots.release()
+            raise
+
+    @staticmethod
+    def _usable(conn, idle_since):
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < POOL_CHECK_IDLE:
+            return True
+        try:
+            cur = conn.cursor()
+            cur.execute("SELECT 1")
+            cur.close()
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            conn.close()
+            return False
+
+    def putconn(self, conn):
+        try:
+            if not conn.closed:
+                with self._idle_lock:
+                    self._idle.append((conn, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def closeall(self):
+        with self._idle_lock:
+            for conn, _ in self._idle:
+                conn.close()
+            self._idle.clear()
+
+
+def get_pool(config=None):
+    config = config or DB_CONFIG
+    key = tuple(sorted((k, str(v)) for k, v in config.items()))
+    if key not in _pools:
+        with _lock:
+            if key not in _pools:
+                _pools[key] = ConnectionPool(POOL_MAX, **config)
+    return _pools[key]
+
+
+@contextmanager
+def get_connection(config=None):
+    """Borrow a pooled connection; commits on success, rolls back on error."""
+    pool = get_pool(config)
+    conn = pool.getconn()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+
+async def run_db(fn, *args, **kwargs):
+    """Await a blocking DB function (e.g. has_applied) without stalling the event loop."""
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                # As many threads as one pool has connections; the pool is shared
+                # with other threads (bot loop, Gradio), so a query may still wait
+                _executor = ThreadPoolExecutor(max_workers=POOL_MAX, thread_name_prefix="db")
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, lambda: fn(*args, **kwargs))
+
+
+@atexit.register
+def close_pools():
+    for pool in _pools.values():
+        pool.closeall()
+    _pools.clear()
@@ -2,100 +2,134 @@ import os
 from dotenv import load_dotenv
 load_dotenv()
 
-import psycopg2
 from datetime import datetime
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 import csv
-from application_engine.db_config import DB_CONFIG
+from application_engine.db_pool import get_connection
+
+# Postings checked per bulk status query in the streaming job cycle
+STATUS_BATCH_SIZE = int(os.getenv("STATUS_BATCH_SIZE", "500"))
+STATUS_BATCH_WAIT = float(os.getenv("STATUS_BATCH_WAIT", "2.0"))
 
 def init_db():
-    conn = psycopg2.connect(**DB_CONFIG)
-    cur = conn.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS applications (
-            id SERIAL PRIMARY KEY,
-            timestamp TIMESTAMP,
-            title TEXT,
-            company TEXT,
-            location TEXT,
-            url TEXT,
-            resume_path TEXT,
-            status TEXT
-        );
-    """)
-    conn.commit()
-    cur.close()
-    conn.close()
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS applications (
+                id SERIAL PRIMARY KEY,
+                timestamp TIMESTAMP,
+                title TEXT,
+                company TEXT,
+                location TEXT,
+                url TEXT,
+                resume_path TEXT,
+                status TEXT
+            );
+        """)
+        # Serves the per-URL status lookups (has_applied, get_application_counts)
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_applications_url_status ON applications (url, status);")
+        cur.close()
 
 def log_and_notify(job, resume_path, status="success"):
-    conn = psycopg2.connect(**DB_CONFIG)
-    cur = conn.cursor()
-    cur.execute("""
-        INSERT INTO applications (timestamp, title, company, location, url, resume_path, status)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-    """, (
-        datetime.now(),
-        job["title"],
-        job["company"],
-        job["location"],
-        job["url"],
-        resume_path,
-        status
-    ))
-    conn.commit()
-    cur.close()
-    conn.close()
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            INSERT INTO applications (timestamp, title, company, location, url, resume_path, status)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, (
+            datetime.now(),
+            job["title"],
+            job["company"],
+            job["location"],
+            job["url"],
+            resume_path,
+            status
+        ))
+        cur.close()
     send_email(job, status)
 
 def has_applied(job_url):
-    conn = psycopg2.connect(**DB_CONFIG)
-    cur = conn.cursor()
-    cur.execute("SELECT 1 FROM applications WHERE url = %s AND status = 'success'", (job_url,))
-    result = cur.fetchone()
-    cur.close()
-    conn.close()
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT 1 FROM applications WHERE url = %s AND status = 'success'", (job_url,))
+        result = cur.fetchone()
+        cur.close()
     return result is not None
 
 def has_failed_before(job_url, max_retries=2):
-    conn = psycopg2.connect(**DB_CONFIG)
-    cur = conn.cursor()
-    cur.execute("SELECT COUNT(*) FROM applications WHERE url = %s AND status = 'failed'", (job_url,))
-    count = cur.fetchone()[0]
-    cur.close()
-    conn.close()
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT COUNT(*) FROM applications WHERE url = %s AND status = 'failed'", (job_url,))
+        count = cur.fetchone()[0]
+        cur.close()
     return count >= max_retries
 
+def get_application_counts(job_urls):
+    """
+    Success and failure counts for a whole batch of URLs in one query:
+    {url: {"success": n, "failed": n}}, zeros for URLs never tried.
+    """
+    counts = {url: {"success": 0, "failed": 0} for url in job_urls}
+    if not counts:
+        return counts
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT url,
+                   COUNT(*) FILTER (WHERE status = 'success'),
+                   COUNT(*) FILTER (WHERE status = 'failed')
+            FROM applications
+            WHERE url = ANY(%s) AND status IN ('success', 'failed')
+            GROUP BY url
+        """, (list(counts),))
+        for url, success, failed in cur.fetchall():
+            counts[url] = {"success": success, "failed": failed}
+        cur.close()
+    return counts
+
+def filter_unapplied(jobs, max_retries=2):
+    """Bulk has_applied / has_failed_before: the jobs not yet applied to and not failed max_retries times."""
+    counts = get_application_counts([job["url"] for job in jobs])
+    kept = []
+    for job in jobs:
+        status = counts[job["url"]]
+        if status["success"]:
+            print(f"Skipping {job['title']} (already applied)")
+        elif status["failed"] >= max_retries:
+            print(f"Skipping {job['title']} (failed too many times)")
+        else:
+            kept.append(job)
+    return kept
+
 def export_successful_to_csv(filename="successful_applications.csv"):
-    conn = psycopg2.connect(**DB_CONFIG)
-    cur = conn.cursor()
-    cur.execute("""
-        SELECT timestamp, title, company, location, url, resume_path, status
-        FROM applications
-        WHERE status = 'success'
-        ORDER BY timestamp DESC
-    """)
-    rows = cur.fetchall()
-    headers = [desc[0] for desc in cur.description]
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT timestamp, title, company, location, url, resume_path, status
+            FROM applications
+            WHERE status = 'success'
+            ORDER BY timestamp DESC
+        """)
+        rows = cur.fetchall()
+        headers = [desc[0] for desc in cur.description]
+        cur.close()
 
     with open(filename, "w", newline='', encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(headers)
         writer.writerows(rows)
 
-    cur.close()
-    conn.close()
     print(f"Exported successful applications to {filename}")
 
 def get_success_count():
-    conn = psycopg2.connect(**DB_CONFIG)
-    cur = conn.cursor()
-    cur.execute("SELECT COUNT(*) FROM applications WHERE status = 'success'")
-    count = cur.fetchone()[0]
-    cur.close()
-    conn.close()
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT COUNT(*) FROM applications WHERE status = 'success'")
+        count = cur.fetchone()[0]
+        cur.close()
     return count
 
 def send_csv_attachment(csv_file):
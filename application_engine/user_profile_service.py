@@ -1,12 +1,22 @@
 import os
 import yaml
-import psycopg2
 from dotenv import load_dotenv
 
+from application_engine.db_pool import get_connection
+
 load_dotenv()
 
 SCHEMA_PATH = "configs/universal_signup_schema.yaml"
 
+# The profile store is configured separately from the applications DB (DB_CONFIG)
+PROFILE_DB_CONFIG = {
+    "dbname": os.getenv("DB_NAME"),
+    "user": os.getenv("DB_USER"),
+    "password": os.getenv("DB_PASSWORD"),
+    "host": os.getenv("DB_HOST"),
+    "port": os.getenv("DB_PORT", 5432)
+}
+
 
 def load_schema():
     with open(SCHEMA_PATH, "r") as f:
@@ -14,22 +24,16 @@ def load_schema():
 
 
 def get_db_connection():
-    return psycopg2.connect(
-        dbname=os.getenv("DB_NAME"),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        host=os.getenv("DB_HOST"),
-        port=os.getenv("DB_PORT", 5432)
-    )
+    """Pooled connection to the profile DB; use as a context manager."""
+    return get_connection(PROFILE_DB_CONFIG)
 
 
 def fetch_existing_answers():
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT section, key, value FROM user_profile")
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT section, key, value FROM user_profile")
+        rows = cur.fetchall()
+        cur.close()
 
     profile = {}
     for section, key, value in rows:
@@ -38,17 +42,15 @@ def fetch_existing_answers():
 
 
 def save_answer(section, key, value):
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        INSERT INTO user_profile (section, key, value)
-        VALUES (%s, %s, %s)
-        ON CONFLICT (section, key)
-        DO UPDATE SET value = EXCLUDED.value
-    """, (section, key, value))
-    conn.commit()
-    cur.close()
-    conn.close()
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            INSERT INTO user_profile (section, key, value)
+            VALUES (%s, %s, %s)
+            ON CONFLICT (section, key)
+            DO UPDATE SET value = EXCLUDED.value
+        """, (section, key, value))
+        cur.close()
 
 
 def prompt_for_missing_answers(schema, existing_profile):
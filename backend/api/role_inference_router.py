@@ -1,7 +1,6 @@
 import os
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from fastapi.responses import JSONResponse
-from llm_modules.role_inference import infer_job_roles_from_resume
 from uuid import uuid4
 import shutil
 import logging
@@ -22,6 +21,9 @@ async def infer_roles_from_resume(resume_file: UploadFile = File(...)):
     Upload a resume file (PDF or DOCX) and infer 3–5 ideal job roles.
     """
     try:
+        # Imported here so the OpenAI/PyMuPDF stack loads on first use, not at API startup
+        from llm_modules.role_inference import infer_job_roles_from_resume
+
         file_ext = resume_file.filename.split(".")[-1].lower()
         if file_ext not in ["pdf", "doc", "docx"]:
             raise HTTPException(status_code=400, detail="Unsupported file type. Upload a PDF or DOCX.")
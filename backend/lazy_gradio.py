@@ -0,0 +1,51 @@
+"""
+Lazy ASGI mount for the Gradio UI.
+"""
+import asyncio
+
+
+class LazyGradioApp:
+    """
+    ASGI app that builds the Gradio UI on the first request routed to it.
+
+    Building the UI imports gradio, pandas, the OpenAI clients and the resume
+    parsing stack. Deferring that work lets the API bind and report healthy
+    right away instead of after the whole UI has been constructed.
+    """
+
+    def __init__(self, blocks_factory):
+        self._blocks_factory = blocks_factory
+        self._app = None
+        self._lifespan = None
+        self._lock = asyncio.Lock()
+
+    async def _build(self):
+        # The heavy imports happen inside the factory; keep them off the event loop
+        loop = asyncio.get_running_loop()
+        blocks = await loop.run_in_executor(None, self._blocks_factory)
+
+        import gradio as gr
+        from fastapi import FastAPI
+
+        # Mount on a sub-app of our own through the public API. The parent
+        # app's lifespan is long over, so the sub-app's (which runs Gradio's
+        # startup events) is entered here and left in aclose().
+        app = gr.mount_gradio_app(FastAPI(docs_url=None, redoc_url=None, openapi_url=None), blocks, path="/")
+        self._lifespan = app.router.lifespan_context(app)
+        await self._lifespan.__aenter__()
+        return app
+
+    async def aclose(self):
+        """Shut the Gradio app down, if it was ever built."""
+        if self._lifespan is not None:
+            await self._lifespan.__aexit__(None, None, None)
+            self._lifespan = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            return
+        if self._app is None:
+            async with self._lock:
+                if self._app is None:
+                    self._app = await self._build()
+        await self._app(scope, receive, send)
@@ -1,57 +1,72 @@
 # core/job_controller.py
 from application_engine.job_status_service import (
-    init_db, has_applied, has_failed_before, export_successful_to_csv,
-    get_success_count, send_csv_attachment, log_and_notify
+    init_db, filter_unapplied, export_successful_to_csv, get_success_count,
+    send_csv_attachment, log_and_notify, STATUS_BATCH_SIZE, STATUS_BATCH_WAIT
 )
-from scrapers.universal_scraper import fetch_all_jobs
+from application_engine.db_pool import run_db
+from scrapers.universal_scraper import iter_new_jobs_async
+from scrapers.postings_index import requeue_postings
+from scrapers.enrichment import iter_enriched_async
+from scrapers.dedup import Deduplicator, iter_unique_listings_async, iter_unique_descriptions_async
+from scrapers.async_fetcher import AsyncFetcher, run_sync
+from scrapers.streams import filter_batched
 from llm_modules import resume_matcher
 from llm_modules.resume_tailor import tailor_resume
 from application_engine import form_filler
-import os, json, time
+import os, json, time, asyncio
 from datetime import datetime
 
-def run_job_cycle(test_mode=False):
+async def run_job_cycle_async(test_mode=False):
     print("AI Job Applier Bot Started:", datetime.now())
-    init_db()
+    await run_db(init_db)
 
-    jobs = fetch_all_jobs()
-    print(f"Found {len(jobs)} jobs.")
+    retry_urls = []
+    applied, failed = 0, 0
+    found = 0
+    stats = {"skipped": 0}
 
-    matched_jobs = []
-    for job in jobs:
-        try:
+    # Each posting is handled as soon as it is scraped and enriched
+    async with AsyncFetcher() as fetcher:
+        deduper = Deduplicator()
+        jobs = iter_unique_listings_async(iter_new_jobs_async(fetcher), deduper)
+        # Already-applied / repeatedly failed postings go in one bulk query per batch
+        jobs = filter_batched(jobs, lambda batch: run_db(filter_unapplied, batch),
+                              STATUS_BATCH_SIZE, STATUS_BATCH_WAIT, stats)
+        jobs = iter_unique_descriptions_async(iter_enriched_async(jobs, fetcher), deduper)
+        async for job in jobs:
+            found += 1
             job.update({"match_score": 100, "matched_skills": [], "missing_skills": []})
-            matched_jobs.append(job)
-        except Exception as e:
-            print(f"Failed to score job {job.get('title', 'Unknown')}: {e}")
-            continue
-
-    filtered_jobs = []
-    applied, skipped, failed = 0, 0, 0
-
-    for job in matched_jobs:
-        if has_applied(job["url"]) or has_failed_before(job["url"]) or job.get("match_score", 0) < 50:
-            skipped += 1
-            continue
-
-        try:
-            resume_matcher.generate_custom_resume(job)
-            filtered_jobs.append(job)
-        except Exception as e:
-            print(f"Resume tailoring failed: {e}")
-            failed += 1
-
-    for job in filtered_jobs:
-        try:
-            form_filler.apply_to_job(job)
-            log_and_notify(job, resume_path="resume_templates/output", status="success")
-            applied += 1
-        except Exception as e:
-            log_and_notify(job, resume_path="resume_templates/output", status="failed")
-            failed += 1
-
-    export_successful_to_csv()
-    if get_success_count() % 50 == 0:
+
+            if job.get("match_score", 0) < 50:
+                stats["skipped"] += 1
+                continue
+
+            try:
+                await asyncio.to_thread(resume_matcher.generate_custom_resume, job)
+            except Exception as e:
+                print(f"Resume tailoring failed: {e}")
+                retry_urls.append(job["url"])
+                failed += 1
+                continue
+
+            try:
+                await asyncio.to_thread(form_filler.apply_to_job, job)
+                await run_db(log_and_notify, job, resume_path="resume_templates/output", status="success")
+                applied += 1
+            except Exception as e:
+                await run_db(log_and_notify, job, resume_path="resume_templates/output", status="failed")
+                retry_urls.append(job["url"])
+                failed += 1
+
+    print(f"Found {found} jobs.")
+    if retry_urls:
+        await asyncio.to_thread(requeue_postings, retry_urls)
+
+    await run_db(export_successful_to_csv)
+    if await run_db(get_success_count) % 50 == 0:
         send_csv_attachment("successful_applications.csv")
 
-    print(f"Cycle done: Applied={applied}, Skipped={skipped}, Failed={failed}")
+    print(f"Cycle done: Applied={applied}, Skipped={stats['skipped']}, Failed={failed}")
+
+def run_job_cycle(test_mode=False):
+    run_sync(run_job_cycle_async(test_mode))
@@ -3,13 +3,12 @@ import gradio as gr
 import tempfile
 import threading
 import pandas as pd
-import psycopg2
 import requests
 import mimetypes
 from dotenv import load_dotenv
 from datetime import datetime
 from openai import OpenAI
-from application_engine.db_config import DB_CONFIG
+from application_engine.db_pool import get_connection
 from core.job_controller import run_job_cycle
 from pipeline_controller import main_pipeline
 import pytesseract
@@ -127,16 +126,15 @@ def analyze(resume_file, job_description):
 
 def fetch_applications(status="all"):
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
-        cur = conn.cursor()
-        if status != "all":
-            cur.execute("SELECT * FROM applications WHERE status = %s ORDER BY timestamp DESC", (status,))
-        else:
-            cur.execute("SELECT * FROM applications ORDER BY timestamp DESC")
-        rows = cur.fetchall()
-        headers = [desc[0] for desc in cur.description]
-        cur.close()
-        conn.close()
+        with get_connection() as conn:
+            cur = conn.cursor()
+            if status != "all":
+                cur.execute("SELECT * FROM applications WHERE status = %s ORDER BY timestamp DESC", (status,))
+            else:
+                cur.execute("SELECT * FROM applications ORDER BY timestamp DESC")
+            rows = cur.fetchall()
+            headers = [desc[0] for desc in cur.description]
+            cur.close()
         return pd.DataFrame(rows, columns=headers)
     except Exception as e:
         return pd.DataFrame({"error": [str(e)]})
@@ -1,10 +1,8 @@
 # llm_modules/ats_matcher.py
 
 import os
-import nltk
 import spacy
-import string
-from nltk.corpus import stopwords
+import numpy as np
 from sklearn.feature_extraction.text import CountVectorizer
 from sentence_transformers import SentenceTransformer, util
 from functools import lru_cache
@@ -15,20 +13,29 @@ from llm_modules.resume_parser import (
     extract_images_from_docx,
     ocr_text_from_images
 )
+from llm_modules.embedding_store import get_embedding_store
+from llm_modules.keyword_matcher import get_keyword_matcher
+from llm_modules.text_preprocessing import ENGLISH_STOP_WORDS, preprocess_many
+from llm_modules.text_preprocessing import preprocess as fast_preprocess
+from utils.disk_cache import JsonDiskCache, sha256_file
 
-# Download NLTK data only if not already downloaded
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# Bump when the stored resume analysis changes shape or meaning
+RESUME_ANALYSIS_VERSION = 1
+_resume_cache = JsonDiskCache("resume_analysis")
+_resume_memo = {}
+
+# noun_chunks only needs POS tags and the dependency parse
+KEYWORD_PIPELINE_EXCLUDE = ["ner", "lemmatizer"]
+KEYWORD_CACHE_VERSION = 1
+KEYWORD_PROCESSES = int(os.getenv("ATS_SPACY_PROCESSES", max(1, (os.cpu_count() or 2) // 2)))
+# Below this many uncached texts per process, worker start-up costs more than it saves
+MIN_TEXTS_PER_PROCESS = 25
+_keyword_cache = JsonDiskCache("jd_keywords")
 
 # Singleton pattern for model loading
 class ModelLoader:
     _nlp = None
+    _keyword_nlp = None
     _model = None
     _stop_words = None
 
@@ -38,6 +45,12 @@ class ModelLoader:
             cls._nlp = spacy.load("en_core_web_sm")
         return cls._nlp
 
+    @classmethod
+    def get_keyword_nlp(cls):
+        if cls._keyword_nlp is None:
+            cls._keyword_nlp = spacy.load("en_core_web_sm", exclude=KEYWORD_PIPELINE_EXCLUDE)
+        return cls._keyword_nlp
+
     @classmethod
     def get_model(cls):
         if cls._model is None:
@@ -47,13 +60,16 @@ class ModelLoader:
     @classmethod
     def get_stop_words(cls):
         if cls._stop_words is None:
-            cls._stop_words = set(stopwords.words('english'))
+            cls._stop_words = ENGLISH_STOP_WORDS
         return cls._stop_words
 
 # Initialize models lazily
 def get_nlp():
     return ModelLoader.get_nlp()
 
+def get_keyword_nlp():
+    return ModelLoader.get_keyword_nlp()
+
 def get_model():
     return ModelLoader.get_model()
 
@@ -62,14 +78,43 @@ def get_stop_words():
 
 @lru_cache(maxsize=1000)
 def preprocess(text):
-    text = text.lower().translate(str.maketrans('', '', string.punctuation))
-    tokens = nltk.word_tokenize(text)
-    return ' '.join([word for word in tokens if word not in get_stop_words()])
+    return fast_preprocess(text)
+
+def _noun_chunk_keywords(doc):
+    return list(set([chunk.text.lower() for chunk in doc.noun_chunks if len(chunk.text) > 2]))
+
+def extract_keywords_bulk(texts, n_process=None, batch_size=64):
+    """
+    Noun-chunk keywords for many texts at once.
+
+    Texts already in the on-disk cache are not parsed again; the rest are
+    streamed through nlp.pipe on a trimmed pipeline, across several processes
+    when there are enough of them. Returns one keyword list per input text.
+    """
+    results = [None] * len(texts)
+    pending = {}
+    for i, text in enumerate(texts):
+        cached = _keyword_cache.get(f"v{KEYWORD_CACHE_VERSION}:{text}")
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.setdefault(text, []).append(i)
+
+    if pending:
+        unique_texts = list(pending)
+        if n_process is None:
+            n_process = max(1, min(KEYWORD_PROCESSES, len(unique_texts) // MIN_TEXTS_PER_PROCESS))
+        docs = get_keyword_nlp().pipe(unique_texts, n_process=n_process, batch_size=batch_size)
+        for text, doc in zip(unique_texts, docs):
+            keywords = _noun_chunk_keywords(doc)
+            _keyword_cache.set(f"v{KEYWORD_CACHE_VERSION}:{text}", keywords)
+            for i in pending[text]:
+                results[i] = keywords
+    return results
 
 @lru_cache(maxsize=100)
 def extract_keywords(text):
-    doc = get_nlp()(text)
-    return list(set([chunk.text.lower() for chunk in doc.noun_chunks if len(chunk.text) > 2]))
+    return extract_keywords_bulk([text])[0]
 
 
 @lru_cache(maxsize=100)
@@ -91,45 +136,97 @@ def get_resume_sections(resume_text):
 
 def keyword_score(jd_keywords, resume_sections):
     all_text = ' '.join(resume_sections.values()).lower()
-    matched = [word for word in jd_keywords if word in all_text]
-    missing = [word for word in jd_keywords if word not in all_text]
+    matched, missing = get_keyword_matcher(all_text).classify(jd_keywords)
     score = (len(matched) / len(jd_keywords)) * 100 if jd_keywords else 0
     return round(score, 2), matched, missing
 
 
+def encode_job_descriptions(jd_texts, batch_size=32):
+    """
+    Embed JDs, reading from the persistent embedding store first.
+    Only postings never seen before go through the model, in one batch.
+    """
+    store = get_embedding_store()
+    found = store.get_many(jd_texts)
+    missing = [i for i in range(len(jd_texts)) if i not in found]
+    if missing:
+        new_vectors = get_model().encode([jd_texts[i] for i in missing], batch_size=batch_size)
+        store.put_many([jd_texts[i] for i in missing], new_vectors)
+        found.update(zip(missing, new_vectors))
+    return np.stack([found[i] for i in range(len(jd_texts))]).astype(np.float32)
+
+
 @lru_cache(maxsize=100)
 def semantic_score(jd_text, resume_text):
-    jd_emb = get_model().encode(jd_text, convert_to_tensor=True)
+    jd_emb = encode_job_descriptions([jd_text])
     res_emb = get_model().encode(resume_text, convert_to_tensor=True)
     similarity = util.pytorch_cos_sim(jd_emb, res_emb).item()
     return round(similarity * 100, 2)
 
 
-def compute_ats_score(jd_text, resume_path):
-    resume_text = ""
-    images = []
+def semantic_scores_batch(jd_texts, resume_embedding, batch_size=32):
+    """
+    Similarity of every JD against one resume embedding.
+    Uncached JDs are encoded in a single batched call and all are compared in one matrix op.
+    """
+    if not jd_texts:
+        return []
+    jd_embs = encode_job_descriptions(list(jd_texts), batch_size=batch_size)
+    similarities = util.pytorch_cos_sim(jd_embs, resume_embedding)[:, 0]
+    return [round(sim * 100, 2) for sim in similarities.tolist()]
+
+
+def analyze_resume(resume_path):
+    """
+    Return the job-independent analysis of a resume: extracted text, OCR text,
+    sections and embedding. Results are keyed by the file's content hash and
+    persisted on disk, so a resume is parsed and OCR'd once, not once per job.
+    """
+    content_hash = sha256_file(resume_path)
+    key = f"{content_hash}:v{RESUME_ANALYSIS_VERSION}"
+    if key in _resume_memo:
+        return _resume_memo[key]
+
+    analysis = _resume_cache.get(key)
+    if analysis is None:
+        if resume_path.endswith(".pdf"):
+            text = extract_text_from_pdf(resume_path)
+            images = extract_images_from_pdf(resume_path)
+        else:
+            text = extract_text_from_docx(resume_path)
+            images = extract_images_from_docx(resume_path)
+
+        ocr_text = ocr_text_from_images(images)
+        resume_text = text + "\n" + ocr_text
+        readable = len(resume_text.strip()) >= 50
+
+        analysis = {
+            "content_hash": content_hash,
+            "text": text,
+            "ocr_text": ocr_text,
+            "resume_text": resume_text,
+            "sections": get_resume_sections(resume_text),
+            "embedding": get_model().encode(resume_text).tolist() if readable else None
+        }
+        # Don't pin a failed extraction (e.g. missing Tesseract) to this file forever
+        if not readable:
+            return analysis
+        _resume_cache.set(key, analysis)
 
-    if resume_path.endswith(".pdf"):
-        resume_text = extract_text_from_pdf(resume_path)
-        images = extract_images_from_pdf(resume_path)
-    elif resume_path.endswith(".docx"):
-        resume_text = extract_text_from_docx(resume_path)
-        images = extract_images_from_docx(resume_path)
-    else:
-        return {"error": "Unsupported resume format"}
+    _resume_memo[key] = analysis
+    return analysis
 
-    ocr_text = ocr_text_from_images(images)
-    resume_text += "\n" + ocr_text
 
-    if not resume_text or len(resume_text.strip()) < 50:
-        return {"error": "Resume content is too short or unreadable."}
+def _jd_keywords(jd_clean, jd_chunks):
+    return list(set(jd_chunks + jd_clean.split()))
 
-    jd_clean = preprocess(jd_text)
-    jd_keywords = list(set(extract_keywords(jd_text) + jd_clean.split()))
-    resume_sections = get_resume_sections(resume_text)
 
+def _is_readable(resume):
+    return bool(resume["resume_text"]) and len(resume["resume_text"].strip()) >= 50
+
+
+def _build_ats_result(jd_keywords, resume_sections, sem_score):
     kw_score, matched, missing = keyword_score(jd_keywords, resume_sections)
-    sem_score = semantic_score(jd_text, resume_text)
 
     final_score = round(0.6 * kw_score + 0.4 * sem_score, 2)
 
@@ -142,15 +239,146 @@ def compute_ats_score(jd_text, resume_path):
         "Suggestions": f"Consider adding: {', '.join(missing[:10])}"
     }
 
-def score_jobs_against_resume(jobs, resume_path="resume_templates/original/KARTHIK_RESUME.pdf"):
+
+def compute_ats_scores(jd_texts, resume_path):
+    """
+    Score many job descriptions against one resume.
+
+    The resume is analyzed once, all JD embeddings are computed in a single
+    batch and all JD keywords go through one nlp.pipe stream, so this is much
+    cheaper than calling compute_ats_score per job.
+    Returns one result dict per JD, in input order.
+    """
+    if not resume_path.endswith((".pdf", ".docx")):
+        return [{"error": "Unsupported resume format"} for _ in jd_texts]
+
+    resume = analyze_resume(resume_path)
+
+    if not _is_readable(resume):
+        return [{"error": "Resume content is too short or unreadable."} for _ in jd_texts]
+
+    sem_scores = semantic_scores_batch(jd_texts, resume["embedding"])
+    jd_chunks = extract_keywords_bulk(jd_texts)
+    jd_cleaned = preprocess_many(jd_texts)
+
     results = []
-    for job in jobs:
+    for jd_clean, chunks, sem_score in zip(jd_cleaned, jd_chunks, sem_scores):
         try:
-            score_result = compute_ats_score(job["description"], resume_path)
-            job["ats_score"] = score_result.get("Final ATS Score", 0)
-            job["Matched Keywords"] = score_result.get("Matched Keywords", [])
-            job["Missing Keywords"] = score_result.get("Missing Keywords", [])
-            results.append(job)
+            results.append(_build_ats_result(_jd_keywords(jd_clean, chunks), resume["sections"], sem_score))
         except Exception as e:
-            print(f"[ERROR] Failed to score job '{job.get('title', 'N/A')}': {e}")
+            results.append({"error": str(e)})
     return results
+
+
+def compute_ats_score(jd_text, resume_path):
+    return compute_ats_scores([jd_text], resume_path)[0]
+
+
+def compute_ats_score_matrix(resume_paths, jd_texts):
+    """
+    Score R resumes against N job descriptions.
+
+    Every resume is analyzed once and every JD is embedded and keyword-parsed
+    once; semantic similarity for all pairs is a single matrix multiply.
+
+    Returns:
+        dict: {
+            "resumes": resume paths (rows),
+            "scores": R x N list of Final ATS Scores (None where a resume is unusable
+                      or a pair failed to score),
+            "details": R x N list of result dicts as returned by compute_ats_score,
+            "best_resume": per JD, the path of the highest-scoring resume (or None)
+        }
+    """
+    resume_paths, jd_texts = list(resume_paths), list(jd_texts)
+    resumes = []
+    for path in resume_paths:
+        if not path.endswith((".pdf", ".docx")):
+            resumes.append({"error": "Unsupported resume format"})
+            continue
+        try:
+            resume = analyze_resume(path)
+        except Exception as e:
+            resumes.append({"error": str(e)})
+            continue
+        resumes.append(resume if _is_readable(resume) else {"error": "Resume content is too short or unreadable."})
+
+    usable = [i for i, resume in enumerate(resumes) if "error" not in resume]
+    sem_rows = {}
+    if usable and jd_texts:
+        jd_embs = encode_job_descriptions(jd_texts)
+        resume_embs = np.array([resumes[i]["embedding"] for i in usable], dtype=np.float32)
+        sem_matrix = (util.pytorch_cos_sim(resume_embs, jd_embs) * 100).tolist()
+        sem_rows = dict(zip(usable, sem_matrix))
+    jd_keywords = [
+        _jd_keywords(jd_clean, chunks)
+        for jd_clean, chunks in zip(preprocess_many(jd_texts), extract_keywords_bulk(jd_texts))
+    ]
+
+    def score_cell(keywords, sections, sem):
+        try:
+            return _build_ats_result(keywords, sections, round(sem, 2))
+        except Exception as e:
+            return {"error": str(e)}
+
+    details = []
+    for i, resume in enumerate(resumes):
+        if "error" in resume:
+            details.append([{"error": resume["error"]} for _ in jd_texts])
+            continue
+        details.append([
+            score_cell(keywords, resume["sections"], sem)
+            for keywords, sem in zip(jd_keywords, sem_rows.get(i, []))
+        ])
+
+    scores = [[cell.get("Final ATS Score") for cell in row] for row in details]
+    best_resume = []
+    for j in range(len(jd_texts)):
+        column = [(scores[i][j], resume_paths[i]) for i in usable if scores[i][j] is not None]
+        best_resume.append(max(column)[1] if column else None)
+
+    return {
+        "resumes": resume_paths,
+        "scores": scores,
+        "details": details,
+        "best_resume": best_resume
+    }
+
+def iter_scored_jobs(jobs, resume_path="resume_templates/original/KARTHIK_RESUME.pdf", batch_size=32):
+    """
+    Score any iterable of jobs (e.g. a generator fed by the scrapers) in
+    batches of `batch_size`, yielding each job as soon as its batch is scored.
+    """
+    batch = []
+    for job in jobs:
+        batch.append(job)
+        if len(batch) >= batch_size:
+            yield from _score_job_batch(batch, resume_path)
+            batch = []
+    if batch:
+        yield from _score_job_batch(batch, resume_path)
+
+def _apply_score(job, score_result):
+    job["ats_score"] = score_result.get("Final ATS Score", 0)
+    job["Matched Keywords"] = score_result.get("Matched Keywords", [])
+    job["Missing Keywords"] = score_result.get("Missing Keywords", [])
+    return job
+
+def _score_job_batch(jobs, resume_path):
+    try:
+        score_results = compute_ats_scores([job.get("description", "") for job in jobs], resume_path)
+    except Exception as e:
+        # One bad description shouldn't cost the whole batch: score one by one
+        print(f"[ERROR] Failed to score {len(jobs)} jobs as a batch, scoring individually: {e}")
+        results = []
+        for job in jobs:
+            try:
+                results.append(_apply_score(job, compute_ats_score(job.get("description", ""), resume_path)))
+            except Exception as e:
+                print(f"[ERROR] Failed to score job '{job.get('title', 'N/A')}': {e}")
+        return results
+
+    return [_apply_score(job, score_result) for job, score_result in zip(jobs, score_results)]
+
+def score_jobs_against_resume(jobs, resume_path="resume_templates/original/KARTHIK_RESUME.pdf"):
+    return _score_job_batch(list(jobs), resume_path)
@@ -7,15 +7,18 @@ from pathlib import Path
 # Add the project root to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from llm_modules.ats_matcher import compute_ats_score
-from llm_modules.resume_parser import extract_text_from_pdf
+from llm_modules.ats_matcher import compute_ats_score, compute_ats_scores, ModelLoader
 
 def process_ats_request(input_data):
     try:
         # Extract job and resume data
         job_description = input_data.get("job_description", "")
+        job_descriptions = input_data.get("job_descriptions")
         resume_path = input_data.get("resume_path", "")
-        
+
+        if job_descriptions is not None:
+            return process_batch_request(job_descriptions, resume_path)
+
         if not job_description or not resume_path:
             return {"error": "Missing job description or resume path"}
             
@@ -30,7 +33,48 @@ def process_ats_request(input_data):
     except Exception as e:
         return {"error": str(e)}
 
+def process_batch_request(job_descriptions, resume_path):
+    if not resume_path:
+        return {"error": "Missing resume path"}
+
+    if not os.path.exists(resume_path):
+        return {"error": f"Resume file not found: {resume_path}"}
+
+    return {"results": compute_ats_scores(job_descriptions, resume_path)}
+
+def serve():
+    """
+    Long-lived worker mode used by llm_modules/ats_worker.py.
+
+    Loads the models once, then answers one JSON request per stdin line with
+    one JSON reply per stdout line until stdin is closed.
+    """
+    # Library code prints debug output; keep it off the protocol channel
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr
+
+    ModelLoader.get_keyword_nlp()
+    ModelLoader.get_model()
+    ModelLoader.get_stop_words()
+    protocol_out.write(json.dumps({"ready": True}) + "\n")
+    protocol_out.flush()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            result = process_ats_request(json.loads(line))
+        except ValueError as e:
+            result = {"error": f"Invalid request: {e}"}
+        protocol_out.write(json.dumps(result) + "\n")
+        protocol_out.flush()
+
 if __name__ == "__main__":
+    if "--serve" in sys.argv[1:]:
+        serve()
+        sys.exit(0)
+
     try:
         # Read input from stdin
         input_data = json.loads(sys.stdin.read())
@@ -0,0 +1,171 @@
+# llm_modules/ats_worker.py
+
+import os
+import json
+import queue
+import atexit
+import threading
+import subprocess
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RUNNER_PATH = str(PROJECT_ROOT / "llm_modules" / "ats_runner.py")
+
+# Interpreter used for the scoring workers. Scoring stays in its own process
+# (and optionally its own environment) to avoid dependency conflicts.
+ATS_PYTHON = os.getenv("ATS_PYTHON", "python")
+ATS_WORKER_COUNT = int(os.getenv("ATS_WORKER_COUNT", "2"))
+# Seconds to wait for the models to load, and for each reply
+ATS_STARTUP_TIMEOUT = float(os.getenv("ATS_STARTUP_TIMEOUT", "300"))
+ATS_REPLY_TIMEOUT = float(os.getenv("ATS_REPLY_TIMEOUT", "120"))
+
+
+class ATSWorkerError(RuntimeError):
+    """Raised when a scoring worker dies, hangs or returns an unreadable reply."""
+
+
+class ATSWorker:
+    """
+    A single long-lived `ats_runner.py --serve` process.
+
+    Requests and replies are exchanged as one JSON document per line over the
+    worker's stdin/stdout, so the models are loaded once per worker instead of
+    once per job.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._lines = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        self._proc = subprocess.Popen(
+            [ATS_PYTHON, RUNNER_PATH, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            cwd=str(PROJECT_ROOT)
+        )
+        # Replies are read on a helper thread so waiting for one can time out
+        self._lines = queue.Queue()
+        threading.Thread(target=self._read_lines, args=(self._proc.stdout, self._lines), daemon=True).start()
+
+        # The worker announces itself once ModelLoader has warmed up
+        ready = self._readline(ATS_STARTUP_TIMEOUT)
+        try:
+            handshake = json.loads(ready)
+        except ValueError:
+            handshake = None
+        if handshake != {"ready": True}:
+            self.close()
+            raise ATSWorkerError(f"Unexpected ATS worker handshake: {ready.strip()[:200]}")
+
+    @staticmethod
+    def _read_lines(stream, lines):
+        for line in stream:
+            lines.put(line)
+        # End of output: the worker exited
+        lines.put("")
+
+    def _readline(self, timeout):
+        try:
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            # A hung worker won't exit on its own when stdin closes
+            self._proc.kill()
+            self.close()
+            raise ATSWorkerError(f"ATS worker did not answer within {timeout:.0f}s")
+        if not line:
+            self.close()
+            raise ATSWorkerError("ATS worker exited unexpectedly")
+        return line
+
+    def request(self, payload):
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            try:
+                self._proc.stdin.write(json.dumps(payload) + "\n")
+                self._proc.stdin.flush()
+            except OSError as e:
+                self.close()
+                raise ATSWorkerError(f"ATS worker pipe failed: {e}")
+
+            line = self._readline(ATS_REPLY_TIMEOUT)
+            try:
+                return json.loads(line)
+            except ValueError as e:
+                # Protocol is out of sync; the next request gets a fresh worker
+                self.close()
+                raise ATSWorkerError(f"Invalid reply from ATS worker: {e}")
+
+    def close(self):
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except Exception:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+
+class ATSWorkerPool:
+    """Fixed-size pool of ATS workers; each request is served by the next idle worker."""
+
+    def __init__(self, size=ATS_WORKER_COUNT):
+        self._workers = [ATSWorker() for _ in range(max(1, size))]
+        self._idle = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def score(self, job_description, resume_path):
+        worker = self._idle.get()
+        try:
+            return worker.request({
+                "job_description": job_description,
+                "resume_path": resume_path
+            })
+        finally:
+            self._idle.put(worker)
+
+    def score_batch(self, job_descriptions, resume_path):
+        """Score many JDs in one round trip; the worker batches the embeddings."""
+        worker = self._idle.get()
+        try:
+            reply = worker.request({
+                "job_descriptions": list(job_descriptions),
+                "resume_path": resume_path
+            })
+        finally:
+            self._idle.put(worker)
+        if "error" in reply:
+            raise ATSWorkerError(reply["error"])
+        return reply["results"]
+
+    def close(self):
+        for worker in self._workers:
+            worker.close()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ATSWorkerPool()
+        return _pool
+
+
+@atexit.register
+def shutdown_worker_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
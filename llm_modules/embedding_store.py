@@ -0,0 +1,143 @@
+# llm_modules/embedding_store.py
+
+import os
+import re
+import json
+import numpy as np
+from utils.disk_cache import cache_dir, sha256_text, FileLock
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+
+
+def normalize_text(text):
+    # all-MiniLM-L6-v2 is uncased and whitespace-insensitive, so these variants share a vector
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+class EmbeddingStore:
+    """
+    Persistent text -> embedding store.
+
+    Vectors live in one append-only float32 file that is memory-mapped for
+    reads; `index.json` maps each normalized-text hash to its row. Several
+    processes (e.g. ATS workers) can share a store: appends are serialized
+    with a lock file and readers pick up new rows when the index changes.
+    """
+
+    def __init__(self, namespace="jd_embeddings", model_name=EMBEDDING_MODEL, dim=EMBEDDING_DIM):
+        self.root = cache_dir(os.path.join(namespace, model_name))
+        self.dim = dim
+        self.vectors_path = os.path.join(self.root, "vectors.f32")
+        self.index_path = os.path.join(self.root, "index.json")
+        self.lock_path = os.path.join(self.root, "store.lock")
+        self._index = {}
+        self._index_error = None
+        self._vectors = None
+        self._index_mtime = None
+        self._reload()
+
+    @staticmethod
+    def key(text):
+        return sha256_text(normalize_text(text))
+
+    def _reload(self):
+        try:
+            self._index_mtime = os.path.getmtime(self.index_path)
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+            self._index_error = None
+        except (OSError, ValueError) as e:
+            self._index_mtime = None
+            self._index = {}
+            self._index_error = e
+
+        rows = os.path.getsize(self.vectors_path) // (4 * self.dim) if os.path.exists(self.vectors_path) else 0
+        self._vectors = None
+        if rows:
+            self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim))
+
+    def _index_changed(self):
+        try:
+            return os.path.getmtime(self.index_path) != self._index_mtime
+        except OSError:
+            return False
+
+    def __len__(self):
+        return len(self._index)
+
+    def get_many(self, texts):
+        """Return {position: vector} for every text already in the store."""
+        keys = [self.key(text) for text in texts]
+        if any(key not in self._index for key in keys) and self._index_changed():
+            self._reload()
+
+        found = {}
+        for i, key in enumerate(keys):
+            row = self._index.get(key)
+            if row is not None and self._vectors is not None and row < len(self._vectors):
+                found[i] = self._vectors[row]
+        return found
+
+    def put_many(self, texts, vectors):
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        with FileLock(self.lock_path):
+            # Pick up rows appended by other processes before assigning new ones
+            self._reload()
+            if self._index_error is not None:
+                self._reset_if_index_lost()
+            self._vectors = None
+
+            new_rows = {}
+            for text, vector in zip(texts, vectors):
+                key = self.key(text)
+                if key not in self._index and key not in new_rows:
+                    new_rows[key] = vector
+            if not new_rows:
+                return
+
+            # Row numbers follow the file, not the index, so a crash between the
+            # two writes only leaves unreferenced rows behind
+            next_row = os.path.getsize(self.vectors_path) // (4 * self.dim) if os.path.exists(self.vectors_path) else 0
+            with open(self.vectors_path, "ab") as f:
+                for key, vector in new_rows.items():
+                    f.write(vector.tobytes())
+                    self._index[key] = next_row
+                    next_row += 1
+
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, self.index_path)
+            self._reload()
+
+    def _reset_if_index_lost(self):
+        """
+        Called under the lock when index.json could not be read. A transient
+        read error must not let put_many overwrite the index, while a missing
+        or corrupt index makes every stored row unreachable: those rows are
+        dropped instead of growing the file behind a fresh index.
+        """
+        error = self._index_error
+        if isinstance(error, OSError) and not isinstance(error, FileNotFoundError):
+            raise error
+        if self._vectors is None:
+            return
+        print(f"[EmbeddingStore] {self.index_path} is missing or corrupt ({error}); "
+              f"dropping {len(self._vectors)} unreachable vectors.")
+        # A new file instead of truncating in place: other processes may still
+        # have the old one memory-mapped
+        tmp_path = f"{self.vectors_path}.{os.getpid()}.tmp"
+        open(tmp_path, "wb").close()
+        os.replace(tmp_path, self.vectors_path)
+        self._vectors = None
+
+
+_store = None
+
+
+def get_embedding_store():
+    global _store
+    if _store is None:
+        _store = EmbeddingStore()
+    return _store
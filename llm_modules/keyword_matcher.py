@@ -0,0 +1,53 @@
+# llm_modules/keyword_matcher.py
+
+import re
+from functools import lru_cache
+from llm_modules.text_preprocessing import tokenize_terms
+
+COMPOUND_SEPARATORS = re.compile(r"[./\-]")
+
+
+class KeywordMatcher:
+    """
+    Whole-term index over a resume, built once and reused for every JD.
+
+    Single-word keywords are set lookups and multi-word keywords are looked up
+    in an n-gram set of the matching length, so classifying a JD is linear in
+    its keyword count and "java" no longer matches inside "javascript".
+    """
+
+    def __init__(self, text):
+        self.tokens = tokenize_terms(text)
+        vocabulary = set(self.tokens)
+        for token in self.tokens:
+            if COMPOUND_SEPARATORS.search(token):
+                # "python/django" also counts as "python" and "django";
+                # "node.js" also as "nodejs", the form preprocess() produces
+                parts = [part for part in COMPOUND_SEPARATORS.split(token) if part]
+                vocabulary.update(parts)
+                vocabulary.add("".join(parts))
+        self._ngrams = {1: vocabulary}
+
+    def _ngrams_of(self, n):
+        if n not in self._ngrams:
+            self._ngrams[n] = set(zip(*(self.tokens[i:] for i in range(n))))
+        return self._ngrams[n]
+
+    def contains(self, keyword):
+        terms = tokenize_terms(keyword)
+        if not terms:
+            return False
+        if len(terms) == 1:
+            return terms[0] in self._ngrams[1]
+        return tuple(terms) in self._ngrams_of(len(terms))
+
+    def classify(self, keywords):
+        matched, missing = [], []
+        for keyword in keywords:
+            (matched if self.contains(keyword) else missing).append(keyword)
+        return matched, missing
+
+
+@lru_cache(maxsize=16)
+def get_keyword_matcher(text):
+    return KeywordMatcher(text)
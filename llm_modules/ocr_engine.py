@@ -0,0 +1,159 @@
+# llm_modules/ocr_engine.py
+
+import io
+import os
+import math
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from PIL import Image
+import pytesseract
+from utils.disk_cache import JsonDiskCache, sha256_bytes
+
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", os.cpu_count() or 1))
+# v2: pre-filter rejections are no longer cached
+OCR_CACHE_VERSION = 2
+# Times a batch is resubmitted after a worker died and broke the pool
+OCR_POOL_RETRIES = 1
+
+# Images below these limits are icons, bullets or rules rather than text
+MIN_OCR_WIDTH = 32
+MIN_OCR_HEIGHT = 12
+MIN_OCR_PIXELS = 64 * 64
+# Grayscale histogram entropy (bits). Blank or single-colour images sit at ~0,
+# while even one short line of text on a white banner scores above 0.1
+MIN_OCR_ENTROPY = 0.02
+
+_ocr_cache = JsonDiskCache("ocr")
+_pool = None
+
+
+def image_entropy(img):
+    histogram = img.convert("L").histogram()
+    total = float(sum(histogram))
+    if not total:
+        return 0.0
+    return -sum((count / total) * math.log2(count / total) for count in histogram if count)
+
+
+def is_worth_ocr(img_bytes):
+    """Cheap pre-filter: skip images too small or too uniform to contain text."""
+    try:
+        img = Image.open(io.BytesIO(img_bytes))
+        width, height = img.size
+        if width < MIN_OCR_WIDTH or height < MIN_OCR_HEIGHT or width * height < MIN_OCR_PIXELS:
+            return False
+        return image_entropy(img) >= MIN_OCR_ENTROPY
+    except Exception as e:
+        print(f"[WARN] Could not inspect image for OCR: {e}")
+        return False
+
+
+def _init_ocr_worker(tesseract_cmd):
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+
+def _ocr_one(img_bytes):
+    return pytesseract.image_to_string(Image.open(io.BytesIO(img_bytes)))
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=OCR_WORKERS,
+            initializer=_init_ocr_worker,
+            initargs=(pytesseract.pytesseract.tesseract_cmd,)
+        )
+    return _pool
+
+
+def _drop_pool(pool):
+    """Discard a broken pool; the next _get_pool() starts a fresh one."""
+    global _pool
+    if _pool is pool:
+        _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _ocr_in_pool(payloads):
+    results = {}
+    failed = set()
+    for _ in range(OCR_POOL_RETRIES + 1):
+        todo = {key: img_bytes for key, img_bytes in payloads.items() if key not in results and key not in failed}
+        if not todo:
+            break
+        pool = _get_pool()
+        broken = False
+        try:
+            futures = {key: pool.submit(_ocr_one, img_bytes) for key, img_bytes in todo.items()}
+        except BrokenProcessPool:
+            futures, broken = {}, True
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except BrokenProcessPool:
+                broken = True
+            except Exception as e:
+                print(f"[WARN] OCR failed for one image: {e}")
+                failed.add(key)
+        if not broken:
+            break
+        print("[WARN] An OCR worker died; restarting the pool")
+        _drop_pool(pool)
+    return results
+
+
+@atexit.register
+def shutdown_ocr_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def ocr_images(image_bytes_list, prefilter=True):
+    """
+    OCR a batch of images and return one text per image, in input order.
+
+    Results are cached by image content hash, so logos and icons repeated
+    across resumes are only looked at once. Images rejected by the pre-filter
+    and failed OCR calls yield "" (only successful OCR results are cached).
+    Uncached images are spread over a process pool sized to the machine.
+    """
+    texts = [""] * len(image_bytes_list)
+    pending = {}
+    payloads = {}
+
+    for i, img_bytes in enumerate(image_bytes_list):
+        key = f"v{OCR_CACHE_VERSION}:{sha256_bytes(img_bytes)}"
+        if key in pending:
+            pending[key].append(i)
+            continue
+        cached = _ocr_cache.get(key)
+        if cached is not None:
+            texts[i] = cached
+            continue
+        if prefilter and not is_worth_ocr(img_bytes):
+            continue
+        pending[key] = [i]
+        payloads[key] = img_bytes
+
+    if not pending:
+        return texts
+
+    if len(pending) == 1 or OCR_WORKERS <= 1:
+        results = {}
+        for key, img_bytes in payloads.items():
+            try:
+                results[key] = _ocr_one(img_bytes)
+            except Exception as e:
+                print(f"[WARN] OCR failed for one image: {e}")
+    else:
+        results = _ocr_in_pool(payloads)
+
+    for key, text in results.items():
+        _ocr_cache.set(key, text)
+        for i in pending[key]:
+            texts[i] = text
+    return texts
@@ -2,11 +2,10 @@
 
 import fitz  # PyMuPDF
 import docx
-import re
-import io
 import zipfile
-from PIL import Image
 import pytesseract
+from llm_modules.ocr_engine import ocr_images
+from llm_modules.text_preprocessing import tokenize_terms
 
 # Windows path to Tesseract
 pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
@@ -14,18 +13,24 @@ pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tessera
 def extract_text_from_pdf(pdf_path):
     try:
         doc = fitz.open(pdf_path)
-        full_text = ""
+        page_texts = []
+        scanned_pages = []
 
         for page_num in range(len(doc)):
             page = doc.load_page(page_num)
             text = page.get_text()
-            if text.strip():
-                full_text += text
-            else:
+            page_texts.append(text)
+            if not text.strip():
                 pix = page.get_pixmap(dpi=300)
-                img = Image.open(io.BytesIO(pix.tobytes("png")))
-                ocr_text = pytesseract.image_to_string(img)
-                full_text += ocr_text
+                scanned_pages.append((page_num, pix.tobytes("png")))
+
+        # OCR all scanned pages in one parallel batch
+        if scanned_pages:
+            ocr_texts = ocr_images([png for _, png in scanned_pages], prefilter=False)
+            for (page_num, _), ocr_text in zip(scanned_pages, ocr_texts):
+                page_texts[page_num] = ocr_text
+
+        full_text = "".join(page_texts)
 
         print(f"[DEBUG] Extracted {len(full_text)} characters from PDF.")
         return full_text
@@ -69,20 +74,12 @@ def extract_images_from_docx(docx_path):
     return images
 
 def ocr_text_from_images(image_bytes_list):
-    texts = []
-    for img_bytes in image_bytes_list:
-        try:
-            img = Image.open(io.BytesIO(img_bytes))
-            text = pytesseract.image_to_string(img)
-            if text.strip():
-                texts.append(text)
-        except Exception as e:
-            print(f"[WARN] OCR failed for one image: {e}")
-    return "\n".join(texts)
+    texts = ocr_images(image_bytes_list)
+    return "\n".join(text for text in texts if text.strip())
 
 def clean_and_tokenize(text):
-    text = text.lower()
-    words = re.findall(r"\b[a-zA-Z][a-zA-Z0-9\-\+\.]{1,}\b", text)
+    # Same tokenizer as ATS keyword matching; skills start with a letter
+    words = [term for term in tokenize_terms(text) if len(term) > 1 and term[0].isalpha()]
     return list(set(words))  # Deduplicated skills
 
 def extract_skills_from_resume(file_path):
@@ -6,13 +6,20 @@ import json
 from openai import OpenAI
 from dotenv import load_dotenv
 from docx import Document
-from docx2pdf import convert
 from llm_modules.resume_parser import extract_text_from_pdf, extract_text_from_docx
 
 load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 ATS_API_URL = os.getenv("ATS_API_URL", "http://localhost:9000/score")
 
+_client = None
+
+def get_client():
+    """OpenAI client, created on first use rather than at import time."""
+    global _client
+    if _client is None:
+        _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
+
 def tailor_resume(base_resume_path, job, output_path):
     if base_resume_path.endswith(".pdf"):
         base_resume = extract_text_from_pdf(base_resume_path)
@@ -38,7 +45,7 @@ Focus on integrating relevant skills, tools, and keywords from the JD while pres
 --- TAILORED RESUME ---
 """
 
-    response = client.chat.completions.create(
+    response = get_client().chat.completions.create(
         model="gpt-4",
         messages=[
             {"role": "system", "content": "You are an expert resume editor."},
@@ -64,6 +71,7 @@ Focus on integrating relevant skills, tools, and keywords from the JD while pres
     doc.save(docx_path)
 
     try:
+        from docx2pdf import convert
         convert(docx_path, pdf_path)
         print(f"PDF saved to: {pdf_path}")
     except Exception as e:
@@ -0,0 +1,51 @@
+# llm_modules/text_preprocessing.py
+
+import re
+import string
+
+# NLTK's English stopword list (nltk 3.8.1), embedded so nothing has to be
+# downloaded at import time. "cannot" is added because word_tokenize splits it
+# into "can" + "not", both of which are stopwords.
+ENGLISH_STOP_WORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours
+yourself yourselves he him his himself she she's her hers herself it it's its
+itself they them their theirs themselves what which who whom this that that'll
+these those am is are was were be been being have has had having do does did
+doing a an the and but if or because as until while of at by for with about
+against between into through during before after above below to from up down
+in out on off over under again further then once here there when where why how
+all any both each few more most other some such no nor not only own same so
+than too very s t can will just don don't should should've now d ll m o re ve
+y ain aren aren't couldn couldn't didn didn't doesn doesn't hadn hadn't hasn
+hasn't haven haven't isn isn't ma mightn mightn't mustn mustn't needn needn't
+shan shan't shouldn shouldn't wasn wasn't weren weren't won won't wouldn
+wouldn't cannot
+""".split())
+
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+# Once ASCII punctuation is gone, word_tokenize reduces to word runs plus any
+# leftover (non-ASCII) symbol runs
+_WORD_PATTERN = re.compile(r"\w+|[^\w\s]+")
+
+# Terms keep the characters that matter in skill names: c++, c#, node.js, ci/cd
+TERM_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./\-][a-z0-9+#]+)*")
+
+
+def preprocess(text):
+    """Lowercase, strip punctuation, tokenize and drop stopwords; returns a space-joined string."""
+    tokens = _WORD_PATTERN.findall(text.lower().translate(_PUNCTUATION_TABLE))
+    return ' '.join([word for word in tokens if word not in ENGLISH_STOP_WORDS])
+
+
+def preprocess_many(texts):
+    """preprocess() over a batch of texts; repeated texts are only processed once."""
+    done = {}
+    for text in texts:
+        if text not in done:
+            done[text] = preprocess(text)
+    return [done[text] for text in texts]
+
+
+def tokenize_terms(text):
+    """Lowercased skill-style terms, in order, punctuation inside terms preserved."""
+    return TERM_PATTERN.findall(text.lower())
@@ -1,8 +1,8 @@
 import os
+import asyncio
 import argparse
 import threading
 import time
-import subprocess
 from datetime import datetime
 import logging
 from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File, Form
@@ -13,25 +13,31 @@ from fastapi.middleware.wsgi import WSGIMiddleware
 import json
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
-import psycopg2
-from application_engine.db_config import DB_CONFIG
 
-from scrapers.universal_scraper import fetch_all_jobs
-from llm_modules import resume_matcher
-from llm_modules.resume_tailor import tailor_resume
-from application_engine import form_filler
+from scrapers.universal_scraper import fetch_all_jobs, iter_new_jobs_async
+from scrapers.postings_index import requeue_postings
+from scrapers.enrichment import iter_enriched_async
+from scrapers.dedup import Deduplicator, dedup_jobs, iter_unique_listings_async, iter_unique_descriptions_async
+from scrapers.async_fetcher import AsyncFetcher, run_sync
+from scrapers.streams import batched, map_unordered, filter_batched
+from llm_modules.ats_worker import get_worker_pool, ATSWorkerError, ATS_WORKER_COUNT
 from application_engine.job_status_service import (
     init_db,
     has_applied,
-    has_failed_before,
+    filter_unapplied,
     export_successful_to_csv,
     get_success_count,
     send_csv_attachment,
-    log_and_notify
+    log_and_notify,
+    STATUS_BATCH_SIZE,
+    STATUS_BATCH_WAIT
 )
+from application_engine.db_pool import run_db
 from backend.api.role_inference_router import router as role_router
-from gradio_app import create_gradio_ui
-from gradio.routes import mount_gradio_app
+from backend.lazy_gradio import LazyGradioApp
+
+# Heavy subsystems (OpenAI clients, resume parsing/OCR, Playwright, Gradio) are
+# imported on first use so the API binds quickly; see tests/test_startup_time.py
 
 # Configure logging
 logging.basicConfig(
@@ -57,8 +63,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="frontend/build/static"), name="static")
+# Mount static files (absent until the React frontend has been built)
+if os.path.isdir("frontend/build/static"):
+    app.mount("/static", StaticFiles(directory="frontend/build/static"), name="static")
+
+# Mount Gradio UI inside FastAPI; it is built on the first request to /gradio.
+# Mounted before the SPA catch-all route, which would otherwise answer /gradio/*
+def build_gradio_ui():
+    from gradio_app import create_gradio_ui
+    return create_gradio_ui()
+
+gradio_ui = LazyGradioApp(build_gradio_ui)
+app.mount("/gradio", gradio_ui)
+app.router.add_event_handler("shutdown", gradio_ui.aclose)
 
 # Health check endpoint
 @app.get("/health")
@@ -91,105 +108,181 @@ class ATSScoreResponse(BaseModel):
     feedback: str
 
 def run_ats_scorer(job_description: str, resume_path: str) -> Dict[str, Any]:
-    """Run ATS scoring in a separate process to avoid dependency conflicts"""
+    """Score through the persistent ATS worker pool (separate processes to avoid dependency conflicts)"""
     try:
-        input_data = {
-            "job_description": job_description,
-            "resume_path": resume_path
-        }
-        
-        result = subprocess.run(
-            ['python', 'llm_modules/ats_runner.py'],
-            input=json.dumps(input_data),
-            text=True,
-            capture_output=True,
-            check=True
-        )
-        
-        return json.loads(result.stdout)
-    except subprocess.CalledProcessError as e:
-        print(f"ATS scoring failed: {e.stderr}")
+        return get_worker_pool().score(job_description, resume_path)
+    except ATSWorkerError as e:
+        print(f"ATS scoring failed: {e}")
         raise HTTPException(status_code=500, detail="ATS scoring failed")
     except Exception as e:
         print(f"Error in ATS scoring: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-def run_job_cycle(test_mode=False):
-    print("AI Job Applier Bot Started:", datetime.now())
-    init_db()
-
-    jobs = fetch_all_jobs()
-    print(f"Found {len(jobs)} jobs.")
+def ats_result_fields(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an ats_matcher result ("Final ATS Score", "Matched Keywords", ...) to the API's fields"""
+    if "error" in result:
+        raise ValueError(result["error"])
+    return {
+        "score": result["Final ATS Score"],
+        "matched_skills": result["Matched Keywords"],
+        "missing_skills": result["Missing Keywords"],
+        "feedback": result["Suggestions"]
+    }
 
-    matched_jobs = []
-    for job in jobs:
+def run_ats_scorer_batch(job_descriptions: List[str], resume_path: str) -> List[Dict[str, Any]]:
+    """Score a whole batch of jobs in one worker round trip (JD embeddings are batched)"""
+    return get_worker_pool().score_batch(job_descriptions, resume_path)
+
+SCORE_BATCH_SIZE = int(os.getenv("SCORE_BATCH_SIZE", "16"))
+SCORE_BATCH_WAIT = float(os.getenv("SCORE_BATCH_WAIT", "2.0"))
+MATCHED_JOBS_PATH = "matched_jobs/matched_jobs.json"
+# matched_jobs.json is rewritten in batches during a cycle, not once per match
+MATCHED_JOBS_SAVE_EVERY = int(os.getenv("MATCHED_JOBS_SAVE_EVERY", "20"))
+MATCHED_JOBS_SAVE_INTERVAL = float(os.getenv("MATCHED_JOBS_SAVE_INTERVAL", "30"))
+
+def save_matched_jobs(jobs):
+    """Rewrite matched_jobs.json atomically so the API never reads a half-written file"""
+    os.makedirs(os.path.dirname(MATCHED_JOBS_PATH), exist_ok=True)
+    tmp_path = MATCHED_JOBS_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(jobs, f)
+    os.replace(tmp_path, MATCHED_JOBS_PATH)
+
+async def iter_scored_jobs_async(jobs, resume_path, retry_urls):
+    """
+    Score postings as they stream in: small batches (flushed after
+    SCORE_BATCH_WAIT seconds) go to the ATS worker pool, one per worker.
+    """
+    # Each batch blocks a default-executor thread until a worker is free, so
+    # only as many as there are workers may wait, leaving threads for the
+    # tailoring, save and apply steps downstream
+    workers = asyncio.Semaphore(ATS_WORKER_COUNT)
+
+    async def score(batch):
         try:
-            # Score each job using the separate ATS process
-            score_result = run_ats_scorer(job["description"], os.getenv("RESUME_PATH"))
-            job.update({
-                "match_score": score_result["score"],
-                "matched_skills": score_result["matched_skills"],
-                "missing_skills": score_result["missing_skills"],
-                "ats_feedback": score_result["feedback"]
-            })
-            matched_jobs.append(job)
+            async with workers:
+                results = await asyncio.to_thread(run_ats_scorer_batch, [job["description"] for job in batch], resume_path)
         except Exception as e:
-            print(f"Failed to score job {job.get('title', 'Unknown')}: {e}")
-            continue
+            print(f"Batch ATS scoring failed: {e}")
+            results = []
+
+        scored = []
+        for job, score_result in zip(batch, results):
+            try:
+                fields = ats_result_fields(score_result)
+                job.update({
+                    "match_score": fields["score"],
+                    "matched_skills": fields["matched_skills"],
+                    "missing_skills": fields["missing_skills"],
+                    "ats_feedback": fields["feedback"]
+                })
+                scored.append(job)
+            except Exception as e:
+                print(f"Failed to score job {job.get('title', 'Unknown')}: {e}")
+                retry_urls.append(job["url"])
+        retry_urls.extend(job["url"] for job in batch[len(results):])
+        return scored
+
+    async for scored in map_unordered(batched(jobs, SCORE_BATCH_SIZE, SCORE_BATCH_WAIT), score):
+        for job in scored:
+            yield job
+
+async def run_job_cycle_async(test_mode=False):
+    """
+    Streaming job cycle: postings flow scrape -> enrich -> score -> tailor as
+    they arrive, and each match is written to matched_jobs.json and handed to
+    the apply worker right away, while slower boards are still downloading.
+    """
+    from llm_modules import resume_matcher
+    from application_engine import form_filler
 
-    print(f"Scored {len(matched_jobs)} jobs.")
+    print("AI Job Applier Bot Started:", datetime.now())
+    await run_db(init_db)
 
+    stats = {"applied": 0, "skipped": 0, "failed": 0, "scored": 0}
+    # Postings that didn't reach a final outcome are re-emitted next cycle
+    retry_urls = []
     filtered_jobs = []
-    applied, skipped, failed = 0, 0, 0
-
-    for job in matched_jobs:
-        if has_applied(job["url"]):
-            print(f"Skipping {job['title']} (already applied)")
-            skipped += 1
-            continue
-        if has_failed_before(job["url"]):
-            print(f"Skipping {job['title']} (failed too many times)")
-            skipped += 1
-            continue
-        if job.get("match_score", 0) < 50:
-            print(f"Skipping {job['title']} (low ATS score: {job['match_score']}%)")
-            skipped += 1
-            continue
+    saved = {"count": 0, "at": time.monotonic()}
+    apply_queue = asyncio.Queue()
+
+    async def apply_worker():
+        # One application at a time; the browser automation is blocking
+        while True:
+            job = await apply_queue.get()
+            if job is None:
+                return
+            try:
+                await asyncio.to_thread(form_filler.apply_to_job, job)
+                await run_db(log_and_notify, job, resume_path="resume_templates/output", status="success")
+                stats["applied"] += 1
+            except Exception as e:
+                print(f"Apply failed for {job['title']}: {e}")
+                await run_db(log_and_notify, job, resume_path="resume_templates/output", status="failed")
+                retry_urls.append(job["url"])
+                stats["failed"] += 1
+
+    applier = asyncio.create_task(apply_worker())
+    try:
+        async with AsyncFetcher() as fetcher:
+            # Only postings that are new or changed since the last cycle, one
+            # copy per job and not applied to yet (checked in bulk); ones
+            # failing the cheap filters are dropped before fetching
+            # descriptions, re-posts are collapsed before scoring
+            deduper = Deduplicator()
+            jobs = iter_unique_listings_async(iter_new_jobs_async(fetcher), deduper)
+            jobs = filter_batched(jobs, lambda batch: run_db(filter_unapplied, batch),
+                                  STATUS_BATCH_SIZE, STATUS_BATCH_WAIT, stats)
+            # Postings whose description could not be fetched are retried next cycle
+            jobs = iter_enriched_async(jobs, fetcher, failed_urls=retry_urls)
+            jobs = iter_unique_descriptions_async(jobs, deduper)
+            async for job in iter_scored_jobs_async(jobs, os.getenv("RESUME_PATH"), retry_urls):
+                stats["scored"] += 1
+                if job.get("match_score", 0) < 50:
+                    print(f"Skipping {job['title']} (low ATS score: {job['match_score']}%)")
+                    stats["skipped"] += 1
+                    continue
 
-        try:
-            # Use resume_matcher for custom resume generation
-            resume_matcher.generate_custom_resume(job)
-            filtered_jobs.append(job)
-        except Exception as e:
-            print(f"Failed to tailor resume for {job['title']}: {e}")
-            failed += 1
+                try:
+                    # Use resume_matcher for custom resume generation
+                    await asyncio.to_thread(resume_matcher.generate_custom_resume, job)
+                except Exception as e:
+                    print(f"Failed to tailor resume for {job['title']}: {e}")
+                    retry_urls.append(job["url"])
+                    stats["failed"] += 1
+                    continue
 
-    # Save filtered jobs to file for API access
-    os.makedirs("matched_jobs", exist_ok=True)
-    with open("matched_jobs/matched_jobs.json", "w") as f:
-        json.dump(filtered_jobs, f)
+                filtered_jobs.append(job)
+                # Save matched jobs as they come in for API access, a batch at a time
+                unsaved = len(filtered_jobs) - saved["count"]
+                if unsaved >= MATCHED_JOBS_SAVE_EVERY or time.monotonic() - saved["at"] >= MATCHED_JOBS_SAVE_INTERVAL:
+                    await asyncio.to_thread(save_matched_jobs, list(filtered_jobs))
+                    saved.update(count=len(filtered_jobs), at=time.monotonic())
+                print(f"Queued application: {job['title']} at {job.get('company')}")
+                await apply_queue.put(job)
+    finally:
+        await apply_queue.put(None)
+        await applier
 
-    print("Step 4: Submitting applications...")
-    for job in filtered_jobs:
-        try:
-            form_filler.apply_to_job(job)
-            log_and_notify(job, resume_path="resume_templates/output", status="success")
-            applied += 1
-        except Exception as e:
-            print(f"Apply failed for {job['title']}: {e}")
-            log_and_notify(job, resume_path="resume_templates/output", status="failed")
-            failed += 1
+    print(f"Scored {stats['scored']} jobs.")
+    await asyncio.to_thread(save_matched_jobs, filtered_jobs)
+
+    if retry_urls:
+        await asyncio.to_thread(requeue_postings, retry_urls)
 
-    export_successful_to_csv()
+    await run_db(export_successful_to_csv)
 
-    success_count = get_success_count()
+    success_count = await run_db(get_success_count)
     if success_count > 0 and success_count % 50 == 0:
         send_csv_attachment("successful_applications.csv")
 
     print(f"Job Cycle Completed: {datetime.now()}")
-    print(f"Stats: Applied={applied}, Skipped={skipped}, Failed={failed}")
+    print(f"Stats: Applied={stats['applied']}, Skipped={stats['skipped']}, Failed={stats['failed']}")
     print("-" * 50)
 
+def run_job_cycle(test_mode=False):
+    run_sync(run_job_cycle_async(test_mode))
+
 def input_listener():
     global stop_signal
     while True:
@@ -217,29 +310,31 @@ async def get_matched_jobs():
             pass
 
         # If no cached jobs or empty, fetch new ones
-        jobs = fetch_all_jobs()
+        jobs = dedup_jobs(fetch_all_jobs())
         logger.info(f"Fetched {len(jobs)} new jobs")
-        
+
+        # One bulk status query drops jobs already applied to or failed too often
+        jobs = await run_db(filter_unapplied, jobs)
+
         # Score and filter jobs
         matched_jobs = []
         for job in jobs:
-            if not has_applied(job["url"]) and not has_failed_before(job["url"]):
-                try:
-                    score_result = run_ats_scorer(job["description"], os.getenv("RESUME_PATH"))
-                    job_data = {
-                        "title": job.get("title", "Unknown Title"),
-                        "company": job.get("company", "Unknown Company"),
-                        "location": job.get("location", "Remote"),
-                        "url": job.get("url", "#"),
-                        "description": job.get("description", "No description available"),
-                        "matched_skills": score_result.get("matched_skills", []),
-                        "match_score": score_result.get("score", 0),
-                        "status": "pending"
-                    }
-                    matched_jobs.append(job_data)
-                except Exception as e:
-                    logger.error(f"Failed to process job {job.get('title', 'Unknown')}: {e}")
-                    continue
+            try:
+                score_result = ats_result_fields(run_ats_scorer(job["description"], os.getenv("RESUME_PATH")))
+                job_data = {
+                    "title": job.get("title", "Unknown Title"),
+                    "company": job.get("company", "Unknown Company"),
+                    "location": job.get("location", "Remote"),
+                    "url": job.get("url", "#"),
+                    "description": job.get("description", "No description available"),
+                    "matched_skills": score_result.get("matched_skills", []),
+                    "match_score": score_result["score"],
+                    "status": "pending"
+                }
+                matched_jobs.append(job_data)
+            except Exception as e:
+                logger.error(f"Failed to process job {job.get('title', 'Unknown')}: {e}")
+                continue
         
         # Cache the results
         os.makedirs("matched_jobs", exist_ok=True)
@@ -267,7 +362,7 @@ async def apply_to_job(job_id: str, background_tasks: BackgroundTasks):
             raise HTTPException(status_code=404, detail="Job not found")
             
         # Check if already applied
-        if has_applied(job["url"]):
+        if await run_db(has_applied, job["url"]):
             logger.warning(f"Already applied to job: {job_id}")
             raise HTTPException(status_code=400, detail="Already applied to this job")
             
@@ -327,20 +422,23 @@ async def serve_spa_paths(full_path: str):
 async def score_resume(request: ATSScoreRequest):
     try:
         result = run_ats_scorer(request.job_description, request.resume_path)
-        return ATSScoreResponse(**result)
+        return ATSScoreResponse(**ats_result_fields(result))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 async def process_job_application(job: Dict[str, Any]):
     try:
+        from llm_modules.resume_tailor import tailor_resume
+        from application_engine import form_filler
+
         # Tailor resume
         tailor_resume(os.getenv("RESUME_PATH"), job, output_path="resume_templates/output")
         
         # Submit application
         form_filler.apply_to_job(job)
-        log_and_notify(job, resume_path="resume_templates/output", status="success")
+        await run_db(log_and_notify, job, resume_path="resume_templates/output", status="success")
     except Exception as e:
-        log_and_notify(job, resume_path="resume_templates/output", status="failed")
+        await run_db(log_and_notify, job, resume_path="resume_templates/output", status="failed")
         print(f"Failed to process application: {str(e)}")
 
 # Include routers
@@ -361,10 +459,6 @@ async def root():
         }
     }
 
-# Mount Gradio UI inside FastAPI using v4.x method
-gradio_ui = create_gradio_ui()
-app = mount_gradio_app(app, gradio_ui, path="/gradio")
-
 if __name__ == "__main__":
     logger.info("Starting AI Job Application Service")
     print("Type 'exit' or 'stop' to end the bot at any time.")
@@ -2,6 +2,7 @@ import os
 from llm_modules.role_inference import infer_job_roles_from_resume
 from scrapers.company_discovery import discover_career_urls_from_roles
 from scrapers.dynamic_scraper import dynamic_scrape_jobs as fetch_jobs_from_company_urls
+from scrapers.dedup import dedup_jobs
 from llm_modules.resume_tailor import score_and_filter_jobs, apply_to_jobs
 
 def main_pipeline():
@@ -21,7 +22,7 @@ def main_pipeline():
 
     # Step 4: Scrape job listings
     print("\nScraping job listings from career pages...")
-    jobs = fetch_jobs_from_company_urls(career_results)
+    jobs = dedup_jobs(fetch_jobs_from_company_urls(career_results))
     print(f"Found {len(jobs)} jobs from {len(career_urls)} companies.")
 
     # Step 5: Score & Filter by ATS
@@ -0,0 +1,284 @@
+# scrapers/async_fetcher.py
+
+import os
+import time
+import asyncio
+import threading
+from urllib.parse import urlparse
+
+import httpx
+from scrapers.http_cache import HttpCache
+from scrapers.rate_limit import AdaptiveTokenBucket, backoff_delay, retry_after_seconds
+from scrapers.circuit_breaker import CircuitBreaker, CircuitOpenError
+from scrapers.replay import transport_from_env
+from utils.disk_cache import JsonDiskCache
+
+HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+
+MAX_CONCURRENCY = int(os.getenv("SCRAPER_MAX_CONCURRENCY", "32"))
+PER_HOST_CONCURRENCY = int(os.getenv("SCRAPER_PER_HOST_CONCURRENCY", "4"))
+REQUEST_TIMEOUT = float(os.getenv("SCRAPER_TIMEOUT", "15"))
+HTTP_CACHE_ENABLED = os.getenv("SCRAPER_HTTP_CACHE", "1") != "0"
+
+MAX_RETRIES = int(os.getenv("SCRAPER_MAX_RETRIES", "3"))
+BACKOFF_BASE = float(os.getenv("SCRAPER_BACKOFF_BASE", "0.5"))
+BACKOFF_CAP = float(os.getenv("SCRAPER_BACKOFF_CAP", "30"))
+# Longer Retry-After values aren't waited out; the host's circuit opens instead
+MAX_RETRY_AFTER = float(os.getenv("SCRAPER_MAX_RETRY_AFTER", "60"))
+# Starting requests/sec per host; adapts between these bounds and is remembered
+HOST_RATE = float(os.getenv("SCRAPER_HOST_RATE", "5"))
+HOST_MIN_RATE = float(os.getenv("SCRAPER_HOST_MIN_RATE", "0.2"))
+HOST_MAX_RATE = float(os.getenv("SCRAPER_HOST_MAX_RATE", "50"))
+
+# Part of every parse memo key: bump it when a shared helper (scrapers.parsing)
+# changes what parsers return, so results memoized by older code are ignored
+PARSE_VERSION = 1
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+# A board URL answering these is gone; its own circuit keeps us from asking every cycle
+GONE_STATUSES = {404, 410}
+
+
+class AsyncFetcher:
+    """
+    Shared HTTP client for all scrapers.
+
+    One pooled httpx.AsyncClient serves every request of a scrape cycle. A
+    global semaphore caps total in-flight requests, a per-host semaphore keeps
+    us polite to each board, and every request carries a timeout so one hung
+    board can't stall the cycle.
+
+    Successful board responses are kept in an HttpCache: later requests are
+    sent conditionally, a 304 is answered from disk, and parse_once() skips
+    parsing bodies it has already parsed. One-off requests (job details,
+    probes) are not cached.
+
+    Each host also gets an adaptive token bucket (slowed down by 429 / 503,
+    sped up by successes, rate remembered across cycles), failed requests are
+    retried with jittered exponential backoff honoring Retry-After, and a
+    persistent CircuitBreaker makes requests to hosts that keep failing, or
+    to boards that are gone, fail immediately until their cooldown ends.
+    """
+
+    def __init__(self, max_concurrency=MAX_CONCURRENCY, per_host=PER_HOST_CONCURRENCY,
+                 timeout=REQUEST_TIMEOUT, transport=None, cache=HTTP_CACHE_ENABLED,
+                 retries=MAX_RETRIES, breaker=True):
+        self.max_concurrency = max_concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        if transport is None:
+            # SCRAPER_RECORD / SCRAPER_REPLAY swap the network for a fixture archive;
+            # archived responses must neither be revalidated from the HTTP cache nor
+            # trip circuit breakers (archive misses answer 404)
+            transport = transport_from_env()
+            if transport is not None:
+                cache, breaker = False, False
+        self.transport = transport
+        self.retries = retries
+        self.cache = HttpCache() if cache is True else (cache or None)
+        self.breaker = CircuitBreaker() if breaker is True else (breaker or None)
+        self._client = None
+        self._global_limit = None
+        self._host_limits = {}
+        self._host_buckets = {}
+        self._host_rates = JsonDiskCache("host_rates")
+        # parser name -> calls, seconds and body bytes actually parsed (see scrapers.replay bench)
+        self.parse_stats = {}
+
+    async def __aenter__(self):
+        self._client = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(max_connections=self.max_concurrency,
+                                max_keepalive_connections=self.max_concurrency),
+            follow_redirects=True,
+            transport=self.transport
+        )
+        self._global_limit = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._client.aclose()
+        self._client = None
+        for host, bucket in self._host_buckets.items():
+            self._host_rates.set(host, {"rate": bucket.rate})
+
+    def _host_limit(self, host):
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self._host_limits[host]
+
+    def _host_bucket(self, host):
+        if host not in self._host_buckets:
+            saved = self._host_rates.get(host) or {}
+            self._host_buckets[host] = AdaptiveTokenBucket(
+                saved.get("rate", HOST_RATE), HOST_MIN_RATE, HOST_MAX_RATE
+            )
+        return self._host_buckets[host]
+
+    def _record(self, key, ok, min_cooldown=0.0):
+        if self.breaker is None:
+            return
+        if ok:
+            self.breaker.record_success(key)
+        else:
+            self.breaker.record_failure(key, min_cooldown)
+
+    async def request(self, method, url, board=False, **kwargs):
+        """
+        Send a request through the host's rate limit, retries and circuit.
+        Pass board=True for a board's listing URL: it then gets a circuit of
+        its own, so a board that is gone (404 / 410) is not asked again every
+        cycle. Other URLs (job details, probes) only count for their host.
+        """
+        host = urlparse(url).netloc.lower()
+        keys = (url, host) if board else (host,)
+        if self.breaker is not None:
+            for i, key in enumerate(keys):
+                if not self.breaker.allow(key):
+                    # Don't leave the board URL's half-open probe claimed
+                    for claimed in keys[:i]:
+                        self.breaker.release(claimed)
+                    raise CircuitOpenError(f"Circuit open for {key}")
+
+        try:
+            return await self._request_with_retries(host, method, url, board, **kwargs)
+        finally:
+            # The board URL's probe only counts when the board itself answered
+            if board and self.breaker is not None:
+                self.breaker.release(url)
+
+    async def _request_with_retries(self, host, method, url, board, **kwargs):
+        bucket = self._host_bucket(host)
+        attempt = 0
+        while True:
+            await bucket.acquire()
+            try:
+                response = await self._send(host, method, url, board, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= self.retries:
+                    self._record(host, False)
+                    raise
+                delay = backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP)
+                print(f"[Fetch] {type(e).__name__} for {url}, retrying in {delay:.1f}s")
+            else:
+                status = response.status_code
+                if status not in RETRY_STATUSES:
+                    bucket.on_success()
+                    self._record(host, True)
+                    if board:
+                        self._record(url, status not in GONE_STATUSES)
+                    return response
+
+                retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+                if status in THROTTLE_STATUSES:
+                    bucket.on_throttle()
+                if attempt >= self.retries or (retry_after or 0) > MAX_RETRY_AFTER:
+                    self._record(host, False, retry_after or 0)
+                    return response
+                delay = backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP, retry_after)
+                print(f"[Fetch] HTTP {status} for {url}, retrying in {delay:.1f}s")
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _send(self, host, method, url, board, **kwargs):
+        async with self._global_limit, self._host_limit(host):
+            if self.cache is None or not board:
+                return await self._client.request(method, url, **kwargs)
+
+            request = self._client.build_request(method, url, **kwargs)
+            key = self.cache.key_for(request)
+            entry = self.cache.get(key)
+            if entry:
+                self.cache.add_validators(request, entry)
+
+            response = await self._client.send(request)
+            if response.status_code == 304 and entry:
+                replayed = self.cache.replay(key, entry, request)
+                if replayed is None:
+                    # The body was evicted since get(): ask again unconditionally
+                    return await self._client.request(method, url, **kwargs)
+                response = replayed
+                response.extensions["cache_status"] = "not_modified"
+                response.extensions["body_hash"] = entry["body_hash"]
+            elif response.status_code == 200:
+                body_hash = self.cache.store(key, response)
+                if body_hash is None:
+                    return response
+                unchanged = entry is not None and entry.get("body_hash") == body_hash
+                response.extensions["cache_status"] = "unchanged" if unchanged else "changed"
+                response.extensions["body_hash"] = body_hash
+            response.extensions["cache_key"] = key
+            return response
+
+    def parse_once(self, response, parser_name, parse_fn, *args, version=1):
+        """
+        Return parse_fn(*args), reusing the stored result when this exact body
+        was already parsed by `parser_name` (304 or unchanged body hash).
+        Scrapers pass their PARSER_VERSION as `version` and bump it whenever
+        the parser's output changes.
+        """
+        key = response.extensions.get("cache_key")
+        body_hash = response.extensions.get("body_hash")
+        if self.cache is None or key is None or body_hash is None:
+            return self._timed_parse(response, parser_name, parse_fn, *args)
+
+        memo_name = f"{parser_name}@{PARSE_VERSION}.{version}"
+        parsed = self.cache.get_parsed(key, body_hash, memo_name)
+        if parsed is not None:
+            return parsed
+        result = self._timed_parse(response, parser_name, parse_fn, *args)
+        self.cache.set_parsed(key, body_hash, memo_name, result)
+        return result
+
+    def _timed_parse(self, response, parser_name, parse_fn, *args):
+        start = time.perf_counter()
+        result = parse_fn(*args)
+        stat = self.parse_stats.setdefault(parser_name, {"calls": 0, "seconds": 0.0, "bytes": 0})
+        stat["calls"] += 1
+        stat["seconds"] += time.perf_counter() - start
+        stat["bytes"] += len(response.content)
+        return result
+
+    async def get(self, url, board=False, **kwargs):
+        return await self.request("GET", url, board, **kwargs)
+
+    async def post(self, url, board=False, **kwargs):
+        return await self.request("POST", url, board, **kwargs)
+
+
+def run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Works even when the caller is already inside an event loop (e.g. a FastAPI
+    handler calling fetch_all_jobs), by running it on a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    outcome = {}
+
+    def runner():
+        try:
+            outcome["value"] = asyncio.run(coro)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+def fetch_with_new_fetcher(fetch_async, *args):
+    """Run one scraper coroutine with its own short-lived fetcher (sync entry points)."""
+    async def run():
+        async with AsyncFetcher() as fetcher:
+            return await fetch_async(*args, fetcher)
+    return run_sync(run())
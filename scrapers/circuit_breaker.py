@@ -0,0 +1,78 @@
+# scrapers/circuit_breaker.py
+
+import os
+import time
+
+from utils.disk_cache import JsonDiskCache
+
+FAILURE_THRESHOLD = int(os.getenv("SCRAPER_BREAKER_FAILURES", "3"))
+BASE_COOLDOWN = float(os.getenv("SCRAPER_BREAKER_COOLDOWN", "900"))
+MAX_COOLDOWN = float(os.getenv("SCRAPER_BREAKER_MAX_COOLDOWN", str(24 * 3600)))
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host or URL whose circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Persistent circuit breakers, one per key (a host, or the URL of a board
+    that has disappeared).
+
+    After FAILURE_THRESHOLD consecutive failures the circuit opens and
+    requests fail immediately for a cooldown that doubles on every failed
+    recovery probe, up to MAX_COOLDOWN. Once the cooldown has passed one
+    request is let through (half-open); its success closes the circuit.
+
+    State lives on disk, so a host that was down in the last cycle is not
+    retried until its cooldown ends, even by a new process.
+    """
+
+    def __init__(self, namespace="circuit_breakers"):
+        self._store = JsonDiskCache(namespace)
+        self._states = {}
+        self._probing = set()
+
+    def state(self, key):
+        if key not in self._states:
+            self._states[key] = self._store.get(key)
+        return self._states[key]
+
+    def _save(self, key, state):
+        self._states[key] = state
+        if state is None:
+            self._store.delete(key)
+        else:
+            self._store.set(key, state)
+
+    def allow(self, key):
+        state = self.state(key)
+        if not state or not state.get("open_until"):
+            return True
+        if time.time() < state["open_until"] or key in self._probing:
+            return False
+        # Half-open: a single probe decides whether the circuit closes
+        self._probing.add(key)
+        return True
+
+    def release(self, key):
+        """Give back a half-open probe claimed by allow() whose outcome won't be recorded."""
+        self._probing.discard(key)
+
+    def record_success(self, key):
+        self._probing.discard(key)
+        if self.state(key):
+            self._save(key, None)
+
+    def record_failure(self, key, min_cooldown=0.0):
+        state = dict(self.state(key) or {"failures": 0, "cooldown": 0.0})
+        state["failures"] += 1
+        probe_failed = key in self._probing
+        self._probing.discard(key)
+
+        if probe_failed or state["failures"] >= FAILURE_THRESHOLD:
+            cooldown = state["cooldown"] * 2 if probe_failed else BASE_COOLDOWN
+            state["cooldown"] = min(MAX_COOLDOWN, max(cooldown, BASE_COOLDOWN, min_cooldown))
+            state["open_until"] = time.time() + state["cooldown"]
+            print(f"[Circuit] {key} open for {state['cooldown']:.0f}s after {state['failures']} failures.")
+        self._save(key, state)
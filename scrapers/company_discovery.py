@@ -1,65 +1,202 @@
 import os
-import requests
 import time
+import asyncio
+import httpx
 from dotenv import load_dotenv
 from urllib.parse import urlparse
 
+from scrapers.async_fetcher import AsyncFetcher, run_sync
+from scrapers.rate_limit import TokenBucket
+from utils.disk_cache import JsonDiskCache
+
 load_dotenv()
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID")
 BING_API_KEY = os.getenv("BING_API_KEY")  # Optional fallback
+GOOGLE_CSE_URL = "https://www.googleapis.com/customsearch/v1"
 
-HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
 CAREER_KEYWORDS = ["careers", "jobs", "join-us", "work-with-us", "employment", "opportunities"]
 
+# Custom Search quota: queries per second and burst size
+SEARCH_QPS = float(os.getenv("DISCOVERY_SEARCH_QPS", "1.0"))
+SEARCH_BURST = int(os.getenv("DISCOVERY_SEARCH_BURST", "5"))
+# Found careers pages are cached for a week, misses for a day
+CACHE_TTL = float(os.getenv("DISCOVERY_CACHE_TTL", str(7 * 24 * 3600)))
+MISS_TTL = float(os.getenv("DISCOVERY_MISS_TTL", str(24 * 3600)))
+
+# Public ATS endpoints that answer 200 only for existing boards
+GREENHOUSE_PROBE = "https://boards-api.greenhouse.io/v1/boards/{company}"
+LEVER_PROBE = "https://api.lever.co/v0/postings/{company}?limit=1&mode=json"
+WORKDAY_DATA_CENTERS = ["wd1", "wd3", "wd5", "wd12", "wd103"]
+
+_discovery_cache = JsonDiskCache("company_discovery")
+
 def is_likely_career_page(url: str) -> bool:
     return any(kw in url.lower() for kw in CAREER_KEYWORDS)
 
-def search_google_for_career_page(company: str) -> str | None:
-    try:
-        query = f"{company} careers site:{company}.com"
-        url = "https://www.googleapis.com/customsearch/v1"
-        params = {"key": GOOGLE_API_KEY, "cx": GOOGLE_CSE_ID, "q": query}
-        resp = requests.get(url, params=params, headers=HEADERS, timeout=10)
-        for item in resp.json().get("items", []):
+def cache_lookup(key):
+    entry = _discovery_cache.get(key)
+    if not entry:
+        return None
+    ttl = CACHE_TTL if entry.get("value") else MISS_TTL
+    if time.time() - entry.get("checked_at", 0) > ttl:
+        return None
+    return entry
+
+def cache_store(key, value, source):
+    _discovery_cache.set(key, {"value": value, "source": source, "checked_at": time.time()})
+
+def merge_role_companies(per_role, max_companies):
+    # Same budget as the original sequential loop: each role stops adding
+    # companies once the shared set holds max_companies
+    companies = set()
+    for role_companies in per_role:
+        for company in role_companies:
+            companies.add(company)
+            if len(companies) >= max_companies:
+                break
+    return companies
+
+class DiscoveryService:
+    """
+    Finds careers pages for companies with as few search queries as possible:
+    cached answers first, then free probes of the common ATS URL patterns,
+    and only then a Custom Search query through a token bucket.
+    """
+
+    def __init__(self, fetcher, search_bucket=None, probe_fetcher=None):
+        self.fetcher = fetcher
+        # Probes mostly hit boards that don't exist; see discover_career_urls_from_roles_async
+        self.probe_fetcher = probe_fetcher or fetcher
+        self.search_bucket = search_bucket or TokenBucket(SEARCH_QPS, SEARCH_BURST)
+        self.queries_used = 0
+
+    async def search(self, query):
+        """Custom Search result items; raises on errors (quota, outage) so they are never cached as misses."""
+        if not GOOGLE_API_KEY or not GOOGLE_CSE_ID:
+            return []
+        await self.search_bucket.acquire()
+        self.queries_used += 1
+        response = await self.fetcher.get(GOOGLE_CSE_URL, params={"key": GOOGLE_API_KEY, "cx": GOOGLE_CSE_ID, "q": query})
+        if response.status_code != 200:
+            raise httpx.HTTPStatusError(f"Custom Search returned HTTP {response.status_code}",
+                                        request=response.request, response=response)
+        return response.json().get("items", [])
+
+    async def _exists(self, url):
+        try:
+            response = await self.probe_fetcher.get(url)
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    async def _probe_workday_data_center(self, company, data_center):
+        # Tenants redirect their root to the default careers site
+        try:
+            response = await self.probe_fetcher.get(f"https://{company}.{data_center}.myworkdayjobs.com/")
+        except Exception:
+            return None
+        if response.status_code == 200 and response.url.path.strip("/"):
+            return str(response.url)
+        return None
+
+    async def _probe_workday(self, company):
+        # All data centers at once; the first in WORKDAY_DATA_CENTERS order wins
+        found = await asyncio.gather(*(self._probe_workday_data_center(company, dc) for dc in WORKDAY_DATA_CENTERS))
+        return next((url for url in found if url), None)
+
+    async def probe_ats(self, company):
+        """Try boards.greenhouse.io/<co>, jobs.lever.co/<co> and <co>.wd*.myworkdayjobs.com."""
+        greenhouse, lever, workday = await asyncio.gather(
+            self._exists(GREENHOUSE_PROBE.format(company=company)),
+            self._exists(LEVER_PROBE.format(company=company)),
+            self._probe_workday(company)
+        )
+        if greenhouse:
+            return f"https://boards.greenhouse.io/{company}", "greenhouse"
+        if lever:
+            return f"https://jobs.lever.co/{company}", "lever"
+        if workday:
+            return workday, "workday"
+        return None, None
+
+    async def search_career_page(self, company):
+        for item in await self.search(f"{company} careers site:{company}.com"):
             link = item.get("link", "")
             if is_likely_career_page(link):
                 return link
-    except Exception as e:
-        print(f"[Google Career Page Error] {e}")
-    return None
+        return None
 
-def extract_company_domains_from_roles(roles: list[str], max_companies=5) -> set:
-    companies = set()
-    for role in roles:
+    async def find_careers_url(self, company):
+        key = f"company:{company}"
+        cached = cache_lookup(key)
+        if cached is not None:
+            return {"company": company, "careers_url": cached["value"], "source": cached["source"]}
+
+        print(f" Discovering career page for company: {company}")
+        url, source = await self.probe_ats(company)
+        if url is None:
+            try:
+                url, source = await self.search_career_page(company), "search"
+            except Exception as e:
+                # Not cached: a failed search (quota, open circuit) is not a miss
+                print(f"[Google Career Page Error] {e}")
+                return {"company": company, "careers_url": None, "source": "search"}
+        cache_store(key, url, source)
+        return {"company": company, "careers_url": url, "source": source}
+
+    async def companies_for_role(self, role, max_companies=5):
+        key = f"role:{role.lower()}:{max_companies}"
+        cached = cache_lookup(key)
+        if cached is not None:
+            return cached["value"]
+
+        companies = []
         try:
-            url = "https://www.googleapis.com/customsearch/v1"
-            params = {"key": GOOGLE_API_KEY, "cx": GOOGLE_CSE_ID, "q": f"{role} jobs"}
-            resp = requests.get(url, params=params, headers=HEADERS, timeout=10)
-            data = resp.json()
-            for item in data.get("items", []):
+            for item in await self.search(f"{role} jobs"):
                 parsed = urlparse(item.get("link", ""))
                 domain = parsed.netloc.replace("www.", "")
                 base = domain.split('.')[0]
-                if base and len(base) > 2:
-                    companies.add(base.lower())
+                if base and len(base) > 2 and base.lower() not in companies:
+                    companies.append(base.lower())
                 if len(companies) >= max_companies:
                     break
         except Exception as e:
             print(f"[Google Role Search Error] {e}")
-        time.sleep(1.2)
-    return companies
+            return companies
+        cache_store(key, companies, "search")
+        return companies
+
+    async def discover(self, roles, max_companies=5):
+        per_role = await asyncio.gather(*(self.companies_for_role(role, max_companies) for role in roles))
+        companies = sorted(merge_role_companies(per_role, max_companies))
+        results = await asyncio.gather(*(self.find_careers_url(company) for company in companies))
+        print(f"[Discovery] {len(results)} companies, {self.queries_used} search queries used.")
+        return list(results)
+
+async def discover_career_urls_from_roles_async(roles: list[str], fetcher=None, probe_fetcher=None) -> list[dict]:
+    if fetcher is None:
+        # Probe responses are one-off, no point in the HTTP cache
+        async with AsyncFetcher(cache=False) as fetcher:
+            return await discover_career_urls_from_roles_async(roles, fetcher, probe_fetcher)
+    if probe_fetcher is None:
+        # A missing board is the expected answer to most probes: fail fast,
+        # without retries or breaker state persisted for hosts that don't exist
+        async with AsyncFetcher(cache=False, retries=0, breaker=False) as probe_fetcher:
+            return await discover_career_urls_from_roles_async(roles, fetcher, probe_fetcher)
+    return await DiscoveryService(fetcher, probe_fetcher=probe_fetcher).discover(roles)
+
+def extract_company_domains_from_roles(roles: list[str], max_companies=5) -> set:
+    async def run():
+        async with AsyncFetcher(cache=False) as fetcher:
+            service = DiscoveryService(fetcher)
+            per_role = await asyncio.gather(*(service.companies_for_role(role, max_companies) for role in roles))
+            return merge_role_companies(per_role, max_companies)
+    return run_sync(run())
 
 def discover_career_urls_from_roles(roles: list[str]) -> list[dict]:
-    company_set = extract_company_domains_from_roles(roles)
-    results = []
-    for company in sorted(company_set):
-        print(f" Discovering career page for company: {company}")
-        url = search_google_for_career_page(company)
-        results.append({"company": company, "careers_url": url})
-        time.sleep(1.5)
-    return results
+    return run_sync(discover_career_urls_from_roles_async(roles))
 
 # --- Optional fallback methods (disabled for now) ---
 
@@ -1,33 +1,46 @@
 # scrapers/custom_scraper.py
-import requests
-from bs4 import BeautifulSoup
+from scrapers.async_fetcher import fetch_with_new_fetcher
+from scrapers.parsing import parse_html, response_markup
+from scrapers.registry import register
 
-def fetch_jobs(url):
-    jobs = []
+# Bump when the parsers below change their output (see AsyncFetcher.parse_once)
+PARSER_VERSION = 1
 
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
 
-        # Try to find job title
-        title = soup.find("h1")
-        title = title.text.strip() if title else "Unknown Title"
+def parse_jobs(url, html):
+    # The description may live in any <section>, so the whole page is parsed
+    doc = parse_html(html)
 
-        # Try to find job description
-        desc_div = soup.find("div", {"class": "job-description"}) or soup.find("section")
-        description = desc_div.get_text(separator="\n").strip() if desc_div else "No description available."
+    # Try to find job title
+    title = doc.select_one("h1")
+    title = title.text().strip() if title else "Unknown Title"
 
-        # Build job dictionary
-        job = {
-            "title": title,
-            "url": url,
-            "company": "Unknown",
-            "description": description
-        }
-        jobs.append(job)
+    # Try to find job description
+    desc_div = doc.select_one("div.job-description") or doc.select_one("section")
+    description = desc_div.text(separator="\n").strip() if desc_div else "No description available."
 
+    # Build job dictionary
+    job = {
+        "title": title,
+        "url": url,
+        "company": "Unknown",
+        "description": description
+    }
+    return [job]
+
+async def fetch_jobs_async(url, fetcher):
+    try:
+        response = await fetcher.get(url, board=True)
+        response.raise_for_status()
+        return fetcher.parse_once(response, "custom", parse_jobs, url, response_markup(response), version=PARSER_VERSION)
     except Exception as e:
         print(f"[Custom Scraper Error] Failed to fetch job from {url}: {e}")
 
-    return jobs
+    return []
+
+def fetch_jobs(url):
+    return fetch_with_new_fetcher(fetch_jobs_async, url)
+
+
+# Fallback for pages no other plugin recognizes: one posting per page
+register("custom", fetch_jobs_async)
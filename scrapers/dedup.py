@@ -0,0 +1,184 @@
+# scrapers/dedup.py
+"""
+Collapse duplicate postings before any scoring or LLM call.
+
+A posting is a duplicate when it shares with an earlier one
+- its canonical URL or ATS posting id (gh_jid, Lever id, Workday req id),
+- its normalized company / title / location fingerprint, when the two come
+  from different boards and do not carry different ATS posting ids, or
+- a near-identical description (MinHash + LSH), as with re-posts whose
+  text was lightly edited.
+"""
+
+import os
+import re
+import zlib
+
+import numpy as np
+
+from scrapers.url_utils import canonicalize_url, posting_identity
+from utils.disk_cache import sha256_text
+
+NUM_PERM = 128
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+SHINGLE_SIZE = 3
+# Minimum number of words before a description is compared at all
+MIN_DESCRIPTION_WORDS = int(os.getenv("DEDUP_MIN_DESCRIPTION_WORDS", "40"))
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("DEDUP_SIMILARITY", "0.8"))
+
+# Hash permutations h(x) = a * x + b (mod 2^32, a odd): uint32 arithmetic
+# wraps for free, which is several times faster than reducing mod a prime
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(0, 1 << 31, size=NUM_PERM).astype(np.uint32) * np.uint32(2) + np.uint32(1)
+_PERM_B = _rng.randint(0, 1 << 32, size=NUM_PERM, dtype=np.int64).astype(np.uint32)
+
+WORD = re.compile(r"[a-z0-9]+")
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "corp", "corporation", "co", "company", "the", "plc", "gmbh", "group"}
+TITLE_ABBREVIATIONS = {"sr": "senior", "jr": "junior", "eng": "engineer", "mgr": "manager", "ml": "machine learning"}
+LOCATION_ALIASES = {"usa": "us", "united states": "us", "united states of america": "us"}
+
+
+def words(text):
+    return WORD.findall((text or "").lower())
+
+
+def normalize_company(company):
+    return " ".join(w for w in words(company) if w not in COMPANY_SUFFIXES)
+
+
+def normalize_title(title):
+    return " ".join(TITLE_ABBREVIATIONS.get(w, w) for w in words(title))
+
+
+def normalize_location(location):
+    text = " ".join(words(location))
+    for alias, canonical in LOCATION_ALIASES.items():
+        text = re.sub(rf"\b{alias}\b", canonical, text)
+    return text
+
+
+def posting_fingerprint(job):
+    """Hash of normalized company, title and location; None if title or company is unknown."""
+    company, title = normalize_company(job.get("company")), normalize_title(job.get("title"))
+    if not company or not title or company == "unknown" or title == "unknown title":
+        return None
+    return sha256_text(f"{company}|{title}|{normalize_location(job.get('location'))}")
+
+
+def minhash_signature(text):
+    """128-value MinHash signature over word 3-gram shingles, or None for short texts."""
+    tokens = words(text)
+    if len(tokens) < MIN_DESCRIPTION_WORDS:
+        return None
+    shingles = {" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+    hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint32, count=len(shingles))
+    return (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]).min(axis=1)
+
+
+def estimated_similarity(sig_a, sig_b):
+    return float(np.mean(sig_a == sig_b))
+
+
+class Deduplicator:
+    """
+    Incremental duplicate detector for one scrape cycle.
+
+    is_duplicate_listing() uses URL, ATS id and fingerprint, so it works on
+    bare listings before descriptions are fetched. is_duplicate_description()
+    runs MinHash/LSH once the description is known.
+    """
+
+    def __init__(self, threshold=NEAR_DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        self.keys = {}
+        self.fingerprints = {}
+        self.signatures = []
+        self.buckets = {}
+
+    def _same_fingerprint_posting(self, job, other):
+        # Two reqs with one title and location on the same board, or with
+        # different ATS ids, are separate openings
+        identity, other_identity = posting_identity(job.get("url")), posting_identity(other.get("url"))
+        if identity and other_identity and identity != other_identity:
+            return False
+        return not job.get("board") or job.get("board") != other.get("board")
+
+    def _key_owner(self, job):
+        for key in (canonicalize_url(job.get("url")), posting_identity(job.get("url"))):
+            if key and key in self.keys:
+                return self.keys[key]
+        for other in self.fingerprints.get(posting_fingerprint(job), ()):
+            if self._same_fingerprint_posting(job, other):
+                return other
+        return None
+
+    def is_duplicate_listing(self, job):
+        owner = self._key_owner(job)
+        if owner is not None:
+            owner.setdefault("duplicate_urls", []).append(job.get("url"))
+            return True
+        for key in (canonicalize_url(job.get("url")), posting_identity(job.get("url"))):
+            if key:
+                self.keys[key] = job
+        fingerprint = posting_fingerprint(job)
+        if fingerprint:
+            self.fingerprints.setdefault(fingerprint, []).append(job)
+        return False
+
+    def _similar_titles(self, job, other):
+        a, b = set(normalize_title(job.get("title")).split()), set(normalize_title(other.get("title")).split())
+        return bool(a and b) and len(a & b) / len(a | b) >= 0.5
+
+    def is_duplicate_description(self, job):
+        signature = minhash_signature(job.get("description"))
+        if signature is None:
+            return False
+
+        bands = [(band, signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes()) for band in range(LSH_BANDS)]
+        candidates = {index for band in bands for index in self.buckets.get(band, ())}
+        for index in sorted(candidates):
+            other, other_signature = self.signatures[index]
+            if estimated_similarity(signature, other_signature) < self.threshold:
+                continue
+            # Shared boilerplate alone shouldn't merge two roles of one company
+            same_company = normalize_company(job.get("company")) == normalize_company(other.get("company"))
+            if same_company and not self._similar_titles(job, other):
+                continue
+            other.setdefault("duplicate_urls", []).append(job.get("url"))
+            return True
+
+        index = len(self.signatures)
+        self.signatures.append((job, signature))
+        for band in bands:
+            self.buckets.setdefault(band, []).append(index)
+        return False
+
+
+def dedup_jobs(jobs):
+    """
+    Batch form: drop duplicate postings, keeping the copy with the longest
+    description. Removed copies are listed in the survivor's `duplicate_urls`.
+    """
+    ranked = sorted(enumerate(jobs), key=lambda item: (-len(item[1].get("description") or ""), item[0]))
+    deduper = Deduplicator()
+    kept = [index for index, job in ranked
+            if not deduper.is_duplicate_listing(job) and not deduper.is_duplicate_description(job)]
+    unique = [jobs[index] for index in sorted(kept)]
+    if len(unique) < len(jobs):
+        print(f"[Dedup] Collapsed {len(jobs) - len(unique)} duplicate postings of {len(jobs)}.")
+    return unique
+
+
+async def iter_unique_listings_async(jobs, deduper):
+    """Streaming URL / ATS id / fingerprint dedup (before description fetches)."""
+    async for job in jobs:
+        if not deduper.is_duplicate_listing(job):
+            yield job
+
+
+async def iter_unique_descriptions_async(jobs, deduper):
+    """Streaming MinHash dedup (after enrichment, before scoring)."""
+    async for job in jobs:
+        if not deduper.is_duplicate_description(job):
+            yield job
@@ -1,25 +1,44 @@
-from scrapers.greenhouse_scraper import fetch_jobs as fetch_greenhouse
-from scrapers.workday_scraper import fetch_jobs as fetch_workday
-from scrapers.custom_scraper import fetch_jobs as fetch_custom  # Fallback
+import asyncio
+
+from scrapers.async_fetcher import AsyncFetcher, run_sync
+from scrapers.registry import resolve_source, iter_board_async
+from scrapers.streams import merge
+
+async def iter_source_async(url, fetcher, plugin, board_url):
+    print(f"Scraping: {url} ({plugin.name})")
+    try:
+        async for job in iter_board_async(plugin, board_url, fetcher):
+            yield job
+    except Exception as e:
+        print(f"[Scraping Error] {url}: {e}")
+
+async def scrape_source_async(url, fetcher):
+    plugin, board_url = await resolve_source(url, fetcher)
+    return [job async for job in iter_source_async(url, fetcher, plugin, board_url)]
+
+async def iter_dynamic_jobs_async(discovered_sources: list[dict], fetcher=None):
+    """Yield jobs from every discovered careers page as each page finishes."""
+    if fetcher is None:
+        async with AsyncFetcher() as fetcher:
+            async for job in iter_dynamic_jobs_async(discovered_sources, fetcher):
+                yield job
+        return
+
+    urls = [source.get("careers_url") for source in discovered_sources if source.get("careers_url")]
+    # Careers pages that embed the same ATS board are scraped once
+    resolved = await asyncio.gather(*(resolve_source(url, fetcher) for url in urls))
+    boards = {}
+    for url, (plugin, board_url) in zip(urls, resolved):
+        boards.setdefault((plugin.name, board_url), (url, plugin))
+
+    async for job in merge([
+        iter_source_async(url, fetcher, plugin, board_url)
+        for (_, board_url), (url, plugin) in boards.items()
+    ]):
+        yield job
+
+async def dynamic_scrape_jobs_async(discovered_sources: list[dict], fetcher=None) -> list[dict]:
+    return [job async for job in iter_dynamic_jobs_async(discovered_sources, fetcher)]
 
 def dynamic_scrape_jobs(discovered_sources: list[dict]) -> list[dict]:
-    jobs = []
-
-    for source in discovered_sources:
-        url = source.get("careers_url")
-        if not url:
-            continue
-
-        print(f"Scraping: {url}")
-        try:
-            if "greenhouse.io" in url:
-                jobs.extend(fetch_greenhouse(url))
-            elif "workday" in url:
-                jobs.extend(fetch_workday(url))
-            else:
-                print(f"[Fallback] Using custom scraper for: {url}")
-                jobs.extend(fetch_custom(url))
-        except Exception as e:
-            print(f"[Scraping Error] {url}: {e}")
-
-    return jobs
+    return run_sync(dynamic_scrape_jobs_async(discovered_sources))
@@ -0,0 +1,128 @@
+# scrapers/eightfold_scraper.py
+
+import json
+import asyncio
+from urllib.parse import urlsplit, parse_qs
+
+from scrapers.async_fetcher import fetch_with_new_fetcher
+from scrapers.parsing import html_to_text
+from scrapers.registry import register, PartialBoardError
+
+# The careers SPA loads its list from this endpoint, 10 positions per page
+API_URL = "https://{host}/api/apply/v2/jobs?domain={domain}&start={start}&num={num}"
+DETAIL_URL = "https://{host}/api/apply/v2/jobs/{pid}?domain={domain}"
+PAGE_SIZE = 10
+MAX_PARALLEL_PAGES = 4
+# Bump when the parsers below change their output (see AsyncFetcher.parse_once)
+PARSER_VERSION = 1
+
+
+def company_domain(url):
+    """
+    The `domain` parameter every API call needs: taken from ?domain= when the
+    URL carries it, otherwise guessed from the tenant (aexp.eightfold.ai -> aexp.com).
+    """
+    parts = urlsplit(url)
+    domain = parse_qs(parts.query).get("domain")
+    if domain:
+        return domain[0]
+    return parts.netloc.split(".")[0] + ".com"
+
+
+def board_url(url):
+    parts = urlsplit(url)
+    return f"https://{parts.netloc}/careers?domain={company_domain(url)}"
+
+
+def api_url(board_url, start):
+    host = urlsplit(board_url).netloc
+    return API_URL.format(host=host, domain=company_domain(board_url), start=start, num=PAGE_SIZE)
+
+
+def detail_api_url(job_url):
+    """https://aexp.eightfold.ai/careers/job/29083548 -> the position's API record"""
+    parts = urlsplit(job_url)
+    pid = [seg for seg in parts.path.split("/") if seg][-1]
+    return DETAIL_URL.format(host=parts.netloc, pid=pid, domain=company_domain(job_url))
+
+
+def parse_description(body):
+    return html_to_text(json.loads(body).get("job_description", ""))
+
+
+def parse_jobs(board_url, data):
+    jobs = []
+    host = urlsplit(board_url).netloc
+    for item in data.get("positions", []):
+        url = item.get("canonicalPositionUrl") or f"https://{host}/careers/job/{item.get('id')}"
+        jobs.append({
+            "title": item.get("name", "").strip(),
+            "company": host.split(".")[0],
+            "location": item.get("location", ""),
+            "url": url,
+            "description": html_to_text(item.get("job_description", "")),
+            "source": "eightfold"
+        })
+    return jobs
+
+
+async def fetch_page(board_url, fetcher, start):
+    response = await fetcher.get(api_url(board_url, start), board=True)
+    response.raise_for_status()
+    data = response.json()
+    return data, fetcher.parse_once(response, "eightfold", parse_jobs, board_url, data, version=PARSER_VERSION)
+
+
+async def iter_jobs(board_url, fetcher, max_parallel_pages=MAX_PARALLEL_PAGES):
+    """Stream every position of an Eightfold tenant; pages after the first are fetched concurrently."""
+    data, jobs = await fetch_page(board_url, fetcher, 0)
+    for job in jobs:
+        yield job
+
+    limit = asyncio.Semaphore(max_parallel_pages)
+
+    async def bounded_page(start):
+        async with limit:
+            return await fetch_page(board_url, fetcher, start)
+
+    tasks = [asyncio.create_task(bounded_page(start)) for start in range(PAGE_SIZE, data.get("count", 0), PAGE_SIZE)]
+    failed = 0
+    try:
+        for task in asyncio.as_completed(tasks):
+            try:
+                _, jobs = await task
+            except Exception as e:
+                print(f"[Eightfold Error] Page fetch failed for {board_url}: {e}")
+                failed += 1
+                continue
+            for job in jobs:
+                yield job
+    finally:
+        for task in tasks:
+            task.cancel()
+    if failed:
+        raise PartialBoardError(f"{failed} of {len(tasks) + 1} pages failed for {board_url}")
+
+
+async def fetch_jobs_async(board_url, fetcher):
+    jobs = []
+    try:
+        async for job in iter_jobs(board_url, fetcher):
+            jobs.append(job)
+    except Exception as e:
+        print(f"[Eightfold Error] {e}")
+    return jobs
+
+
+def fetch_jobs(board_url):
+    return fetch_with_new_fetcher(fetch_jobs_async, board_url)
+
+
+register(
+    "eightfold",
+    fetch_jobs_async,
+    iterate=iter_jobs,
+    hosts=[r"\.eightfold\.ai$"],
+    fingerprints=[rb"(?P<board>https://[\w-]+\.eightfold\.ai)/careers", rb"/api/apply/v2/jobs"],
+    board_url=board_url
+)
@@ -0,0 +1,132 @@
+# scrapers/enrichment.py
+
+import os
+import asyncio
+
+from configs.criteria_loader import load_criteria
+from scrapers.async_fetcher import AsyncFetcher, run_sync
+from scrapers.parsing import extract_main_text, response_markup
+from scrapers.postings_index import posting_content_hash
+from scrapers.url_utils import canonicalize_url
+from scrapers.streams import map_unordered
+from scrapers import workday_scraper, icims_scraper, eightfold_scraper
+from utils.disk_cache import JsonDiskCache
+
+ENRICH_PER_HOST = int(os.getenv("ENRICH_PER_HOST_CONCURRENCY", "2"))
+ENRICH_CONCURRENCY = int(os.getenv("ENRICH_MAX_CONCURRENCY", "16"))
+# Bump when the description parsers change their output (see AsyncFetcher.parse_once)
+PARSER_VERSION = 1
+
+# source -> (listing URL -> detail URL, detail body -> description)
+DETAIL_HANDLERS = {
+    "workday": (workday_scraper.detail_api_url, workday_scraper.parse_description),
+    "icims": (icims_scraper.detail_url, icims_scraper.parse_description),
+    "eightfold": (eightfold_scraper.detail_api_url, eightfold_scraper.parse_description),
+}
+DEFAULT_HANDLER = (lambda url: url, extract_main_text)
+
+_description_cache = JsonDiskCache("descriptions")
+
+
+def passes_prefilter(job, criteria):
+    """
+    The cheap title / company checks of filter_and_rank, applied before we
+    spend a request on the detail page. Location is not checked here: a
+    listing's location text ("San Francisco, CA", "3 Locations") can't be
+    matched against criteria like "united states" reliably; Workday boards
+    filter it server-side instead (see workday_scraper.resolve_location_facets).
+    """
+    title = (job.get("title") or "").lower()
+    company = (job.get("company") or "").lower()
+
+    if any(ex in title for ex in criteria["exclude"]["titles"]):
+        return False
+    if any(ex in company for ex in criteria["exclude"]["companies"]):
+        return False
+    if not any(t in title for t in criteria["titles"]):
+        return False
+    return True
+
+
+def description_cache_key(job):
+    # The listing hash changes when title/location change, forcing a refetch
+    return f"{canonicalize_url(job['url'])}|{posting_content_hash(job)}"
+
+
+async def enrich_job_async(job, fetcher):
+    """Fill in job["description"] from its detail page; returns True if it has one."""
+    key = description_cache_key(job)
+    cached = _description_cache.get(key)
+    if cached is not None:
+        job["description"] = cached
+        return True
+
+    to_detail_url, parse_description = DETAIL_HANDLERS.get(job.get("source"), DEFAULT_HANDLER)
+    try:
+        response = await fetcher.get(to_detail_url(job["url"]))
+        response.raise_for_status()
+        description = fetcher.parse_once(response, "description", parse_description, response_markup(response), version=PARSER_VERSION)
+    except Exception as e:
+        print(f"[Enrich Error] {job['url']}: {e}")
+        return False
+
+    if description:
+        job["description"] = description
+        _description_cache.set(key, description)
+    return bool(description)
+
+
+async def enrich_jobs_async(jobs, fetcher=None, criteria=None, failed_urls=None):
+    """
+    Drop postings that fail the cheap filters, then fetch the detail page of
+    every remaining posting that arrived without a description. Postings whose
+    description could not be fetched are held back (their URLs appended to
+    `failed_urls`) rather than scored against an empty description.
+    """
+    if fetcher is None:
+        async with AsyncFetcher(max_concurrency=ENRICH_CONCURRENCY, per_host=ENRICH_PER_HOST) as fetcher:
+            return await enrich_jobs_async(jobs, fetcher, criteria, failed_urls)
+
+    criteria = criteria or load_criteria()
+    kept = [job for job in jobs if passes_prefilter(job, criteria)]
+    missing = [job for job in kept if not job.get("description") and job.get("url")]
+    print(f"[Enrich] {len(kept)} of {len(jobs)} postings pass filters; fetching {len(missing)} descriptions.")
+
+    enriched = await asyncio.gather(*(enrich_job_async(job, fetcher) for job in missing))
+    failed = [job for job, ok in zip(missing, enriched) if not ok]
+    if failed_urls is not None:
+        failed_urls.extend(job["url"] for job in failed)
+    failed_ids = {id(job) for job in failed}
+    return [job for job in kept if id(job) not in failed_ids]
+
+
+async def iter_enriched_async(jobs, fetcher, criteria=None, failed_urls=None):
+    """
+    Streaming enrich_jobs_async over an async iterator of postings: postings
+    that fail the cheap filters are dropped, the rest are yielded as soon as
+    their description is available. Postings whose description could not be
+    fetched are held back, their URLs appended to `failed_urls`.
+    """
+    criteria = criteria or load_criteria()
+
+    async def candidates():
+        async for job in jobs:
+            if passes_prefilter(job, criteria):
+                yield job
+
+    async def ensure_description(job):
+        if job.get("description") or not job.get("url"):
+            return job
+        if await enrich_job_async(job, fetcher):
+            return job
+        if failed_urls is not None:
+            failed_urls.append(job["url"])
+        return None
+
+    async for job in map_unordered(candidates(), ensure_description):
+        if job is not None:
+            yield job
+
+
+def enrich_jobs(jobs, criteria=None):
+    return run_sync(enrich_jobs_async(jobs, criteria=criteria))
@@ -1,26 +1,114 @@
 # scrapers/greenhouse_scraper.py
 
-import requests
-from bs4 import BeautifulSoup
+import json
+from urllib.parse import urlsplit, parse_qs
 
-def fetch_jobs(board_url):
+from bs4 import SoupStrainer
+from scrapers.async_fetcher import fetch_with_new_fetcher
+from scrapers.parsing import html_to_text, parse_html, response_markup
+from scrapers.registry import register
+
+API_URL = "https://boards-api{region}.greenhouse.io/v1/boards/{token}/jobs?content=true"
+# Only the job rows of the board page are parsed
+LISTING_STRAINER = SoupStrainer("div", class_="opening")
+# Bump when the parsers below change their output (see AsyncFetcher.parse_once)
+PARSER_VERSION = 1
+
+
+def board_token(board_url):
+    """
+    Extract the board token from boards.greenhouse.io/<token>,
+    job-boards.greenhouse.io/<token> or embed URLs (?for=<token>).
+    """
+    parts = urlsplit(board_url)
+    embed_for = parse_qs(parts.query).get("for")
+    if embed_for:
+        return embed_for[0]
+    segments = [seg for seg in parts.path.split("/") if seg]
+    return segments[0] if segments else None
+
+
+def board_url(url):
+    """Any Greenhouse URL (job page, embed, board) -> the board page it belongs to."""
+    parts = urlsplit(url)
+    if parse_qs(parts.query).get("for"):
+        return url
+    return f"https://{parts.netloc}/{board_token(url)}"
+
+
+def api_url(board_url):
+    # EU boards (job-boards.eu.greenhouse.io) are served by a separate API host
+    region = ".eu" if ".eu.greenhouse.io" in urlsplit(board_url).netloc else ""
+    return API_URL.format(region=region, token=board_token(board_url))
+
+
+def parse_api_jobs(board_url, body):
     jobs = []
+    for item in json.loads(body).get("jobs", []):
+        jobs.append({
+            "title": item.get("title", "").strip(),
+            "company": item.get("company_name") or board_token(board_url),
+            "location": (item.get("location") or {}).get("name", ""),
+            "url": item.get("absolute_url", ""),
+            "description": html_to_text(item.get("content", ""), escaped=True),
+            "source": "greenhouse"
+        })
+    return jobs
+
+
+def parse_jobs(board_url, html):
+    jobs = []
+    doc = parse_html(html, LISTING_STRAINER)
+
+    for opening in doc.select("div.opening"):
+        link = opening.select_one("a")
+        title = link.text().strip()
+        location = opening.select_one("span.location").text().strip()
+        url = "https://boards.greenhouse.io" + link.get("href")
+        jobs.append({
+            "title": title,
+            "company": board_url.split("/")[-1],
+            "location": location,
+            "url": url,
+            "description": "",
+            "source": "greenhouse"
+        })
+    return jobs
+
+
+async def fetch_api_jobs_async(board_url, fetcher):
+    token = board_token(board_url)
+    if not token:
+        raise ValueError(f"No Greenhouse board token in {board_url}")
+    response = await fetcher.get(api_url(board_url), board=True)
+    response.raise_for_status()
+    return fetcher.parse_once(response, "greenhouse_api", parse_api_jobs, board_url, response.content, version=PARSER_VERSION)
+
+
+async def fetch_jobs_async(board_url, fetcher):
+    # The boards API returns every posting with its full description in one
+    # request; the HTML board is only scraped when the API is unavailable.
+    try:
+        return await fetch_api_jobs_async(board_url, fetcher)
+    except Exception as e:
+        print(f"[Greenhouse] API unavailable for {board_url}, falling back to HTML: {e}")
+
     try:
-        response = requests.get(board_url)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        for opening in soup.select("div.opening"):
-            title = opening.find("a").text.strip()
-            location = opening.find("span", class_="location").text.strip()
-            url = "https://boards.greenhouse.io" + opening.find("a")["href"]
-            jobs.append({
-                "title": title,
-                "company": board_url.split("/")[-1],
-                "location": location,
-                "url": url,
-                "description": "",
-                "source": "greenhouse"
-            })
+        response = await fetcher.get(board_url, board=True)
+        return fetcher.parse_once(response, "greenhouse", parse_jobs, board_url, response_markup(response), version=PARSER_VERSION)
     except Exception as e:
         print(f"[Greenhouse Error] {e}")
-    return jobs
+    return []
+
+
+def fetch_jobs(board_url):
+    return fetch_with_new_fetcher(fetch_jobs_async, board_url)
+
+
+register(
+    "greenhouse",
+    fetch_jobs_async,
+    hosts=[r"(^|\.)greenhouse\.io$"],
+    fingerprints=[rb"(?P<board>https://(?:boards|job-boards)(?:\.eu)?\.greenhouse\.io/(?:embed/job_board(?:/js)?\?for=[\w-]+|(?!embed)[\w-]+))"],
+    board_url=board_url
+)
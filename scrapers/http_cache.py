@@ -0,0 +1,167 @@
+# scrapers/http_cache.py
+
+import os
+import time
+import httpx
+from utils.disk_cache import JsonDiskCache, cache_dir, sha256_bytes
+
+# Bodies larger than this are never stored
+HTTP_CACHE_MAX_BODY = int(os.getenv("SCRAPER_HTTP_CACHE_MAX_BODY", str(2 << 20)))
+# Entries and bodies unused for this long are dropped when the cache is opened,
+# then the least recently used bodies until the store fits HTTP_CACHE_MAX_BYTES
+HTTP_CACHE_TTL = float(os.getenv("SCRAPER_HTTP_CACHE_TTL", str(7 * 24 * 3600)))
+HTTP_CACHE_MAX_BYTES = int(os.getenv("SCRAPER_HTTP_CACHE_MAX_BYTES", str(256 << 20)))
+
+
+class HttpCache:
+    """
+    On-disk store of board responses with their ETag / Last-Modified validators.
+
+    Entries are keyed by method, URL and request-body hash, and also hold the
+    parsed result of the body, so an unchanged page is neither downloaded in
+    full (304) nor parsed again (same body hash).
+
+    Only entries (validators, body hash, parse memo) are kept in memory; the
+    bodies themselves are raw files, one per body hash, read back on a 304.
+    """
+
+    def __init__(self, namespace="http", max_body=HTTP_CACHE_MAX_BODY,
+                 ttl=HTTP_CACHE_TTL, max_bytes=HTTP_CACHE_MAX_BYTES):
+        self._store = JsonDiskCache(namespace)
+        self._bodies = cache_dir(f"{namespace}_bodies")
+        self._entries = {}
+        self.max_body = max_body
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.prune()
+
+    @staticmethod
+    def key_for(request):
+        return f"{request.method} {request.url} {sha256_bytes(request.content)}"
+
+    def _body_path(self, body_hash):
+        return os.path.join(self._bodies, body_hash[:2], body_hash)
+
+    def get(self, key):
+        if key not in self._entries:
+            entry = self._store.get(key)
+            # An entry whose body was evicted can't answer a 304
+            if entry and not os.path.exists(self._body_path(entry["body_hash"])):
+                entry = None
+            self._entries[key] = entry
+        return self._entries[key]
+
+    def _save(self, key, entry):
+        self._entries[key] = entry
+        self._store.set(key, entry)
+
+    def forget(self, key):
+        self._entries[key] = None
+        self._store.delete(key)
+
+    def add_validators(self, request, entry):
+        # Conditional headers only make sense for safe requests
+        if request.method != "GET":
+            return
+        if entry.get("etag"):
+            request.headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request.headers["If-Modified-Since"] = entry["last_modified"]
+
+    def _write_body(self, body_hash, content):
+        path = self._body_path(body_hash)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            if os.path.exists(path):
+                os.utime(path)
+                return
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARN] Could not write cached body {path}: {e}")
+
+    def store(self, key, response):
+        """
+        Record a 200 response; returns its body hash, or None if the body is
+        too large to keep. Parsed results survive if the body is unchanged.
+        """
+        if len(response.content) > self.max_body:
+            if self.get(key):
+                self.forget(key)
+            return None
+        body_hash = sha256_bytes(response.content)
+        entry = self.get(key)
+        parsed = entry.get("parsed", {}) if entry and entry.get("body_hash") == body_hash else {}
+        self._write_body(body_hash, response.content)
+        self._save(key, {
+            "url": str(response.request.url),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "body_hash": body_hash,
+            "parsed": parsed
+        })
+        return body_hash
+
+    def replay(self, key, entry, request):
+        """Rebuild the cached 200 response for a 304 answer; None if its body is gone."""
+        path = self._body_path(entry["body_hash"])
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+            os.utime(path)
+            self._store.touch(key)
+        except OSError:
+            self.forget(key)
+            return None
+        headers = {"Content-Type": entry["content_type"]} if entry.get("content_type") else {}
+        return httpx.Response(200, headers=headers, content=content, request=request)
+
+    def get_parsed(self, key, body_hash, parser_name):
+        entry = self.get(key)
+        if not entry or entry.get("body_hash") != body_hash:
+            return None
+        return entry.get("parsed", {}).get(parser_name)
+
+    def set_parsed(self, key, body_hash, parser_name, result):
+        entry = self.get(key)
+        if not entry or entry.get("body_hash") != body_hash:
+            return
+        # Drop results memoized by older versions of the same parser ("name@version")
+        base = parser_name.split("@")[0]
+        parsed = {name: value for name, value in entry.get("parsed", {}).items() if name.split("@")[0] != base}
+        parsed[parser_name] = result
+        entry["parsed"] = parsed
+        self._save(key, entry)
+
+    def prune(self, now=None):
+        """
+        Drop entries and bodies not written or replayed within `ttl`, then the
+        least recently used bodies until the bodies fit in `max_bytes`.
+        """
+        now = now or time.time()
+        bodies = []
+        for root in (self._store.root, self._bodies):
+            for dirpath, _, names in os.walk(root):
+                for name in names:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat = os.stat(path)
+                        if now - stat.st_mtime > self.ttl:
+                            os.remove(path)
+                        elif root == self._bodies:
+                            bodies.append((stat.st_mtime, stat.st_size, path))
+                    except OSError:
+                        continue
+
+        total = sum(size for _, size, _ in bodies)
+        for _, size, path in sorted(bodies):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
@@ -1,29 +1,78 @@
 # scrapers/icims_scraper.py
 
-import requests
-from bs4 import BeautifulSoup
+from urllib.parse import urlsplit, urlunsplit
 
-def fetch_jobs(board_url):
+from bs4 import SoupStrainer
+from scrapers.async_fetcher import fetch_with_new_fetcher
+from scrapers.parsing import parse_html, response_markup
+from scrapers.registry import register
+
+DESCRIPTION_SELECTORS = [".iCIMS_JobContent", ".iCIMS_InfoMsg_Job", "#jobDescription"]
+LISTING_STRAINER = SoupStrainer(class_="iCIMS_JobsTable")
+# Bump when the parsers below change their output (see AsyncFetcher.parse_once)
+PARSER_VERSION = 1
+
+
+def search_url(url):
+    # The full job list is served by the search page; its table lives in an iframe
+    parts = urlsplit(url)
+    if parts.path.startswith("/jobs/search"):
+        return url
+    return f"https://{parts.netloc}/jobs/search?ss=1&in_iframe=1"
+
+
+def detail_url(job_url):
+    # iCIMS renders the posting body inside an iframe; ask for the frame directly
+    parts = urlsplit(job_url)
+    query = f"{parts.query}&in_iframe=1" if parts.query else "in_iframe=1"
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+def parse_description(html):
+    doc = parse_html(html)
+    for selector in DESCRIPTION_SELECTORS:
+        block = doc.select_one(selector)
+        if block:
+            return block.text("\n", strip=True)
+    return ""
+
+def parse_jobs(board_url, html):
     jobs = []
+    doc = parse_html(html, LISTING_STRAINER)
+
+    for el in doc.select(".iCIMS_JobsTable > tbody > tr"):
+        a_tag = el.select_one("a")
+        if not a_tag:
+            continue
+        title = a_tag.text().strip()
+        location = el.select_one("td:nth-child(2)").text().strip()
+        url = a_tag.get("href")
+        jobs.append({
+            "title": title,
+            "company": board_url.split("//")[1].split(".")[0],
+            "location": location,
+            "url": url,
+            "description": "",
+            "source": "icims"
+        })
+    return jobs
+
+async def fetch_jobs_async(board_url, fetcher):
     try:
-        response = requests.get(board_url)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        for el in soup.select(".iCIMS_JobsTable > tbody > tr"):
-            a_tag = el.find("a")
-            if not a_tag:
-                continue
-            title = a_tag.text.strip()
-            location = el.select_one("td:nth-child(2)").text.strip()
-            url = a_tag["href"]
-            jobs.append({
-                "title": title,
-                "company": board_url.split("//")[1].split(".")[0],
-                "location": location,
-                "url": url,
-                "description": "",
-                "source": "icims"
-            })
+        response = await fetcher.get(search_url(board_url), board=True)
+        return fetcher.parse_once(response, "icims", parse_jobs, board_url, response_markup(response), version=PARSER_VERSION)
     except Exception as e:
         print(f"[iCIMS Error] {e}")
-    return jobs
+    return []
+
+def fetch_jobs(board_url):
+    return fetch_with_new_fetcher(fetch_jobs_async, board_url)
+
+
+register(
+    "icims",
+    fetch_jobs_async,
+    hosts=[r"\.icims\.com$"],
+    fingerprints=[rb"(?P<board>https://[\w-]+\.icims\.com)", rb"iCIMS_JobsTable"],
+    board_url=search_url
+)
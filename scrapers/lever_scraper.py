@@ -1,26 +1,107 @@
 # scrapers/lever_scraper.py
 
-import requests
-from bs4 import BeautifulSoup
+import json
+from urllib.parse import urlsplit
 
-def fetch_jobs(board_url):
+from bs4 import SoupStrainer
+from scrapers.async_fetcher import fetch_with_new_fetcher
+from scrapers.parsing import html_to_text, parse_html, response_markup
+from scrapers.registry import register
+
+API_URL = "https://api{region}.lever.co/v0/postings/{company}?mode=json"
+# Posting links and their location tags, in document order
+LISTING_STRAINER = SoupStrainer(["a", "span"], class_=["posting-title", "sort-by-location"])
+# Bump when the parsers below change their output (see AsyncFetcher.parse_once)
+PARSER_VERSION = 1
+
+
+def company_slug(board_url):
+    """jobs.lever.co/<company>[/<posting-id>] -> <company>"""
+    segments = [seg for seg in urlsplit(board_url).path.split("/") if seg]
+    return segments[0] if segments else None
+
+
+def board_url(url):
+    parts = urlsplit(url)
+    return f"https://{parts.netloc}/{company_slug(url)}"
+
+
+def posting_description(item):
+    parts = [item.get("descriptionPlain") or html_to_text(item.get("description", ""))]
+    for section in item.get("lists", []):
+        parts.append(section.get("text", ""))
+        parts.append(html_to_text(section.get("content", "")))
+    parts.append(item.get("additionalPlain") or html_to_text(item.get("additional", "")))
+    return "\n".join(part.strip() for part in parts if part and part.strip())
+
+
+def parse_api_jobs(board_url, body):
     jobs = []
+    for item in json.loads(body):
+        categories = item.get("categories") or {}
+        jobs.append({
+            "title": item.get("text", "").strip(),
+            "company": company_slug(board_url),
+            "location": categories.get("location", ""),
+            "url": item.get("hostedUrl", ""),
+            "description": posting_description(item),
+            "source": "lever"
+        })
+    return jobs
+
+
+def parse_jobs(board_url, html):
+    jobs = []
+    doc = parse_html(html, LISTING_STRAINER)
+
+    for el in doc.select("a.posting-title"):
+        title = el.select_one("h5").text(strip=True)
+        location = el.find_next("span.sort-by-location").text().strip()
+        link = board_url + el.get("href")
+        jobs.append({
+            "title": title,
+            "company": company_slug(board_url),
+            "location": location,
+            "url": link,
+            "description": "",
+            "source": "lever"
+        })
+    return jobs
+
+
+async def fetch_api_jobs_async(board_url, fetcher):
+    company = company_slug(board_url)
+    if not company:
+        raise ValueError(f"No Lever company in {board_url}")
+    region = ".eu" if urlsplit(board_url).netloc.startswith("jobs.eu.") else ""
+    response = await fetcher.get(API_URL.format(region=region, company=company), board=True)
+    response.raise_for_status()
+    return fetcher.parse_once(response, "lever_api", parse_api_jobs, board_url, response.content, version=PARSER_VERSION)
+
+
+async def fetch_jobs_async(board_url, fetcher):
+    # The postings API includes full descriptions; HTML is the fallback
+    try:
+        return await fetch_api_jobs_async(board_url, fetcher)
+    except Exception as e:
+        print(f"[Lever] API unavailable for {board_url}, falling back to HTML: {e}")
+
     try:
-        response = requests.get(board_url)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        for el in soup.find_all("a", class_="posting-title"):
-            title = el.find("h5").get_text(strip=True)
-            location = el.find_next("span", class_="sort-by-location").text.strip()
-            link = board_url + el["href"]
-            jobs.append({
-                "title": title,
-                "company": board_url.split("//")[1].split(".")[0],
-                "location": location,
-                "url": link,
-                "description": "",
-                "source": "lever"
-            })
+        response = await fetcher.get(board_url, board=True)
+        return fetcher.parse_once(response, "lever", parse_jobs, board_url, response_markup(response), version=PARSER_VERSION)
     except Exception as e:
         print(f"[Lever Error] {e}")
-    return jobs
+    return []
+
+
+def fetch_jobs(board_url):
+    return fetch_with_new_fetcher(fetch_jobs_async, board_url)
+
+
+register(
+    "lever",
+    fetch_jobs_async,
+    hosts=[r"^jobs\.(eu\.)?lever\.co$"],
+    fingerprints=[rb"(?P<board>https://jobs\.(?:eu\.)?lever\.co/[\w.-]+)"],
+    board_url=board_url
+)
@@ -0,0 +1,90 @@
+# scrapers/parser_benchmark.py
+"""
+Parser micro-benchmark over saved fixture pages.
+
+Each fixture is named after the scraper that parses it (greenhouse.html,
+lever_board.html, ...). Every page is parsed the old way (html.parser, full
+tree, decoded text) and the new way (fast backend, partial tree, raw bytes);
+results must match and the per-scraper speedup is printed.
+
+    python -m scrapers.parser_benchmark [fixture_dir] [--repeat N]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+from scrapers import parsing
+from scrapers import greenhouse_scraper, lever_scraper, icims_scraper, custom_scraper
+
+FIXTURE_DIR = Path("tests") / "fixtures" / "pages"
+BOARD_URLS = {
+    "greenhouse": "https://boards.greenhouse.io/acme",
+    "lever": "https://jobs.lever.co/acme",
+    "icims": "https://careers-acme.icims.com/jobs/search",
+    "custom": "https://careers.acme.com/job/1",
+}
+PARSERS = {
+    "greenhouse": greenhouse_scraper.parse_jobs,
+    "lever": lever_scraper.parse_jobs,
+    "icims": icims_scraper.parse_jobs,
+    "custom": custom_scraper.parse_jobs,
+}
+
+
+def time_parse(parse_fn, url, body, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = parse_fn(url, body)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def benchmark_fixture(path, repeat=20):
+    scraper = path.stem.split("_")[0]
+    parse_fn, url = PARSERS[scraper], BOARD_URLS[scraper]
+    raw = path.read_bytes()
+
+    with parsing.parser_settings(backend="html.parser", partial=False):
+        legacy_time, legacy_jobs = time_parse(parse_fn, url, raw.decode("utf-8"), repeat)
+    with parsing.parser_settings():
+        fast_time, fast_jobs = time_parse(parse_fn, url, raw, repeat)
+
+    return {
+        "scraper": scraper,
+        "fixture": path.name,
+        "bytes": len(raw),
+        "postings": len(fast_jobs),
+        "legacy_ms": legacy_time * 1000,
+        "fast_ms": fast_time * 1000,
+        "speedup": legacy_time / fast_time if fast_time else float("inf"),
+        "identical": legacy_jobs == fast_jobs,
+    }
+
+
+def run_benchmark(fixture_dir=FIXTURE_DIR, repeat=20):
+    fixtures = sorted(p for p in Path(fixture_dir).glob("*.html") if p.stem.split("_")[0] in PARSERS)
+    return [benchmark_fixture(path, repeat) for path in fixtures]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scraper HTML parsing")
+    parser.add_argument("fixture_dir", nargs="?", default=str(FIXTURE_DIR))
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.fixture_dir, args.repeat)
+    if not results:
+        print(f"[Benchmark] No fixtures found in {args.fixture_dir}")
+        return 1
+
+    print(f"Backend: {parsing.PARSER_BACKEND}")
+    print(f"{'fixture':<20}{'KB':>8}{'jobs':>6}{'legacy ms':>11}{'fast ms':>9}{'speedup':>9}  same")
+    for r in results:
+        print(f"{r['fixture']:<20}{r['bytes'] / 1024:>8.1f}{r['postings']:>6}{r['legacy_ms']:>11.2f}"
+              f"{r['fast_ms']:>9.2f}{r['speedup']:>8.1f}x  {'yes' if r['identical'] else 'NO'}")
+    return 0 if all(r["identical"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+# scrapers/parsing.py
+"""
+HTML parsing layer shared by the scrapers.
+
+Scrapers parse through parse_html(), which returns a small backend-neutral
+node API (select / select_one / find_next / text / get):
+
+- "lxml": native lxml.html tree queried with CSS selectors. Parses raw
+  response bytes directly and skips BeautifulSoup's Python-level tree.
+- "html.parser": BeautifulSoup fallback when lxml isn't installed. A
+  SoupStrainer limits the tree to the subtrees the scraper reads.
+"""
+
+import os
+import re
+import codecs
+import html as html_lib
+from contextlib import contextmanager
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+    from cssselect import HTMLTranslator
+    DEFAULT_BACKEND = "lxml"
+except ImportError:
+    DEFAULT_BACKEND = "html.parser"
+
+# Override with SCRAPER_PARSER=html.parser to compare or work around a bad page
+PARSER_BACKEND = os.getenv("SCRAPER_PARSER", DEFAULT_BACKEND)
+PARTIAL_PARSING = os.getenv("SCRAPER_PARTIAL_PARSE", "1") != "0"
+
+META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+SKIPPED_TEXT_TAGS = {"script", "style", "template"}
+
+# Common containers for the posting body on career sites, most specific first
+DESCRIPTION_SELECTORS = [
+    "[data-qa=job-description]",
+    ".job__description",
+    ".job-description",
+    "#job-description",
+    "#jobDescription",
+    "[itemprop=description]",
+    "#content",
+    "article",
+    "main",
+]
+NOISE_TAGS = ["script", "style", "noscript", "nav", "header", "footer", "form"]
+
+
+def join_strings(strings, separator="", strip=False):
+    # Same rules as BeautifulSoup.get_text()
+    if strip:
+        strings = (s.strip() for s in strings)
+        strings = (s for s in strings if s)
+    return separator.join(strings)
+
+
+class LxmlNode:
+    _selectors = {}
+    _following = {}
+
+    def __init__(self, element):
+        self.element = element
+
+    @classmethod
+    def _compiled(cls, css):
+        if css not in cls._selectors:
+            cls._selectors[css] = CSSSelector(css)
+        return cls._selectors[css]
+
+    def select(self, css):
+        return [LxmlNode(el) for el in self._compiled(css)(self.element)]
+
+    def select_one(self, css):
+        matches = self._compiled(css)(self.element)
+        return LxmlNode(matches[0]) if matches else None
+
+    def find_next(self, css):
+        """First element matching `css` after this one in document order (descendants included)."""
+        if css not in self._following:
+            # Descendants come before following nodes, so try them first
+            translator = HTMLTranslator()
+            self._following[css] = [
+                lxml.etree.XPath(f"({translator.css_to_xpath(css, prefix=axis)})[1]")
+                for axis in ("descendant::", "following::")
+            ]
+        for xpath in self._following[css]:
+            matches = xpath(self.element)
+            if matches:
+                return LxmlNode(matches[0])
+        return None
+
+    def _strings(self, element, is_root=True):
+        if isinstance(element.tag, str) and element.tag not in SKIPPED_TEXT_TAGS:
+            if element.text:
+                yield element.text
+            for child in element:
+                yield from self._strings(child, is_root=False)
+        if not is_root and element.tail:
+            yield element.tail
+
+    def text(self, separator="", strip=False):
+        return join_strings(self._strings(self.element), separator, strip)
+
+    def get(self, attr, default=None):
+        return self.element.get(attr, default)
+
+
+class SoupNode:
+    def __init__(self, tag):
+        self.tag = tag
+
+    def select(self, css):
+        return [SoupNode(tag) for tag in self.tag.select(css)]
+
+    def select_one(self, css):
+        tag = self.tag.select_one(css)
+        return SoupNode(tag) if tag is not None else None
+
+    def find_next(self, css):
+        for tag in self.tag.next_elements:
+            if isinstance(tag, Tag) and soupsieve.match(css, tag):
+                return SoupNode(tag)
+        return None
+
+    def text(self, separator="", strip=False):
+        return self.tag.get_text(separator, strip=strip)
+
+    def get(self, attr, default=None):
+        return self.tag.get(attr, default)
+
+
+def declared_charset(markup):
+    """Charset from a <meta> tag in the first 2 KB, if it names a codec Python knows."""
+    match = META_CHARSET.search(markup[:2048])
+    if not match:
+        return "utf-8"
+    charset = match.group(1).decode("ascii")
+    try:
+        codecs.lookup(charset)
+        return charset
+    except LookupError:
+        # Unknown name: let the parser detect the encoding itself
+        return None
+
+
+class Markup(bytes):
+    """Raw page bytes plus the charset the server declared for them, if any."""
+    encoding = None
+
+
+def response_markup(response):
+    """
+    The body to hand to the HTML parsers: the raw bytes, carrying the charset
+    from the Content-Type header when the server sent one, so the parser
+    decodes in C with it (it overrides any <meta> charset, as in browsers).
+    """
+    markup = Markup(response.content)
+    charset = response.charset_encoding
+    if charset:
+        try:
+            codecs.lookup(charset)
+            markup.encoding = charset
+        except LookupError:
+            pass
+    return markup
+
+
+def parse_html(markup, only=None, backend=None):
+    """
+    Parse a page (raw bytes or str) into a node supporting select/text/get.
+
+    `only` is a SoupStrainer used by the BeautifulSoup backend to build just
+    the subtrees a scraper reads; lxml builds its whole tree in C faster than
+    BeautifulSoup builds a strained one, so it ignores it.
+    """
+    backend = backend or PARSER_BACKEND
+    if backend == "lxml":
+        if isinstance(markup, bytes):
+            parser = lxml.html.HTMLParser(encoding=getattr(markup, "encoding", None) or declared_charset(markup))
+        else:
+            parser = lxml.html.HTMLParser()
+        if not markup.strip():
+            markup = "<html></html>"
+        return LxmlNode(lxml.html.document_fromstring(markup, parser=parser))
+    return SoupNode(make_soup(markup, only, backend))
+
+
+def make_soup(markup, only=None, backend=None):
+    """
+    Build a BeautifulSoup tree for code that needs bs4 itself (tree edits,
+    find_all heuristics). Uses the lxml tree builder when available.
+    """
+    if not PARTIAL_PARSING:
+        only = None
+    if only is not None and not isinstance(only, SoupStrainer):
+        only = SoupStrainer(**only) if isinstance(only, dict) else SoupStrainer(only)
+    # Without a header charset, bs4 sniffs bytes (BOM, <meta>, chardet) itself
+    from_encoding = getattr(markup, "encoding", None)
+    return BeautifulSoup(markup, backend or PARSER_BACKEND, parse_only=only, from_encoding=from_encoding)
+
+
+@contextmanager
+def parser_settings(backend=None, partial=None):
+    """Temporarily switch backend / partial parsing (used by the parser benchmark)."""
+    global PARSER_BACKEND, PARTIAL_PARSING
+    saved = PARSER_BACKEND, PARTIAL_PARSING
+    if backend is not None:
+        PARSER_BACKEND = backend
+    if partial is not None:
+        PARTIAL_PARSING = partial
+    try:
+        yield
+    finally:
+        PARSER_BACKEND, PARTIAL_PARSING = saved
+
+
+def html_to_text(markup, escaped=False):
+    """Flatten an HTML fragment (optionally entity-escaped, as Greenhouse sends it) to plain text."""
+    if not markup:
+        return ""
+    if escaped:
+        markup = html_lib.unescape(markup)
+    return parse_html(markup).text(" ", strip=True)
+
+
+def extract_main_text(html, selectors=DESCRIPTION_SELECTORS):
+    """
+    Return the text of the main description block of a job page: the first
+    matching selector, otherwise the container holding the most paragraph
+    and list-item text.
+    """
+    soup = make_soup(html)
+    for tag in soup(NOISE_TAGS):
+        tag.decompose()
+
+    for selector in selectors:
+        block = soup.select_one(selector)
+        if block:
+            text = block.get_text("\n", strip=True)
+            if text:
+                return text
+
+    best, best_size = None, 0
+    for block in soup.find_all(["div", "section"]):
+        size = sum(len(p.get_text(strip=True)) for p in block.find_all(["p", "li"], recursive=False))
+        if size > best_size:
+            best, best_size = block, size
+    if best is not None:
+        return best.get_text("\n", strip=True)
+    return soup.body.get_text("\n", strip=True) if soup.body else ""
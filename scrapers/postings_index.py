@@ -0,0 +1,157 @@
+# scrapers/postings_index.py
+
+import os
+import json
+from datetime import datetime
+
+from scrapers.url_utils import canonicalize_url
+from utils.disk_cache import cache_dir, sha256_text, FileLock
+
+
+def posting_content_hash(job):
+    fields = [job.get(name, "") for name in ("title", "company", "location", "description")]
+    return sha256_text(json.dumps(fields, ensure_ascii=False))
+
+
+class PostingsIndex:
+    """
+    Persistent record of every posting we have seen, keyed by canonical URL.
+
+    Each record keeps first_seen / last_seen / last_changed timestamps, the
+    content hash of the posting and whether it is still open. Use it as a
+    context manager: the index is loaded under a file lock and saved on exit.
+
+    Long streaming scrapes instead call load(), observe without holding the
+    lock, and commit() at the end, which merges only the records they
+    touched into the file as it is then.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(cache_dir("postings"), "index.json")
+        self.postings = {}
+        self._lock = FileLock(self.path + ".lock")
+        self._seen = set()
+        self._boards = set()
+        self._dirty = set()
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self):
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.postings, f)
+        os.replace(tmp_path, self.path)
+
+    def __enter__(self):
+        self._lock.__enter__()
+        self.postings = self._read()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._write()
+        finally:
+            self._lock.__exit__(exc_type, exc, tb)
+
+    def load(self):
+        """Snapshot the index without locking it (see commit())."""
+        self.postings = self._read()
+        self._dirty = set()
+        return self
+
+    def commit(self):
+        """Merge the records changed since load() into the current file, under the lock."""
+        with self._lock:
+            changed = {key: self.postings[key] for key in self._dirty}
+            self.postings = self._read()
+            self.postings.update(changed)
+            self._write()
+        self._dirty = set()
+
+    def observe(self, jobs, now=None, partial_boards=()):
+        """
+        Record one full scrape and return only the postings that are new,
+        changed or re-opened since the last cycle, each tagged with
+        `posting_status`. Open postings missing from a board that did return
+        results this cycle are marked closed; boards that returned nothing, or
+        are listed in `partial_boards`, are treated as failed, not emptied.
+        """
+        fresh = [job for job in jobs if self.observe_one(job, now)]
+        self.close_missing(now, partial_boards)
+        return fresh
+
+    def observe_one(self, job, now=None):
+        """
+        Streaming form of observe(): record a single posting as it is scraped
+        and return True if it is new, changed or re-opened. Call
+        close_missing() once the scrape is complete.
+        """
+        now = (now or datetime.now()).isoformat(timespec="seconds")
+        key = canonicalize_url(job.get("url", ""))
+        if not key or key in self._seen:
+            return False
+        self._seen.add(key)
+        self._boards.add(job.get("board"))
+        self._dirty.add(key)
+        content_hash = posting_content_hash(job)
+        record = self.postings.get(key)
+
+        if record is None:
+            self.postings[key] = {
+                "board": job.get("board"),
+                "title": job.get("title"),
+                "company": job.get("company"),
+                "content_hash": content_hash,
+                "first_seen": now,
+                "last_seen": now,
+                "last_changed": now,
+                "status": "open"
+            }
+            job["posting_status"] = "new"
+            return True
+
+        record["last_seen"] = now
+        if record["content_hash"] != content_hash or record["status"] != "open":
+            job["posting_status"] = "changed" if record["status"] == "open" else "reopened"
+            record.update({
+                "title": job.get("title"),
+                "content_hash": content_hash,
+                "last_changed": now,
+                "status": "open"
+            })
+            record.pop("closed_at", None)
+            return True
+        return False
+
+    def close_missing(self, now=None, partial_boards=()):
+        """
+        Close open postings of every board seen this scrape that no longer
+        list them, except on boards in `partial_boards` (some pages failed).
+        """
+        now = (now or datetime.now()).isoformat(timespec="seconds")
+        boards = self._boards.difference(partial_boards)
+        for key, record in self.postings.items():
+            if record["status"] == "open" and record.get("board") in boards and key not in self._seen:
+                record["status"] = "closed"
+                record["closed_at"] = now
+                self._dirty.add(key)
+        self._seen, self._boards = set(), set()
+
+    def requeue(self, url):
+        """Forget a posting's content hash so the next cycle emits it again (e.g. after a failed apply)."""
+        record = self.postings.get(canonicalize_url(url))
+        if record:
+            record["content_hash"] = None
+            self._dirty.add(canonicalize_url(url))
+
+
+def requeue_postings(urls):
+    with PostingsIndex() as index:
+        for url in urls:
+            index.requeue(url)
@@ -0,0 +1,89 @@
+# scrapers/rate_limit.py
+
+import time
+import random
+import asyncio
+from email.utils import parsedate_to_datetime
+
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, bursts of up to `capacity`.
+
+    acquire() waits only as long as needed for the next token, so callers
+    run back-to-back while under budget instead of sleeping a fixed time.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens=1):
+        while True:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return
+            await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """
+    TokenBucket whose rate follows what the host tolerates (AIMD): every
+    success raises it by `increase` up to `max_rate`, every throttling
+    response (429 / 503) halves it down to `min_rate` and empties the bucket
+    so requests already waiting back off too.
+    """
+
+    def __init__(self, rate, min_rate, max_rate, increase=0.1):
+        super().__init__(rate, capacity=max(1.0, rate))
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.increase = float(increase)
+
+    def _set_rate(self, rate):
+        self._refill()
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+        self.capacity = max(1.0, self.rate)
+        self.tokens = min(self.tokens, self.capacity)
+
+    def on_success(self):
+        if self.rate < self.max_rate:
+            self._set_rate(self.rate + self.increase)
+
+    def on_throttle(self):
+        self._set_rate(self.rate / 2)
+        self.tokens = 0.0
+
+
+def retry_after_seconds(value):
+    """Parse a Retry-After header (delta seconds or HTTP date); None if absent or invalid."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base, cap, retry_after=None):
+    """
+    Delay before retry number `attempt` (0-based): full-jitter exponential
+    backoff, random in [0, min(cap, base * 2^attempt)]. A server-sent
+    Retry-After is honored as a lower bound.
+    """
+    delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
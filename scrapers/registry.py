@@ -0,0 +1,154 @@
+# scrapers/registry.py
+"""
+Scraper plugin registry.
+
+Each platform module registers itself with host patterns (matched against
+the URL's host) and page fingerprints (byte regexes matched against the
+page body, e.g. Workday's /wday/cxs/ endpoints or iCIMS job tables). A
+source is resolved to the plugin that can fetch its whole board in bulk,
+falling back to the one-page custom scraper only when nothing matches.
+Detection results are cached per domain.
+"""
+
+import os
+import re
+import time
+import importlib
+from urllib.parse import urlsplit
+
+from utils.disk_cache import JsonDiskCache
+
+PLUGIN_MODULES = [
+    "scrapers.greenhouse_scraper",
+    "scrapers.lever_scraper",
+    "scrapers.workday_scraper",
+    "scrapers.icims_scraper",
+    "scrapers.eightfold_scraper",
+    "scrapers.custom_scraper",
+]
+FALLBACK_PLUGIN = "custom"
+DETECTION_TTL = float(os.getenv("SCRAPER_DETECTION_TTL", str(7 * 24 * 3600)))
+
+_plugins = {}
+_detection_cache = JsonDiskCache("scraper_detection")
+
+
+class PartialBoardError(Exception):
+    """
+    Raised by a plugin's iterate() at the end of a board some of whose pages
+    failed, after yielding everything it did get, so the board's missing
+    postings are not taken as closed.
+    """
+
+
+class ScraperPlugin:
+    """
+    fetch(board_url, fetcher) -> list of jobs; iterate(board_url, fetcher) is
+    an optional streaming variant. board_url(url) maps any URL on a matching
+    host (often a single job page) to the list-level board URL.
+    Fingerprints may capture the board URL from a page embedding the ATS.
+    """
+
+    def __init__(self, name, fetch, hosts=(), fingerprints=(), board_url=None, iterate=None):
+        self.name = name
+        self.fetch = fetch
+        self.iterate = iterate
+        self.hosts = [re.compile(pattern, re.IGNORECASE) for pattern in hosts]
+        self.fingerprints = [re.compile(pattern, re.IGNORECASE) for pattern in fingerprints]
+        self._board_url = board_url
+
+    def matches_host(self, host):
+        return any(pattern.search(host) for pattern in self.hosts)
+
+    def match_page(self, body):
+        """Return (matched, board URL captured from the page or None)."""
+        for pattern in self.fingerprints:
+            match = pattern.search(body)
+            if match:
+                captured = match.groupdict().get("board")
+                return True, captured.decode("utf-8", "ignore") if captured else None
+        return False, None
+
+    def board_url(self, url):
+        return self._board_url(url) if self._board_url else url
+
+
+def register(name, fetch, hosts=(), fingerprints=(), board_url=None, iterate=None):
+    _plugins[name] = ScraperPlugin(name, fetch, hosts, fingerprints, board_url, iterate)
+    return _plugins[name]
+
+
+def load_plugins():
+    for module in PLUGIN_MODULES:
+        importlib.import_module(module)
+    return _plugins
+
+
+def get_plugin(name):
+    return load_plugins().get((name or "").lower())
+
+
+def _cached_detection(host):
+    entry = _detection_cache.get(host)
+    if entry and time.time() - entry.get("checked_at", 0) < DETECTION_TTL:
+        return entry
+    return None
+
+
+async def resolve_source(url, fetcher, platform=None):
+    """
+    Find the plugin for a source URL and the board URL it should fetch.
+
+    Order: an explicit (registered, non-fallback) platform from the config,
+    host patterns, the per-domain detection cache, then page fingerprints.
+    Returns (plugin, board_url).
+    """
+    plugins = load_plugins()
+    host = urlsplit(url).netloc.lower()
+
+    hinted = plugins.get((platform or "").lower())
+    if hinted is not None and hinted.name != FALLBACK_PLUGIN:
+        return hinted, hinted.board_url(url)
+
+    for plugin in plugins.values():
+        if plugin.matches_host(host):
+            return plugin, plugin.board_url(url)
+
+    cached = _cached_detection(host)
+    if cached is not None and cached["platform"] in plugins:
+        plugin = plugins[cached["platform"]]
+        return plugin, cached.get("board") or plugin.board_url(url)
+
+    plugin, board = plugins[FALLBACK_PLUGIN], None
+    try:
+        response = await fetcher.get(url)
+        for candidate in plugins.values():
+            matched, board = candidate.match_page(response.content)
+            if matched:
+                plugin = candidate
+                break
+    except Exception as e:
+        print(f"[Registry] Could not fingerprint {url}: {e}")
+        return plugin, url
+
+    board = plugin.board_url(board or url)
+    # Only domain-wide boards are worth caching; custom pages stay per URL
+    _detection_cache.set(host, {
+        "platform": plugin.name,
+        "board": board if plugin.name != FALLBACK_PLUGIN else None,
+        "checked_at": time.time()
+    })
+    print(f"[Registry] {host} detected as {plugin.name}")
+    return plugin, board
+
+
+async def iter_board_async(plugin, board_url, fetcher):
+    """Stream a board through its plugin, tagging every job with the board it came from."""
+    if plugin.iterate is not None:
+        async for job in plugin.iterate(board_url, fetcher):
+            job.setdefault("board", board_url)
+            yield job
+        return
+    for job in await plugin.fetch(board_url, fetcher):
+        job.setdefault("board", board_url)
+        yield job
@@ -0,0 +1,302 @@
+# scrapers/replay.py
+"""
+Offline record / replay harness for the scraping layer.
+
+    SCRAPER_RECORD=archive.json.gz    every AsyncFetcher records the responses it gets
+    SCRAPER_REPLAY=archive.json.gz    every AsyncFetcher is served from the archive
+    SCRAPER_REPLAY_SERVER=http://127.0.0.1:8765
+                                      every AsyncFetcher talks to a local replay server
+
+With any of these set, fetchers skip the HTTP cache and circuit breakers,
+and on-disk state (postings index, host rates, ...) lives under
+<APP_CACHE_DIR>/replay instead of the live cache.
+
+    python -m scrapers.replay record archive.json.gz [--enrich]
+    python -m scrapers.replay serve archive.json.gz [--port 8765]
+    python -m scrapers.replay bench archive.json.gz [--server] [--enrich] [--repeat N]
+
+An archive is a gzipped JSON map of "METHOD URL body-hash" -> response
+(status, headers, base64 body). `bench` scrapes every configured source
+from an archive and reports postings/sec, bytes parsed and parse time per
+parser, so scraping regressions show up without touching the network.
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import base64
+import asyncio
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import httpx
+from utils.disk_cache import sha256_bytes
+
+# Recorded bodies are stored decoded, so these no longer describe them
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+# Recording always fetches full bodies so every entry can be replayed on its own
+CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+MISS_HEADER = "X-Replay-Miss"
+
+
+def request_key(method, url, content):
+    return f"{method} {url} {sha256_bytes(content or b'')}"
+
+
+class ReplayArchive:
+    def __init__(self, path, entries=None):
+        self.path = path
+        self.entries = entries if entries is not None else {}
+        self.misses = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return cls(path, json.load(f).get("entries", {}))
+        except FileNotFoundError:
+            return cls(path)
+
+    def save(self):
+        # Merge with what other fetchers of this run already wrote
+        entries = {**ReplayArchive.load(self.path).entries, **self.entries}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"entries": entries}, f)
+        os.replace(tmp_path, self.path)
+        print(f"[Replay] Saved {len(entries)} responses to {self.path}")
+
+    def record(self, method, url, content, status, headers, body):
+        with self._lock:
+            self.entries[request_key(method, url, content)] = {
+                "url": url,
+                "status": status,
+                "headers": {k: v for k, v in headers.items() if k.lower() not in DROPPED_HEADERS},
+                "content": base64.b64encode(body).decode("ascii")
+            }
+
+    def lookup(self, method, url, content):
+        """(status, headers, body) for a request; an empty 404 marked with MISS_HEADER if it wasn't recorded."""
+        entry = self.entries.get(request_key(method, url, content))
+        if entry is None:
+            with self._lock:
+                self.misses.append(f"{method} {url}")
+            print(f"[Replay] Not in archive: {method} {url}")
+            return 404, {MISS_HEADER: "1"}, b""
+        return entry["status"], entry["headers"], base64.b64decode(entry["content"])
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Passes requests to the network and records every response; the archive is saved on close."""
+
+    def __init__(self, archive, inner=None):
+        self.archive = archive
+        self.inner = inner or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request):
+        for header in CONDITIONAL_HEADERS:
+            request.headers.pop(header, None)
+        response = await self.inner.handle_async_request(request)
+        body = await response.aread()
+        self.archive.record(request.method, str(request.url), request.content,
+                            response.status_code, response.headers, body)
+        return httpx.Response(response.status_code, headers=response.headers, content=body, request=request)
+
+    async def aclose(self):
+        await self.inner.aclose()
+        self.archive.save()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answers requests from an archive, in process."""
+
+    def __init__(self, archive):
+        self.archive = archive
+
+    async def handle_async_request(self, request):
+        status, headers, body = self.archive.lookup(request.method, str(request.url), request.content)
+        return httpx.Response(status, headers=headers, content=body, request=request)
+
+
+def server_path(url):
+    """https://host/path?q -> /https/host/path?q, the form the replay server expects."""
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"/{parts.scheme}/{parts.netloc}{parts.path or '/'}{query}"
+
+
+class ServerTransport(httpx.AsyncBaseTransport):
+    """Sends every request to a local ReplayServer instead of the real host."""
+
+    def __init__(self, server_url):
+        self.server_url = server_url.rstrip("/")
+        self.inner = httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request):
+        headers = [(k, v) for k, v in request.headers.raw if k.lower() != b"host"]
+        local = httpx.Request(request.method, self.server_url + server_path(str(request.url)),
+                              headers=headers, content=request.content)
+        response = await self.inner.handle_async_request(local)
+        body = await response.aread()
+        return httpx.Response(response.status_code, headers=response.headers, content=body, request=request)
+
+    async def aclose(self):
+        await self.inner.aclose()
+
+
+class ReplayServer:
+    """Local HTTP server replaying an archive; paths are /<scheme>/<host>/<path>."""
+
+    def __init__(self, archive, host="127.0.0.1", port=0):
+        archive_ = archive
+
+        class Handler(BaseHTTPRequestHandler):
+            def _replay(self):
+                scheme, _, rest = self.path.lstrip("/").partition("/")
+                length = int(self.headers.get("Content-Length") or 0)
+                content = self.rfile.read(length) if length else b""
+                status, headers, body = archive_.lookup(self.command, f"{scheme}://{rest}", content)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_HEAD = _replay
+
+            def log_message(self, *args):
+                pass
+
+        self.archive = archive
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def transport_from_env():
+    """Transport selected by SCRAPER_RECORD / SCRAPER_REPLAY / SCRAPER_REPLAY_SERVER, or None for the network."""
+    if os.getenv("SCRAPER_REPLAY_SERVER"):
+        return ServerTransport(os.environ["SCRAPER_REPLAY_SERVER"])
+    if os.getenv("SCRAPER_REPLAY"):
+        return ReplayTransport(ReplayArchive.load(os.environ["SCRAPER_REPLAY"]))
+    if os.getenv("SCRAPER_RECORD"):
+        return RecordingTransport(ReplayArchive(os.environ["SCRAPER_RECORD"]))
+    return None
+
+
+async def scrape_async(transport, enrich=False):
+    """One offline-comparable scrape of every configured source; returns (jobs, fetcher)."""
+    from scrapers import registry
+    from scrapers.async_fetcher import AsyncFetcher
+    from scrapers.enrichment import iter_enriched_async
+    from scrapers.universal_scraper import iter_all_jobs_async
+
+    # Detect platforms from the pages every time so the archive holds those requests too
+    detection_ttl, registry.DETECTION_TTL = registry.DETECTION_TTL, 0
+    try:
+        async with AsyncFetcher(transport=transport, cache=False, breaker=False, retries=0) as fetcher:
+            jobs = iter_all_jobs_async(fetcher)
+            if enrich:
+                jobs = iter_enriched_async(jobs, fetcher)
+            return [job async for job in jobs], fetcher
+    finally:
+        registry.DETECTION_TTL = detection_ttl
+
+
+def run_bench(archive_path, use_server=False, enrich=False, repeat=1):
+    archive = ReplayArchive.load(archive_path)
+    if not archive.entries:
+        raise FileNotFoundError(f"No recorded responses in {archive_path}")
+
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if use_server:
+            with ReplayServer(archive) as server:
+                jobs, fetcher = asyncio.run(scrape_async(ServerTransport(server.url), enrich))
+        else:
+            jobs, fetcher = asyncio.run(scrape_async(ReplayTransport(archive), enrich))
+        runs.append((time.perf_counter() - start, jobs, fetcher.parse_stats))
+
+    elapsed, jobs, parse_stats = min(runs, key=lambda run: run[0])
+    postings = {}
+    for job in jobs:
+        source = job.get("source", "custom")
+        postings[source] = postings.get(source, 0) + 1
+    return {
+        "seconds": elapsed,
+        "postings": len(jobs),
+        "postings_per_sec": len(jobs) / elapsed if elapsed else float("inf"),
+        "bytes_parsed": sum(stat["bytes"] for stat in parse_stats.values()),
+        "by_source": postings,
+        "parsers": parse_stats,
+        "misses": len(archive.misses) // repeat,
+    }
+
+
+def print_report(report):
+    print(f"Postings: {report['postings']} in {report['seconds']:.2f}s "
+          f"({report['postings_per_sec']:.0f}/s), {report['bytes_parsed'] / 1024:.0f} KB parsed, "
+          f"{report['misses']} archive misses")
+    print(f"{'parser':<18}{'calls':>7}{'KB':>10}{'parse ms':>10}{'ms/call':>9}")
+    for name, stat in sorted(report["parsers"].items()):
+        print(f"{name:<18}{stat['calls']:>7}{stat['bytes'] / 1024:>10.1f}{stat['seconds'] * 1000:>10.1f}"
+              f"{stat['seconds'] * 1000 / stat['calls']:>9.2f}")
+    print("Postings by source: " + ", ".join(f"{k}={v}" for k, v in sorted(report["by_source"].items())))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record, serve and benchmark scraper responses offline")
+    sub = parser.add_subparsers(dest="command", required=True)
+    record = sub.add_parser("record", help="scrape every configured source live and archive the responses")
+    serve = sub.add_parser("serve", help="serve an archive from a local HTTP server")
+    bench = sub.add_parser("bench", help="scrape every configured source from an archive and report timings")
+    for command in (record, serve, bench):
+        command.add_argument("archive")
+    for command in (record, bench):
+        command.add_argument("--enrich", action="store_true", help="include detail-page fetches")
+    serve.add_argument("--port", type=int, default=8765)
+    bench.add_argument("--server", action="store_true", help="replay through a local server instead of in process")
+    bench.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        jobs, _ = asyncio.run(scrape_async(RecordingTransport(ReplayArchive(args.archive)), args.enrich))
+        print(f"[Replay] Recorded a scrape of {len(jobs)} postings.")
+    elif args.command == "serve":
+        server = ReplayServer(ReplayArchive.load(args.archive), port=args.port)
+        print(f"[Replay] Serving {len(server.archive.entries)} responses at {server.url} "
+              f"(set SCRAPER_REPLAY_SERVER={server.url})")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            server.stop()
+    else:
+        print_report(run_bench(args.archive, args.server, args.enrich, args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+# scrapers/streams.py
+"""
+Small async-iterator helpers for the streaming job pipeline
+(scrape -> enrich -> score -> apply).
+"""
+
+import asyncio
+
+_DONE = object()
+
+
+async def iterate(coro):
+    """Turn a coroutine returning a list into an async iterator over it."""
+    for item in await coro:
+        yield item
+
+
+async def merge(iterators):
+    """
+    Yield items from several async iterators as soon as any of them produces
+    one. A failing iterator is logged and dropped; the others keep going.
+    """
+    queue = asyncio.Queue()
+
+    async def drain(iterator):
+        try:
+            async for item in iterator:
+                await queue.put(item)
+        except Exception as e:
+            print(f"[Stream Error] {e}")
+        finally:
+            await queue.put(_DONE)
+
+    tasks = [asyncio.create_task(drain(iterator)) for iterator in iterators]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is _DONE:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def map_unordered(iterator, fn):
+    """
+    Start `await fn(item)` for each item as it arrives and yield the results
+    in completion order. Concurrency is bounded by whatever `fn` awaits
+    (e.g. the fetcher's per-host semaphores). Failed items are logged and
+    dropped.
+    """
+    queue = asyncio.Queue()
+    state = {"started": 0, "fed_all": False}
+
+    async def run(item):
+        try:
+            await queue.put((True, await fn(item)))
+        except Exception as e:
+            print(f"[Stream Error] {e}")
+            await queue.put((False, None))
+
+    async def feed():
+        try:
+            async for item in iterator:
+                state["started"] += 1
+                tasks.add(asyncio.create_task(run(item)))
+        finally:
+            state["fed_all"] = True
+            await queue.put(_DONE)
+
+    tasks = set()
+    feeder = asyncio.create_task(feed())
+    received = 0
+    try:
+        while not (state["fed_all"] and received == state["started"]):
+            item = await queue.get()
+            if item is _DONE:
+                continue
+            received += 1
+            ok, result = item
+            if ok:
+                yield result
+        await feeder
+    finally:
+        feeder.cancel()
+        for task in tasks:
+            task.cancel()
+
+
+async def batched(iterator, size, max_wait):
+    """
+    Group items into lists of up to `size`, flushing early once `max_wait`
+    seconds have passed since the first item of the batch, so a slow source
+    never holds back items that already arrived.
+    """
+    queue = asyncio.Queue()
+
+    async def feed():
+        try:
+            async for item in iterator:
+                await queue.put(item)
+        finally:
+            await queue.put(_DONE)
+
+    feeder = asyncio.create_task(feed())
+    loop = asyncio.get_running_loop()
+    try:
+        batch, deadline, exhausted = [], None, False
+        while not exhausted:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                item = None
+            else:
+                if item is _DONE:
+                    exhausted = True
+                else:
+                    batch.append(item)
+                    deadline = deadline or loop.time() + max_wait
+
+            if batch and (exhausted or len(batch) >= size or loop.time() >= deadline):
+                yield batch
+                batch, deadline = [], None
+        await feeder
+    finally:
+        feeder.cancel()
+
+
+async def filter_batched(iterator, keep, size, max_wait, stats=None):
+    """
+    Yield the items of `iterator` that survive `await keep(batch)`, which gets
+    batches from batched() and returns the items to keep (e.g. one bulk DB
+    query per batch). Dropped items are counted into stats["skipped"].
+    """
+    async for batch in batched(iterator, size, max_wait):
+        kept = await keep(batch)
+        if stats is not None:
+            stats["skipped"] += len(batch) - len(kept)
+        for item in kept:
+            yield item
@@ -1,14 +1,16 @@
 # scrapers/universal_scraper.py
 
+import asyncio
 import yaml
 from pathlib import Path
 
+from configs.criteria_loader import load_criteria
+from scrapers.async_fetcher import AsyncFetcher, run_sync
+from scrapers.enrichment import passes_prefilter
+from scrapers.postings_index import PostingsIndex
+from scrapers.registry import resolve_source, iter_board_async
+from scrapers.streams import merge
 from scrapers.jobright_scraper import fetch_jobs as fetch_jobright
-from scrapers.greenhouse_scraper import fetch_jobs as fetch_greenhouse
-from scrapers.lever_scraper import fetch_jobs as fetch_lever
-from scrapers.workday_scraper import fetch_jobs as fetch_workday
-from scrapers.icims_scraper import fetch_jobs as fetch_icims
-from scrapers.custom_scraper import fetch_jobs as fetch_custom
 
 
 def load_job_sources():
@@ -16,34 +18,122 @@ def load_job_sources():
         return yaml.safe_load(f).get("sources", [])
 
 
-def fetch_all_jobs():
-    all_jobs = []
+async def resolve_boards_async(sources, fetcher):
+    """
+    Resolve every source to (plugin, board URL) and drop repeats, so several
+    job links on one ATS tenant cost one bulk board fetch instead of one
+    request per posting.
+    """
+    resolved = await asyncio.gather(*(
+        resolve_source(source.get("url"), fetcher, source.get("platform"))
+        for source in sources
+    ))
+    boards = {}
+    for source, (plugin, board_url) in zip(sources, resolved):
+        key = (plugin.name, board_url)
+        if key in boards:
+            continue
+        boards[key] = (source, plugin, board_url)
+        if plugin.name != (source.get("platform") or "").lower():
+            print(f"[Registry] {source.get('name')}: using {plugin.name} scraper for {board_url}")
+    if len(boards) < len(sources):
+        print(f"[Registry] {len(sources)} sources resolve to {len(boards)} boards.")
+    return list(boards.values())
+
+
+async def iter_source_async(source, fetcher, plugin=None, board_url=None, partial_boards=None):
+    """
+    Stream one source's board. A board that fails part-way is added to
+    `partial_boards`, so the postings it did not list are not closed.
+    """
+    if plugin is None:
+        plugin, board_url = await resolve_source(source.get("url"), fetcher, source.get("platform"))
+    try:
+        async for job in iter_board_async(plugin, board_url, fetcher):
+            yield job
+    except Exception as e:
+        print(f"[Error] Failed to fetch from {source.get('name')} ({plugin.name}): {e}")
+        if partial_boards is not None:
+            partial_boards.add(board_url)
+
+
+async def fetch_source_async(source, fetcher):
+    return [job async for job in iter_source_async(source, fetcher)]
+
+
+async def iter_jobright_async():
+    for job in await asyncio.to_thread(fetch_jobright):
+        job.setdefault("board", "jobright")
+        job.setdefault("source", "jobright")
+        yield job
+
+
+async def iter_all_jobs_async(fetcher=None, partial_boards=None):
+    """
+    Stream postings from every configured source over one shared connection
+    pool, yielding each as soon as its board returns it. Boards that failed
+    part-way are collected in `partial_boards` (see iter_source_async).
+    """
+    if fetcher is None:
+        async with AsyncFetcher() as fetcher:
+            async for job in iter_all_jobs_async(fetcher, partial_boards):
+                yield job
+        return
 
     # Jobright always
-    all_jobs.extend(fetch_jobright())
-
-    job_sources = load_job_sources()
-    for source in job_sources:
-        platform = source.get("platform", "").lower()
-        url = source.get("url")
-        name = source.get("name")
-
-        try:
-            if platform == "greenhouse":
-                jobs = fetch_greenhouse(url)
-            elif platform == "lever":
-                jobs = fetch_lever(url)
-            elif platform == "workday":
-                jobs = fetch_workday(url)
-            elif platform == "icims":
-                jobs = fetch_icims(url)
-            else:
-                print(f"[Fallback] Using custom scraper for: {name} ({platform})")
-                jobs = fetch_custom(url)
-            
-            all_jobs.extend(jobs)
-
-        except Exception as e:
-            print(f"[Error] Failed to fetch from {name} ({platform}): {e}")
-
-    return all_jobs
+    sources = [iter_jobright_async()]
+    boards = await resolve_boards_async(load_job_sources(), fetcher)
+    sources.extend(
+        iter_source_async(source, fetcher, plugin, board_url, partial_boards)
+        for source, plugin, board_url in boards
+    )
+    async for job in merge(sources):
+        yield job
+
+
+async def fetch_all_jobs_async(fetcher=None, partial_boards=None):
+    """Fetch every configured source concurrently and return the full list."""
+    return [job async for job in iter_all_jobs_async(fetcher, partial_boards)]
+
+
+def fetch_all_jobs(partial_boards=None):
+    return run_sync(fetch_all_jobs_async(partial_boards=partial_boards))
+
+
+async def iter_new_jobs_async(fetcher=None, criteria=None):
+    """
+    Streaming fetch_new_jobs: yields postings that are new or changed as soon
+    as they are scraped. Vanished postings are closed once the scrape ends.
+    """
+    criteria = criteria or load_criteria()
+    # The consumer may take minutes per posting (tailoring, applying), so
+    # the index is observed in memory and the file lock is only held to
+    # load and to commit; both happen off the event loop
+    index = await asyncio.to_thread(PostingsIndex().load)
+    total = fresh = 0
+    partial_boards = set()
+    async for job in iter_all_jobs_async(fetcher, partial_boards):
+        total += 1
+        # Postings the prefilter rejects stay out of the index, so they are
+        # emitted as new once changed criteria accept them
+        if passes_prefilter(job, criteria) and index.observe_one(job):
+            fresh += 1
+            yield job
+    index.close_missing(partial_boards=partial_boards)
+    await asyncio.to_thread(index.commit)
+    print(f"[Postings] {fresh} new or changed of {total} scraped.")
+
+
+def fetch_new_jobs(criteria=None):
+    """
+    Incremental variant of fetch_all_jobs: returns only postings that are new
+    or changed since the previous cycle (and pass the prefilter) and marks
+    vanished ones as closed.
+    """
+    criteria = criteria or load_criteria()
+    partial_boards = set()
+    jobs = fetch_all_jobs(partial_boards)
+    with PostingsIndex() as index:
+        fresh = index.observe([job for job in jobs if passes_prefilter(job, criteria)], partial_boards=partial_boards)
+    print(f"[Postings] {len(fresh)} new or changed of {len(jobs)} scraped.")
+    return fresh
@@ -0,0 +1,60 @@
+# scrapers/url_utils.py
+
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters known to only track where a click came from. Generic names
+# (source, ref, mode, ...) are kept: on some boards they select the posting.
+TRACKING_PARAMS = {"gh_src", "feedid", "iis", "iisn", "trk", "trackingid", "gclid", "fbclid"}
+TRACKING_PREFIXES = ("utm_", "lever-")
+
+
+def canonicalize_url(url):
+    """
+    Normalize a posting URL so the same job maps to one key: lowercase scheme
+    and host, no fragment, no tracking parameters (utm_*, lever-*, gh_src, ...),
+    sorted query, no trailing slash. Identifying parameters such as gh_jid are kept.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PREFIXES) and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+GREENHOUSE_JOB_PATH = re.compile(r"/jobs/(\d+)")
+LEVER_POSTING_PATH = re.compile(r"^/[^/]+/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})", re.IGNORECASE)
+
+
+def posting_identity(url):
+    """
+    ATS-level id of a posting, independent of the domain it is linked from:
+    a company site embedding Greenhouse (?gh_jid=123) and
+    boards.greenhouse.io/acme/jobs/123 both give "greenhouse:123".
+    Returns None for URLs without a recognizable ATS id.
+    """
+    if not url:
+        return None
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    params = dict(parse_qsl(parts.query))
+
+    if params.get("gh_jid", "").isdigit():
+        return f"greenhouse:{params['gh_jid']}"
+    if host.endswith("greenhouse.io"):
+        match = GREENHOUSE_JOB_PATH.search(parts.path)
+        return f"greenhouse:{match.group(1)}" if match else None
+    if host == "jobs.lever.co":
+        match = LEVER_POSTING_PATH.match(parts.path)
+        return f"lever:{match.group(1).lower()}" if match else None
+    if host.endswith("myworkdayjobs.com") and "/job/" in parts.path:
+        # .../job/<location>/<Title>_<requisition id>
+        requisition = parts.path.rstrip("/").rsplit("_", 1)
+        if len(requisition) == 2:
+            return f"workday:{host.split('.')[0]}:{requisition[1].lower()}"
+    return None
@@ -1,34 +1,259 @@
 # scrapers/workday_scraper.py
 
-import requests
+import os
+import re
+import json
+import time
+import asyncio
+from urllib.parse import urlsplit
 
-def fetch_jobs(api_url):
+from configs.criteria_loader import load_criteria
+from scrapers.async_fetcher import fetch_with_new_fetcher
+from scrapers.parsing import html_to_text
+from scrapers.registry import register, PartialBoardError
+from utils.disk_cache import JsonDiskCache
+
+# Workday's job search API refuses pages larger than 20
+PAGE_SIZE = 20
+MAX_PARALLEL_PAGES = 4
+LOCALE_SEGMENT = re.compile(r"^[a-z]{2}-[A-Z]{2}$")
+HEADERS = {"Content-Type": "application/json"}
+# Bump when the parsers below change their output (see AsyncFetcher.parse_once)
+PARSER_VERSION = 1
+
+# Country-level facets criteria locations may be pushed down to; city-level
+# `locations` facets are never used
+LOCATION_FACETS = ("locationCountry", "locationMainGroup")
+# Descriptors Workday tenants use for the same country
+US_NAMES = {"united states", "united states of america", "usa", "us"}
+UK_NAMES = {"united kingdom", "uk", "great britain"}
+COUNTRY_NAMES = {name: US_NAMES for name in US_NAMES}
+COUNTRY_NAMES.update({name: UK_NAMES for name in UK_NAMES})
+# Resolved facets are reused this long, so each cycle requests page 0 once
+FACET_TTL = float(os.getenv("WORKDAY_FACET_TTL", str(24 * 3600)))
+
+_facet_cache = JsonDiskCache("workday_facets")
+
+
+def to_api_url(url):
+    """
+    Map any Workday careers URL to its job-search endpoint, e.g.
+    https://acme.wd5.myworkdayjobs.com/en-US/External/job/... ->
+    https://acme.wd5.myworkdayjobs.com/wday/cxs/acme/External/jobs
+    """
+    parts = urlsplit(url)
+    if "/wday/cxs/" in parts.path:
+        return url
+    tenant = parts.netloc.split(".")[0]
+    segments = [seg for seg in parts.path.split("/") if seg and not LOCALE_SEGMENT.match(seg)]
+    site = segments[0] if segments else "External"
+    return f"https://{parts.netloc}/wday/cxs/{tenant}/{site}/jobs"
+
+
+def board_url(url):
+    """Job page or careers URL -> the site's landing page (one board per site)."""
+    api_url = to_api_url(url)
+    return posting_url(api_url, "")
+
+
+def posting_url(api_url, external_path):
+    parts = urlsplit(api_url)
+    site = parts.path.split("/wday/cxs/")[1].split("/")[1]
+    return f"https://{parts.netloc}/{site}{external_path}"
+
+
+def detail_api_url(job_url):
+    """
+    https://acme.wd5.myworkdayjobs.com/External/job/X/T_R1 ->
+    https://acme.wd5.myworkdayjobs.com/wday/cxs/acme/External/job/X/T_R1
+    """
+    parts = urlsplit(job_url)
+    tenant = parts.netloc.split(".")[0]
+    segments = [seg for seg in parts.path.split("/") if seg and not LOCALE_SEGMENT.match(seg)]
+    return f"https://{parts.netloc}/wday/cxs/{tenant}/{'/'.join(segments)}"
+
+
+def parse_description(body):
+    info = json.loads(body).get("jobPostingInfo", {})
+    return html_to_text(info.get("jobDescription", ""))
+
+
+def parse_jobs(api_url, data):
+    jobs = []
+    for item in data.get("jobPostings", []):
+        title = item["title"]
+        location = item.get("locationsText", "")
+        url = posting_url(api_url, item["externalPath"])
+        jobs.append({
+            "title": title,
+            "company": api_url.split("//")[1].split(".")[0],
+            "location": location,
+            "url": url,
+            "description": "",
+            "source": "workday"
+        })
+    return jobs
+
+
+def load_search_settings():
+    """Workday search options and target locations from configs/job_criteria.yaml."""
+    try:
+        criteria = load_criteria()
+    except (OSError, KeyError) as e:
+        print(f"[Workday] Could not load criteria, searching unfiltered: {e}")
+        return {}, []
+    return criteria.get("workday", {}) or {}, criteria.get("locations", [])
+
+
+def resolve_location_facets(facets, locations, facet_parameters=LOCATION_FACETS):
+    """
+    Translate criteria locations (e.g. "united states", "remote") into Workday
+    facet ids. Only one facet parameter is used, because Workday ANDs
+    different parameters together.
+
+    A location matches a facet value only when the descriptor is that exact
+    place (or a known name for it). The locations that do match are pushed
+    down, using the parameter that matches the most of them; locations with
+    no country-level value (e.g. "remote") are then only found within the
+    pushed countries. {} is returned when nothing matches, and the board is
+    fetched unfiltered. City-level facets are never used.
+    """
+    def names(location):
+        name = location.strip().lower()
+        return COUNTRY_NAMES.get(name, {name})
+
+    def matching_ids(values, location):
+        ids = []
+        for value in values:
+            descriptor = (value.get("descriptor") or "").strip().lower()
+            if value.get("id") and descriptor in names(location):
+                ids.append(value["id"])
+            ids.extend(matching_ids(value.get("values", []), location))
+        return ids
+
+    by_parameter = {facet.get("facetParameter"): facet for facet in facets}
+    best, best_matched = {}, 0
+    for parameter in facet_parameters:
+        facet = by_parameter.get(parameter)
+        if parameter not in LOCATION_FACETS or not facet or not locations:
+            continue
+        per_location = [ids for ids in (matching_ids(facet.get("values", []), loc) for loc in locations) if ids]
+        if len(per_location) > best_matched:
+            best = {parameter: sorted({id_ for ids in per_location for id_ in ids})}
+            best_matched = len(per_location)
+    return best
+
+
+def _facet_key(api_url, locations, facet_parameters):
+    return json.dumps([api_url, sorted(loc.strip().lower() for loc in locations), list(facet_parameters)])
+
+
+def cached_location_facets(api_url, locations, facet_parameters):
+    """Facets resolved for this board and these criteria within FACET_TTL, or None."""
+    entry = _facet_cache.get(_facet_key(api_url, locations, facet_parameters))
+    if entry and time.time() - entry.get("checked_at", 0) < FACET_TTL:
+        return entry["facets"]
+    return None
+
+
+def store_location_facets(api_url, locations, facet_parameters, facets):
+    _facet_cache.set(_facet_key(api_url, locations, facet_parameters), {"facets": facets, "checked_at": time.time()})
+
+
+async def fetch_page(api_url, fetcher, offset, search_text="", applied_facets=None):
+    payload = {
+        "appliedFacets": applied_facets or {},
+        "limit": PAGE_SIZE,
+        "offset": offset,
+        "searchText": search_text
+    }
+    response = await fetcher.post(api_url, board=True, headers=HEADERS, json=payload)
+    response.raise_for_status()
+    data = response.json()
+    return data, fetcher.parse_once(response, "workday", parse_jobs, api_url, data, version=PARSER_VERSION)
+
+
+async def iter_jobs(board_url, fetcher, max_parallel_pages=MAX_PARALLEL_PAGES):
+    """
+    Stream every posting of a Workday tenant.
+
+    The first page gives the total; the remaining pages are fetched
+    concurrently (at most `max_parallel_pages` at a time) and yielded as they
+    arrive. Criteria locations are pushed to the server as facets when the
+    tenant exposes a matching location facet; the facets are resolved from an
+    unfiltered first page and reused for FACET_TTL, so later cycles start
+    with the filtered page 0.
+    """
+    api_url = to_api_url(board_url)
+    settings, locations = load_search_settings()
+    search_text = settings.get("search_text", "") or ""
+    applied_facets = settings.get("applied_facets") or {}
+    facet_parameters = settings.get("location_facets", LOCATION_FACETS)
+    resolve = not applied_facets and settings.get("push_down_locations", True)
+    if resolve:
+        cached = cached_location_facets(api_url, locations, facet_parameters)
+        if cached is not None:
+            applied_facets, resolve = cached, False
+
+    data, jobs = await fetch_page(api_url, fetcher, 0, search_text, applied_facets)
+    if resolve:
+        applied_facets = resolve_location_facets(data.get("facets", []), locations, facet_parameters)
+        store_location_facets(api_url, locations, facet_parameters, applied_facets)
+        if applied_facets:
+            # Restart with the server-side filter so we only page through matches
+            data, jobs = await fetch_page(api_url, fetcher, 0, search_text, applied_facets)
+
+    for job in jobs:
+        yield job
+
+    total = data.get("total", 0)
+    limit = asyncio.Semaphore(max_parallel_pages)
+
+    async def bounded_page(offset):
+        async with limit:
+            return await fetch_page(api_url, fetcher, offset, search_text, applied_facets)
+
+    tasks = [asyncio.create_task(bounded_page(offset)) for offset in range(PAGE_SIZE, total, PAGE_SIZE)]
+    failed = 0
+    try:
+        for task in asyncio.as_completed(tasks):
+            try:
+                _, jobs = await task
+            except Exception as e:
+                print(f"[Workday Error] Page fetch failed for {api_url}: {e}")
+                failed += 1
+                continue
+            for job in jobs:
+                yield job
+    finally:
+        for task in tasks:
+            task.cancel()
+    if failed:
+        raise PartialBoardError(f"{failed} of {len(tasks) + 1} pages failed for {api_url}")
+
+
+async def fetch_jobs_async(api_url, fetcher):
     jobs = []
     try:
-        headers = {
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "appliedFacets": {},
-            "limit": 20,
-            "offset": 0,
-            "searchText": ""
-        }
-        response = requests.post(api_url, headers=headers, json=payload)
-        data = response.json()
-
-        for item in data.get("jobPostings", []):
-            title = item["title"]
-            location = item.get("locationsText", "")
-            url = f"https://{api_url.split('/fs/')[0].split('//')[1]}/job/{item['externalPath']}"
-            jobs.append({
-                "title": title,
-                "company": api_url.split("//")[1].split(".")[0],
-                "location": location,
-                "url": url,
-                "description": "",
-                "source": "workday"
-            })
+        async for job in iter_jobs(api_url, fetcher):
+            jobs.append(job)
     except Exception as e:
         print(f"[Workday Error] {e}")
     return jobs
+
+
+def fetch_jobs(api_url):
+    return fetch_with_new_fetcher(fetch_jobs_async, api_url)
+
+
+register(
+    "workday",
+    fetch_jobs_async,
+    iterate=iter_jobs,
+    hosts=[r"\.myworkdayjobs\.com$"],
+    fingerprints=[
+        rb"(?P<board>https://[\w-]+\.wd\d+\.myworkdayjobs\.com/(?:[a-z]{2}-[A-Z]{2}/)?(?!wday/)[\w-]+)",
+        rb"/wday/cxs/",
+    ],
+    board_url=board_url
+)
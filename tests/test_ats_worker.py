@@ -0,0 +1,66 @@
+import sys
+import os
+import textwrap
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from llm_modules import ats_worker
+from llm_modules.ats_worker import ATSWorker, ATSWorkerError
+
+# Stands in for `ats_runner.py --serve` without loading any models
+FAKE_RUNNER = textwrap.dedent("""
+    import os, sys, json, time
+    mode = os.environ["FAKE_ATS_MODE"]
+    print("loading models..." if mode == "bad_handshake" else json.dumps({"ready": True}), flush=True)
+    for line in sys.stdin:
+        if mode == "garbage":
+            print("Traceback (most recent call last):", flush=True)
+        elif mode == "hang":
+            time.sleep(30)
+        else:
+            print(json.dumps({"echo": json.loads(line)}), flush=True)
+""")
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    runner = tmp_path / "fake_runner.py"
+    runner.write_text(FAKE_RUNNER)
+    monkeypatch.setattr(ats_worker, "ATS_PYTHON", sys.executable)
+    monkeypatch.setattr(ats_worker, "RUNNER_PATH", str(runner))
+    monkeypatch.setattr(ats_worker, "ATS_REPLY_TIMEOUT", 1)
+    worker = ATSWorker()
+    yield worker
+    worker.close()
+
+def test_requests_reuse_one_worker_process(worker, monkeypatch):
+    monkeypatch.setenv("FAKE_ATS_MODE", "echo")
+    assert worker.request({"job_description": "a"}) == {"echo": {"job_description": "a"}}
+    pid = worker._proc.pid
+    assert worker.request({"job_description": "b"}) == {"echo": {"job_description": "b"}}
+    assert worker._proc.pid == pid
+
+def test_unexpected_handshake_is_rejected(worker, monkeypatch):
+    monkeypatch.setenv("FAKE_ATS_MODE", "bad_handshake")
+    with pytest.raises(ATSWorkerError, match="handshake"):
+        worker.request({"job_description": "a"})
+    assert worker._proc is None
+
+def test_invalid_reply_restarts_the_worker(worker, monkeypatch):
+    monkeypatch.setenv("FAKE_ATS_MODE", "garbage")
+    with pytest.raises(ATSWorkerError, match="Invalid reply"):
+        worker.request({"job_description": "a"})
+    assert worker._proc is None
+
+    monkeypatch.setenv("FAKE_ATS_MODE", "echo")
+    assert worker.request({"job_description": "b"}) == {"echo": {"job_description": "b"}}
+
+def test_hung_worker_times_out(worker, monkeypatch):
+    monkeypatch.setenv("FAKE_ATS_MODE", "hang")
+    with pytest.raises(ATSWorkerError, match="did not answer"):
+        worker.request({"job_description": "a"})
+    assert worker._proc is None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,129 @@
+import sys
+import os
+import time
+import asyncio
+import threading
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import psycopg2
+import pytest
+from application_engine import db_pool
+from application_engine.job_status_service import filter_unapplied
+
+class FakeCursor:
+    def __init__(self, conn, rows):
+        self.conn = conn
+        self.rows = rows
+        self.queries = []
+
+    def execute(self, sql, params=None):
+        if self.conn.dropped:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self.queries.append((sql, params))
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    """Stands in for a server connection; records what the pool does with it."""
+    opened = 0
+    rows = []
+
+    def __init__(self, **config):
+        FakeConnection.opened += 1
+        self.closed = 0
+        self.dropped = False
+        self.commits = self.rollbacks = 0
+        self.cursors = []
+
+    def cursor(self):
+        self.cursors.append(FakeCursor(self, FakeConnection.rows))
+        return self.cursors[-1]
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+@pytest.fixture
+def config(monkeypatch):
+    FakeConnection.opened = 0
+    monkeypatch.setattr(psycopg2, "connect", FakeConnection)
+    monkeypatch.setattr(db_pool, "POOL_MAX", 2)
+    monkeypatch.setattr(db_pool, "_pools", {})
+    return {"dbname": "test", "host": "localhost"}
+
+def test_connections_are_reused_and_transactions_closed(config):
+    with db_pool.get_connection(config) as first:
+        pass
+    with db_pool.get_connection(config) as second:
+        pass
+    assert first is second and FakeConnection.opened == 1
+    assert first.commits == 2
+
+    with pytest.raises(ValueError):
+        with db_pool.get_connection(config) as conn:
+            raise ValueError("bad query")
+    assert conn.rollbacks == 1
+
+def test_exhausted_pool_waits_instead_of_failing(config):
+    borrowed = [db_pool.get_pool(config).getconn() for _ in range(2)]
+    got = threading.Event()
+
+    def borrow():
+        with db_pool.get_connection(config):
+            got.set()
+
+    thread = threading.Thread(target=borrow)
+    thread.start()
+    time.sleep(0.1)
+    assert not got.is_set()
+
+    db_pool.get_pool(config).putconn(borrowed[0])
+    thread.join(timeout=2)
+    assert got.is_set()
+    assert FakeConnection.opened == 2
+
+def test_connections_dropped_while_idle_are_replaced(config, monkeypatch):
+    monkeypatch.setattr(db_pool, "POOL_CHECK_IDLE", 0)
+    with db_pool.get_connection(config) as first:
+        pass
+    first.dropped = True
+
+    with db_pool.get_connection(config) as second:
+        pass
+    assert second is not first and first.closed
+    assert FakeConnection.opened == 2
+
+def test_run_db_runs_blocking_queries_off_the_event_loop(config):
+    def count_rows(name):
+        with db_pool.get_connection(config):
+            return threading.current_thread().name, name
+
+    thread_name, result = asyncio.run(db_pool.run_db(count_rows, "applications"))
+    assert result == "applications" and thread_name.startswith("db")
+
+def test_filter_unapplied_checks_a_whole_batch_in_one_query(config, monkeypatch):
+    monkeypatch.setattr(db_pool, "DB_CONFIG", config)
+    monkeypatch.setattr(FakeConnection, "rows", [("https://a.com/1", 1, 0), ("https://a.com/2", 0, 2), ("https://a.com/3", 0, 1)])
+    jobs = [{"title": f"Job {i}", "url": f"https://a.com/{i}"} for i in range(1, 5)]
+
+    kept = filter_unapplied(jobs)
+    assert [job["url"] for job in kept] == ["https://a.com/3", "https://a.com/4"]
+
+    with db_pool.get_connection(config) as conn:
+        queries = conn.cursors[0].queries
+    assert len(queries) == 1
+    assert sorted(queries[0][1][0]) == [job["url"] for job in jobs]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
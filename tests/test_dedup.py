@@ -0,0 +1,69 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from scrapers.dedup import dedup_jobs, posting_fingerprint, minhash_signature, estimated_similarity
+from scrapers.url_utils import canonicalize_url
+
+BODY = " ".join(
+    f"We are hiring a machine learning engineer to build model {i} with python pytorch and aws."
+    for i in range(12)
+)
+
+def make_job(url, title="Machine Learning Engineer", company="OpenAI", location="Remote", description=BODY):
+    return {"title": title, "company": company, "location": location, "url": url, "description": description}
+
+def test_tracking_params_and_ats_ids_collapse():
+    jobs = [
+        make_job("https://job-boards.greenhouse.io/openai/jobs/6606249?gh_jid=6606249", description=""),
+        make_job("https://openai.com/careers/?gh_jid=6606249&utm_source=linkedin", title="ML Engineer I"),
+        make_job("https://job-boards.greenhouse.io/openai/jobs/6606249?utm_source=x", title="Other"),
+    ]
+    unique = dedup_jobs(jobs)
+    assert len(unique) == 1
+    # The copy with the description survives
+    assert unique[0]["url"].startswith("https://openai.com")
+
+def test_only_known_tracking_params_are_stripped():
+    url = "https://careers.acme.com/job?lever-source=x&utm_medium=y&gh_src=z&source=42&mode=job&codes=ML"
+    assert canonicalize_url(url) == "https://careers.acme.com/job?codes=ML&mode=job&source=42"
+
+def test_fingerprint_normalizes_company_title_and_location():
+    a = make_job("https://a.com/1", title="Sr. ML Engineer", company="Acme, Inc.", location="United States")
+    b = make_job("https://b.com/2", title="Senior Machine Learning Engineer", company="acme", location="USA")
+    assert posting_fingerprint(a) == posting_fingerprint(b)
+    assert len(dedup_jobs([a, b])) == 1
+
+def test_fingerprint_keeps_distinct_reqs_apart():
+    # Same title and location, different Greenhouse posting ids
+    a = make_job("https://boards.greenhouse.io/openai/jobs/1", description="")
+    b = make_job("https://boards.greenhouse.io/openai/jobs/2", description="")
+    assert len(dedup_jobs([a, b])) == 2
+
+    # Same board, no posting ids: two openings, not one
+    board = "https://careers.acme.com/jobs"
+    c = dict(make_job("https://careers.acme.com/jobs/a", description=""), board=board)
+    d = dict(make_job("https://careers.acme.com/jobs/b", description=""), board=board)
+    assert len(dedup_jobs([c, d])) == 2
+
+    # The same posting mirrored on an aggregator still collapses
+    e = dict(make_job("https://www.linkedin.com/jobs/view/42", description=""), board="linkedin")
+    assert len(dedup_jobs([a, e])) == 1
+
+def test_minhash_catches_lightly_edited_reposts_only():
+    edited = BODY.replace("model 3", "model three") + " Apply today."
+    assert estimated_similarity(minhash_signature(BODY), minhash_signature(edited)) > 0.8
+
+    repost = make_job("https://agency.com/x", company="Talent Agency", location="", description=edited)
+    other_role = make_job("https://c.com/3", title="Data Scientist", company="Other",
+                          description=" ".join(f"Analyze dataset {i} in sql and build dashboards." for i in range(12)))
+    unique = dedup_jobs([make_job("https://a.com/1"), repost, other_role])
+    # The longer re-post is kept in place of the original
+    assert [job["url"] for job in unique] == ["https://agency.com/x", "https://c.com/3"]
+    assert unique[0]["duplicate_urls"] == ["https://a.com/1"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,39 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+from llm_modules.embedding_store import EmbeddingStore
+from utils import disk_cache
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_ROOT", str(tmp_path))
+    return EmbeddingStore(dim=4)
+
+def vectors(count, start=0):
+    return np.arange(start * 4, (start + count) * 4, dtype=np.float32).reshape(count, 4)
+
+def test_normalized_texts_share_a_row_across_instances(store):
+    store.put_many(["ML Engineer", "Data Scientist"], vectors(2))
+    reader = EmbeddingStore(dim=4)
+    found = reader.get_many(["  ml   engineer ", "Data Scientist", "Unknown"])
+    assert sorted(found) == [0, 1]
+    assert np.array_equal(found[0], vectors(1)[0])
+
+def test_corrupt_index_drops_unreachable_vectors(store):
+    store.put_many(["a", "b", "c"], vectors(3))
+    with open(store.index_path, "w", encoding="utf-8") as f:
+        f.write('{"truncated": ')
+
+    store = EmbeddingStore(dim=4)
+    store.put_many(["d"], vectors(1, start=3))
+    assert os.path.getsize(store.vectors_path) == 4 * 4
+    assert len(store) == 1
+    assert np.array_equal(store.get_many(["d"])[0], vectors(1, start=3)[0])
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
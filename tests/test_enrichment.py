@@ -0,0 +1,70 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import httpx
+import pytest
+from scrapers import enrichment
+from scrapers.async_fetcher import AsyncFetcher
+from scrapers.enrichment import passes_prefilter
+from scrapers.parsing import extract_main_text
+from utils import disk_cache
+
+CRITERIA = {
+    "titles": ["machine learning engineer", "data scientist"],
+    "locations": ["remote", "united states"],
+    "exclude": {"titles": ["intern"], "companies": ["oracle"], "keywords": []}
+}
+
+def make_job(title="Machine Learning Engineer", company="acme", location="Remote"):
+    return {"title": title, "company": company, "location": location, "url": "https://acme.com/1", "description": ""}
+
+def test_prefilter_keeps_matching_postings():
+    assert passes_prefilter(make_job(), CRITERIA)
+    assert passes_prefilter(make_job(location=""), CRITERIA)
+    assert passes_prefilter(make_job(location="3 Locations"), CRITERIA)
+    # Location text isn't matched against criteria here
+    assert passes_prefilter(make_job(location="San Francisco, CA"), CRITERIA)
+
+def test_prefilter_drops_postings_we_would_discard():
+    assert not passes_prefilter(make_job(title="Machine Learning Engineer Intern"), CRITERIA)
+    assert not passes_prefilter(make_job(company="Oracle"), CRITERIA)
+    assert not passes_prefilter(make_job(title="Sales Manager"), CRITERIA)
+    assert not passes_prefilter(make_job(title=None), CRITERIA)
+
+def test_failed_detail_fetches_are_held_for_retry(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_ROOT", str(tmp_path))
+    monkeypatch.setattr(enrichment, "_description_cache", disk_cache.JsonDiskCache("descriptions"))
+
+    def handler(request):
+        if request.url.path == "/2":
+            return httpx.Response(503)
+        return httpx.Response(200, content=b"<html><body><main><p>Build models</p></main></body></html>")
+
+    async def stream():
+        for job_id in (1, 2):
+            yield dict(make_job(), url=f"https://acme.com/{job_id}")
+
+    async def run(failed_urls):
+        async with AsyncFetcher(transport=httpx.MockTransport(handler), cache=False, retries=0, breaker=False) as fetcher:
+            return [job async for job in enrichment.iter_enriched_async(stream(), fetcher, CRITERIA, failed_urls)]
+
+    failed_urls = []
+    jobs = asyncio.run(run(failed_urls))
+    assert [(job["url"], job["description"]) for job in jobs] == [("https://acme.com/1", "Build models")]
+    assert failed_urls == ["https://acme.com/2"]
+
+def test_extract_main_text_prefers_known_containers():
+    html = "<html><body><nav>Jobs Home</nav><div class='job-description'><p>Build models</p></div></body></html>"
+    assert extract_main_text(html) == "Build models"
+
+def test_extract_main_text_falls_back_to_densest_block():
+    html = ("<html><body><header>Careers</header><div><p>Short</p></div>"
+            "<div><p>We train large models.</p><li>Python</li></div></body></html>")
+    assert extract_main_text(html) == "We train large models.\nPython"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,66 @@
+import sys
+import os
+import time
+import asyncio
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+import pytest
+from scrapers.async_fetcher import AsyncFetcher
+from scrapers.http_cache import HttpCache
+from utils import disk_cache
+
+BOARD = "https://boards-api.greenhouse.io/v1/boards/acme/jobs"
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_ROOT", str(tmp_path))
+
+def fetch(cache, urls, board=True):
+    requests = []
+
+    def handler(request):
+        requests.append((str(request.url), request.headers.get("If-None-Match")))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, content=b'{"jobs": []}')
+
+    async def run():
+        async with AsyncFetcher(transport=httpx.MockTransport(handler), cache=cache, breaker=False) as fetcher:
+            return [(await fetcher.get(url, board=board)).content for url in urls]
+
+    return asyncio.run(run()), requests
+
+def test_unchanged_board_is_answered_from_disk_not_memory():
+    fetch(HttpCache(), [BOARD])
+    cache = HttpCache()
+    bodies, requests = fetch(cache, [BOARD])
+    assert bodies == [b'{"jobs": []}']
+    assert requests == [(BOARD, '"v1"')]
+    # Only validators and the parse memo stay in memory
+    assert all("content" not in entry for entry in cache._entries.values())
+
+def test_detail_and_oversized_bodies_are_not_stored():
+    _, requests = fetch(HttpCache(), ["https://acme.com/jobs/1"] * 2, board=False)
+    assert [etag for _, etag in requests] == [None, None]
+    _, requests = fetch(HttpCache(max_body=4), [BOARD] * 2)
+    assert [etag for _, etag in requests] == [None, None]
+
+def test_prune_expires_and_caps_bodies():
+    fetch(HttpCache(), [BOARD, BOARD + "?page=2"])
+    bodies = disk_cache.cache_dir("http_bodies")
+    assert sum(len(names) for _, _, names in os.walk(bodies)) == 1
+
+    HttpCache(max_bytes=0)
+    assert sum(len(names) for _, _, names in os.walk(bodies)) == 0
+    # Entries whose body is gone are refetched in full
+    _, requests = fetch(HttpCache(), [BOARD])
+    assert requests == [(BOARD, None)]
+
+    HttpCache().prune(now=time.time() + 30 * 24 * 3600)
+    assert sum(len(names) for _, _, names in os.walk(disk_cache.cache_dir("http"))) == 0
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
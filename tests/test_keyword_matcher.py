@@ -0,0 +1,45 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from llm_modules.keyword_matcher import KeywordMatcher
+
+RESUME_TEXT = """
+summary machine learning engineer building apis with python/django and node.js
+skills javascript, c++, ci/cd, aws sagemaker, docker
+"""
+
+def test_whole_terms_only():
+    """A keyword must match whole terms, not a substring of a longer word."""
+    matcher = KeywordMatcher(RESUME_TEXT)
+    assert matcher.contains("javascript")
+    assert not matcher.contains("java")
+    assert not matcher.contains("sage")
+
+def test_multi_word_keywords():
+    matcher = KeywordMatcher(RESUME_TEXT)
+    assert matcher.contains("machine learning engineer")
+    assert matcher.contains("aws sagemaker")
+    assert not matcher.contains("learning machine")
+
+def test_compound_terms():
+    """Compound terms match their parts and the punctuation-free form preprocess() yields."""
+    matcher = KeywordMatcher(RESUME_TEXT)
+    assert matcher.contains("python")
+    assert matcher.contains("django")
+    assert matcher.contains("node.js")
+    assert matcher.contains("nodejs")
+    assert matcher.contains("cicd")
+    assert matcher.contains("c++")
+
+def test_classify_preserves_order():
+    matcher = KeywordMatcher(RESUME_TEXT)
+    matched, missing = matcher.classify(["docker", "java", "python", "kubernetes"])
+    assert matched == ["docker", "python"]
+    assert missing == ["java", "kubernetes"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,57 @@
+import sys
+import os
+import io
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from PIL import Image
+from llm_modules import ocr_engine
+from utils import disk_cache
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_ROOT", str(tmp_path))
+    monkeypatch.setattr(ocr_engine, "_ocr_cache", disk_cache.JsonDiskCache("ocr"))
+
+def png(width, height):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def test_prefilter_rejections_are_not_cached(monkeypatch):
+    monkeypatch.setattr(ocr_engine, "_ocr_one", lambda img_bytes: "Scanned text")
+    icon = png(16, 16)
+    assert ocr_engine.ocr_images([icon]) == [""]
+    assert ocr_engine.ocr_images([icon], prefilter=False) == ["Scanned text"]
+
+class FakePool:
+    def __init__(self, broken):
+        self.broken = broken
+        self.shut_down = False
+
+    def submit(self, fn, img_bytes):
+        future = Future()
+        if self.broken:
+            future.set_exception(BrokenProcessPool("worker died"))
+        else:
+            future.set_result(img_bytes.decode())
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+def test_broken_pool_is_replaced_and_batch_resubmitted(monkeypatch):
+    pools = [FakePool(broken=True), FakePool(broken=False)]
+    monkeypatch.setattr(ocr_engine, "_pool", pools[0])
+    monkeypatch.setattr(ocr_engine, "ProcessPoolExecutor", lambda **kwargs: pools[1])
+
+    assert ocr_engine._ocr_in_pool({"a": b"first", "b": b"second"}) == {"a": "first", "b": "second"}
+    assert pools[0].shut_down
+    assert ocr_engine._pool is pools[1]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,47 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+import pytest
+from scrapers import parsing
+from scrapers.parser_benchmark import run_benchmark
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "pages")
+
+@pytest.mark.skipif(parsing.DEFAULT_BACKEND != "lxml", reason="lxml not installed")
+def test_fast_backend_matches_html_parser_on_fixtures():
+    results = run_benchmark(FIXTURES, repeat=1)
+    assert {r["scraper"] for r in results} == {"greenhouse", "lever", "icims", "custom"}
+    for r in results:
+        assert r["identical"], r["fixture"]
+        assert r["postings"] > 0
+
+@pytest.mark.parametrize("backend", ["html.parser", parsing.DEFAULT_BACKEND])
+def test_node_api_on_bytes(backend):
+    doc = parsing.parse_html("<div class='a'><p>Café <b>x</b></p><script>y()</script></div>".encode("utf-8"),
+                             backend=backend)
+    block = doc.select_one("div.a")
+    assert block.text(" ", strip=True) == "Café x"
+    assert block.select_one("p").find_next("b").text() == "x"
+    assert doc.select_one("span") is None
+
+@pytest.mark.parametrize("backend", ["html.parser", parsing.DEFAULT_BACKEND])
+def test_http_charset_and_unknown_meta_charsets(backend):
+    # No <meta>: only the Content-Type header says the page is cp1252
+    response = httpx.Response(200, headers={"Content-Type": "text/html; charset=windows-1252"},
+                              content="<h1>Caf\u00e9 \u2013 Paris</h1>".encode("cp1252"))
+    markup = parsing.response_markup(response)
+    # Decoding is left to the parser
+    assert isinstance(markup, bytes) and markup.encoding == "windows-1252"
+    doc = parsing.parse_html(markup, backend=backend)
+    assert doc.select_one("h1").text() == "Caf\u00e9 \u2013 Paris"
+    assert parsing.extract_main_text(markup) == "Caf\u00e9 \u2013 Paris"
+
+    bogus = b'<html><head><meta charset="x-user-defined-bogus"></head><body><h1>Jobs</h1></body></html>'
+    assert parsing.parse_html(bogus, backend=backend).select_one("h1").text() == "Jobs"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
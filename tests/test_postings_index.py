@@ -0,0 +1,128 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import pytest
+from scrapers import universal_scraper
+from scrapers.postings_index import PostingsIndex
+from utils import disk_cache
+
+def make_job(job_id, description="Python and SQL", board="https://boards.greenhouse.io/acme"):
+    return {
+        "title": f"Engineer {job_id}",
+        "company": "acme",
+        "location": "Remote",
+        "url": f"https://boards.greenhouse.io/acme/jobs/{job_id}?utm_source=linkedin",
+        "description": description,
+        "board": board
+    }
+
+def run_cycle(path, jobs):
+    with PostingsIndex(path) as index:
+        return index.observe(jobs), index.postings
+
+def test_only_new_or_changed_postings_are_emitted(tmp_path):
+    path = str(tmp_path / "index.json")
+    fresh, _ = run_cycle(path, [make_job(1), make_job(2)])
+    assert [job["posting_status"] for job in fresh] == ["new", "new"]
+
+    fresh, _ = run_cycle(path, [make_job(1), make_job(2, description="Python, SQL and Go")])
+    assert [(job["title"], job["posting_status"]) for job in fresh] == [("Engineer 2", "changed")]
+
+def test_tracking_parameters_do_not_create_new_postings(tmp_path):
+    path = str(tmp_path / "index.json")
+    run_cycle(path, [make_job(1)])
+    job = make_job(1)
+    job["url"] = "https://boards.greenhouse.io/acme/jobs/1/"
+    fresh, _ = run_cycle(path, [job])
+    assert fresh == []
+
+def test_vanished_postings_are_closed_and_reopened(tmp_path):
+    path = str(tmp_path / "index.json")
+    run_cycle(path, [make_job(1), make_job(2)])
+
+    _, postings = run_cycle(path, [make_job(1)])
+    assert postings["https://boards.greenhouse.io/acme/jobs/2"]["status"] == "closed"
+
+    fresh, _ = run_cycle(path, [make_job(1), make_job(2)])
+    assert [job["posting_status"] for job in fresh] == ["reopened"]
+
+def test_empty_board_is_not_treated_as_closed(tmp_path):
+    """A board that returned nothing most likely failed; its postings stay open."""
+    path = str(tmp_path / "index.json")
+    run_cycle(path, [make_job(1), make_job(9, board="https://jobs.lever.co/other")])
+    _, postings = run_cycle(path, [make_job(9, board="https://jobs.lever.co/other")])
+    assert postings["https://boards.greenhouse.io/acme/jobs/1"]["status"] == "open"
+
+def test_requeue_re_emits_posting(tmp_path):
+    path = str(tmp_path / "index.json")
+    run_cycle(path, [make_job(1)])
+    with PostingsIndex(path) as index:
+        index.requeue(make_job(1)["url"])
+    fresh, _ = run_cycle(path, [make_job(1)])
+    assert len(fresh) == 1
+
+def test_partially_fetched_board_is_not_treated_as_closed(tmp_path):
+    """Postings on a board's failed pages stay open rather than flapping closed/reopened."""
+    path = str(tmp_path / "index.json")
+    run_cycle(path, [make_job(1), make_job(2)])
+    with PostingsIndex(path) as index:
+        index.observe([make_job(1)], partial_boards={"https://boards.greenhouse.io/acme"})
+    fresh, postings = run_cycle(path, [make_job(1), make_job(2)])
+    assert postings["https://boards.greenhouse.io/acme/jobs/2"]["status"] == "open"
+    assert fresh == []
+
+def test_source_failing_mid_stream_is_marked_partial():
+    class Plugin:
+        name = "fake"
+
+        async def iterate(self, board_url, fetcher):
+            yield make_job(1)
+            raise RuntimeError("page 2 failed")
+
+    async def run(partial_boards):
+        source = {"name": "acme"}
+        stream = universal_scraper.iter_source_async(source, None, Plugin(), "https://boards.greenhouse.io/acme", partial_boards)
+        return [job async for job in stream]
+
+    partial_boards = set()
+    assert len(asyncio.run(run(partial_boards))) == 1
+    assert partial_boards == {"https://boards.greenhouse.io/acme"}
+
+def test_streaming_commit_keeps_updates_from_other_cycles(tmp_path):
+    path = str(tmp_path / "index.json")
+    index = PostingsIndex(path).load()
+    index.observe_one(make_job(1))
+
+    # Another process commits while this scrape is still streaming
+    run_cycle(path, [make_job(9, board="https://jobs.lever.co/other")])
+
+    index.close_missing()
+    index.commit()
+    _, postings = run_cycle(path, [])
+    assert set(postings) == {"https://boards.greenhouse.io/acme/jobs/1", "https://boards.greenhouse.io/acme/jobs/9"}
+    assert not os.path.exists(path + ".lock")
+
+def test_prefilter_rejects_return_when_criteria_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_ROOT", str(tmp_path))
+    jobs = [make_job(1), dict(make_job(2), title="Data Scientist 2")]
+
+    async def scrape(fetcher=None, partial_boards=None):
+        for job in jobs:
+            yield dict(job)
+
+    def new_titles(titles):
+        criteria = {"titles": titles, "locations": ["remote"], "exclude": {"titles": [], "companies": []}}
+        async def run():
+            return [job["title"] async for job in universal_scraper.iter_new_jobs_async(criteria=criteria)]
+        return asyncio.run(run())
+
+    monkeypatch.setattr(universal_scraper, "iter_all_jobs_async", scrape)
+    assert new_titles(["engineer"]) == ["Engineer 1"]
+    assert new_titles(["engineer", "data scientist"]) == ["Data Scientist 2"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
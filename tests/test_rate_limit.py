@@ -0,0 +1,134 @@
+import sys
+import os
+import time
+import asyncio
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+import pytest
+from scrapers import async_fetcher
+from scrapers.async_fetcher import AsyncFetcher
+from scrapers.circuit_breaker import CircuitBreaker, CircuitOpenError
+from scrapers.rate_limit import TokenBucket, AdaptiveTokenBucket, backoff_delay, retry_after_seconds
+from utils import disk_cache
+
+def test_token_bucket_allows_burst_then_paces():
+    async def take(bucket, count):
+        start = time.monotonic()
+        for _ in range(count):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    bucket = TokenBucket(rate=20, capacity=5)
+    # The burst is free, the next 4 tokens take ~0.2s at 20/s
+    assert asyncio.run(take(bucket, 5)) < 0.05
+    assert 0.15 < asyncio.run(take(bucket, 4)) < 0.5
+
+@pytest.fixture
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_ROOT", str(tmp_path))
+    monkeypatch.setattr(async_fetcher, "BACKOFF_BASE", 0.01)
+    # Keep throttled hosts fast enough for a unit test
+    monkeypatch.setattr(async_fetcher, "HOST_MIN_RATE", 50)
+
+def fetch_all(urls, handler):
+    async def run():
+        async with AsyncFetcher(transport=httpx.MockTransport(handler), cache=False) as fetcher:
+            results = []
+            for url in urls:
+                try:
+                    results.append((await fetcher.get(url)).status_code)
+                except CircuitOpenError:
+                    results.append("open")
+            return results
+    return asyncio.run(run())
+
+def test_adaptive_bucket_halves_on_throttle_and_recovers():
+    bucket = AdaptiveTokenBucket(rate=8, min_rate=1, max_rate=10, increase=1)
+    bucket.on_throttle()
+    assert bucket.rate == 4 and bucket.tokens == 0
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == 10
+
+def test_backoff_honors_retry_after():
+    assert retry_after_seconds("7") == 7
+    assert retry_after_seconds("soon") is None
+    assert backoff_delay(0, base=0.5, cap=30, retry_after=7) >= 7
+    assert all(backoff_delay(10, base=0.5, cap=30) <= 30 for _ in range(50))
+
+def test_throttled_requests_are_retried(isolated_cache):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200)
+
+    assert fetch_all(["https://boards.example.com/a"], handler) == [200]
+    assert len(calls) == 2
+
+def test_circuit_opens_and_stays_open_across_cycles(isolated_cache):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(503)
+
+    urls = [f"https://down.example.com/{i}" for i in range(5)]
+    results = fetch_all(urls, handler)
+    assert results == [503, 503, 503, "open", "open"]
+    assert len(calls) == 3 * (async_fetcher.MAX_RETRIES + 1)
+
+    # Next cycle (new fetcher, breaker state from disk) costs no requests
+    calls.clear()
+    assert fetch_all(urls[:1], handler) == ["open"]
+    assert calls == []
+
+def test_gone_board_is_skipped_but_host_stays_up(isolated_cache):
+    breaker = CircuitBreaker()
+    for _ in range(3):
+        breaker.record_failure("https://boards.example.com/gone")
+    assert not breaker.allow("https://boards.example.com/gone")
+    assert breaker.allow("boards.example.com")
+
+def test_only_board_urls_get_a_circuit_of_their_own(isolated_cache):
+    def handler(request):
+        return httpx.Response(404)
+
+    async def run():
+        async with AsyncFetcher(transport=httpx.MockTransport(handler), cache=False) as fetcher:
+            for _ in range(3):
+                await fetcher.get("https://boards.example.com/jobs/1")
+                await fetcher.get("https://boards.example.com/gone", board=True)
+            return fetcher.breaker
+
+    breaker = asyncio.run(run())
+    assert breaker.state("https://boards.example.com/jobs/1") is None
+    assert not breaker.allow("https://boards.example.com/gone")
+
+def test_refused_host_releases_the_board_probe(isolated_cache, monkeypatch):
+    breaker = CircuitBreaker()
+    board = "https://boards.example.com/acme"
+    for key in (board, "boards.example.com"):
+        for _ in range(3):
+            breaker.record_failure(key)
+    # Both cooldowns are over, but the host is still being probed elsewhere
+    later = time.time() + 10 ** 6
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert breaker.allow("boards.example.com")
+
+    async def run():
+        async with AsyncFetcher(transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+                                cache=False, breaker=breaker) as fetcher:
+            with pytest.raises(CircuitOpenError):
+                await fetcher.get(board, board=True)
+
+    asyncio.run(run())
+    assert board not in breaker._probing
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,118 @@
+import sys
+import os
+import json
+import asyncio
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+import pytest
+from scrapers import registry
+from scrapers.async_fetcher import AsyncFetcher
+from utils import disk_cache
+
+@pytest.fixture(autouse=True)
+def isolated_detection_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_ROOT", str(tmp_path))
+    monkeypatch.setattr(registry, "_detection_cache", disk_cache.JsonDiskCache("scraper_detection"))
+
+def resolve(url, pages=None, platform=None):
+    requests = []
+
+    def handler(request):
+        requests.append(str(request.url))
+        return httpx.Response(200, content=(pages or {}).get(str(request.url), b"<html></html>"))
+
+    async def run():
+        async with AsyncFetcher(transport=httpx.MockTransport(handler), cache=False) as fetcher:
+            plugin, board = await registry.resolve_source(url, fetcher, platform)
+            return plugin.name, board
+
+    return asyncio.run(run()), requests
+
+def test_host_patterns_map_job_pages_to_their_board():
+    (name, board), requests = resolve("https://job-boards.eu.greenhouse.io/nice/jobs/4590668101?gh_jid=4590668101")
+    assert (name, board) == ("greenhouse", "https://job-boards.eu.greenhouse.io/nice")
+    assert requests == []
+
+    (name, board), _ = resolve("https://kyndryl.wd5.myworkdayjobs.com/en-US/KyndrylProfessionalCareers/job/MD-USA/R-40438-1")
+    assert (name, board) == ("workday", "https://kyndryl.wd5.myworkdayjobs.com/KyndrylProfessionalCareers")
+
+    (name, board), _ = resolve("https://aexp.eightfold.ai/careers/job/29083548", platform="eightfold")
+    assert (name, board) == ("eightfold", "https://aexp.eightfold.ai/careers?domain=aexp.com")
+
+def test_page_fingerprints_detect_embedded_boards_once_per_domain():
+    page = b'<script src="https://boards.greenhouse.io/embed/job_board/js?for=acme"></script>'
+    pages = {"https://careers.acme.com/jobs": page}
+
+    (name, board), requests = resolve("https://careers.acme.com/jobs", pages, platform="custom")
+    assert (name, board) == ("greenhouse", "https://boards.greenhouse.io/embed/job_board/js?for=acme")
+    assert requests == ["https://careers.acme.com/jobs"]
+
+    # Cached: other pages on the domain resolve without a request
+    (name, board), requests = resolve("https://careers.acme.com/jobs/123", pages)
+    assert name == "greenhouse" and requests == []
+
+def test_unrecognized_pages_fall_back_to_custom():
+    (name, board), _ = resolve("https://www.example.com/careers/1")
+    assert (name, board) == ("custom", "https://www.example.com/careers/1")
+
+def test_eightfold_board_fetches_every_page():
+    plugin = registry.get_plugin("eightfold")
+
+    def handler(request):
+        start = int(request.url.params["start"])
+        positions = [{"id": i, "name": f"Engineer {i}", "location": "Remote"} for i in range(start, min(start + 10, 25))]
+        return httpx.Response(200, content=json.dumps({"positions": positions, "count": 25}).encode())
+
+    async def run():
+        async with AsyncFetcher(transport=httpx.MockTransport(handler), cache=False) as fetcher:
+            return [job async for job in registry.iter_board_async(plugin, "https://aexp.eightfold.ai/careers", fetcher)]
+
+    jobs = asyncio.run(run())
+    assert sorted(job["url"] for job in jobs) == sorted(f"https://aexp.eightfold.ai/careers/job/{i}" for i in range(25))
+    assert all(job["board"] == "https://aexp.eightfold.ai/careers" for job in jobs)
+
+def test_workday_locations_push_down_only_exact_country_matches():
+    from scrapers.workday_scraper import resolve_location_facets
+    facets = [
+        {"facetParameter": "locationCountry", "values": [
+            {"id": "us", "descriptor": "United States of America"},
+            {"id": "il", "descriptor": "Israel"}]},
+        {"facetParameter": "locationMainGroup", "values": [
+            {"id": "ri", "descriptor": "Remote - India"}]},
+        {"facetParameter": "locations", "values": [
+            {"id": "jer", "descriptor": "Jerusalem"},
+            {"id": "rem", "descriptor": "Remote"}]}
+    ]
+    assert resolve_location_facets(facets, ["united states", "usa"]) == {"locationCountry": ["us"]}
+    # "remote" has no country-level value; the locations that resolve are still pushed down
+    assert resolve_location_facets(facets, ["remote", "usa"], ["locationCountry", "locationMainGroup", "locations"]) == {"locationCountry": ["us"]}
+    assert resolve_location_facets(facets, ["remote", "jerusalem"], ["locationCountry", "locationMainGroup", "locations"]) == {}
+
+def test_workday_facets_are_resolved_once_then_reused(monkeypatch):
+    from scrapers import workday_scraper
+    monkeypatch.setattr(workday_scraper, "_facet_cache", disk_cache.JsonDiskCache("workday_facets"))
+    monkeypatch.setattr(workday_scraper, "load_search_settings", lambda: ({}, ["remote", "usa"]))
+    facets = [{"facetParameter": "locationCountry", "values": [{"id": "us", "descriptor": "United States of America"}]}]
+    payloads = []
+
+    def handler(request):
+        payload = json.loads(request.content)
+        payloads.append(payload["appliedFacets"])
+        postings = [{"title": "Engineer", "externalPath": "/job/1", "locationsText": "Austin, TX"}]
+        return httpx.Response(200, content=json.dumps({"total": 1, "facets": facets, "jobPostings": postings}).encode())
+
+    async def run():
+        async with AsyncFetcher(transport=httpx.MockTransport(handler), cache=False) as fetcher:
+            return [job async for job in workday_scraper.iter_jobs("https://acme.wd5.myworkdayjobs.com/External", fetcher)]
+
+    assert len(asyncio.run(run())) == 1
+    assert payloads == [{}, {"locationCountry": ["us"]}]
+    payloads.clear()
+    assert len(asyncio.run(run())) == 1
+    assert payloads == [{"locationCountry": ["us"]}]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,68 @@
+import sys
+import os
+import asyncio
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+import pytest
+from scrapers import registry, universal_scraper
+from scrapers.replay import ReplayArchive, RecordingTransport, ReplayTransport, ReplayServer, ServerTransport, run_bench
+from scrapers.greenhouse_scraper import fetch_jobs_async
+from scrapers.async_fetcher import AsyncFetcher
+from utils import disk_cache
+
+BOARD = "https://boards.greenhouse.io/acme"
+PAGE = (Path(__file__).parent / "fixtures" / "pages" / "greenhouse.html").read_bytes()
+
+@pytest.fixture
+def archive_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_ROOT", str(tmp_path))
+    monkeypatch.setattr(universal_scraper, "load_job_sources",
+                        lambda: [{"name": "Acme", "platform": "greenhouse", "url": BOARD}])
+    return str(tmp_path / "boards.json.gz")
+
+def live_board(request):
+    # The API is unavailable, so the scraper falls back to the HTML board
+    if str(request.url) == BOARD:
+        return httpx.Response(200, headers={"Content-Type": "text/html"}, content=PAGE)
+    return httpx.Response(404)
+
+def scrape(transport):
+    async def run():
+        async with AsyncFetcher(transport=transport, cache=False, breaker=False) as fetcher:
+            return await fetch_jobs_async(BOARD, fetcher)
+    return asyncio.run(run())
+
+def test_recorded_board_replays_in_process_and_from_local_server(archive_path):
+    live = scrape(RecordingTransport(ReplayArchive(archive_path), inner=httpx.MockTransport(live_board)))
+    assert len(live) == 150
+
+    archive = ReplayArchive.load(archive_path)
+    assert scrape(ReplayTransport(archive)) == live
+    with ReplayServer(archive) as server:
+        assert scrape(ServerTransport(server.url)) == live
+    assert archive.misses == []
+
+def test_bench_reports_throughput_and_parse_time(archive_path):
+    scrape(RecordingTransport(ReplayArchive(archive_path), inner=httpx.MockTransport(live_board)))
+
+    ttl = registry.DETECTION_TTL
+    report = run_bench(archive_path, repeat=1)
+    assert registry.DETECTION_TTL == ttl
+    assert report["by_source"]["greenhouse"] == 150
+    assert report["parsers"]["greenhouse"]["bytes"] == len(PAGE)
+    assert report["postings_per_sec"] > 0
+
+def test_replay_from_env_skips_live_cache_and_breakers(archive_path, monkeypatch):
+    scrape(RecordingTransport(ReplayArchive(archive_path), inner=httpx.MockTransport(live_board)))
+    monkeypatch.setenv("SCRAPER_REPLAY", archive_path)
+
+    fetcher = AsyncFetcher()
+    assert isinstance(fetcher.transport, ReplayTransport)
+    assert fetcher.cache is None and fetcher.breaker is None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,79 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+main = pytest.importorskip("main")
+
+# The shape llm_modules/ats_matcher._build_ats_result returns through the worker
+ATS_RESULT = {
+    "Final ATS Score": 72.5,
+    "Keyword Match Score": 80.0,
+    "Semantic Similarity Score": 61.25,
+    "Matched Keywords": ["python", "pytorch"],
+    "Missing Keywords": ["sagemaker"],
+    "Suggestions": "Consider adding: sagemaker"
+}
+
+class FakePool:
+    def score_batch(self, job_descriptions, resume_path):
+        return [ATS_RESULT if description else {"error": "Empty job description"} for description in job_descriptions]
+
+async def stream(jobs):
+    for job in jobs:
+        yield job
+
+def test_scored_postings_carry_the_worker_result(monkeypatch):
+    monkeypatch.setattr(main, "get_worker_pool", lambda: FakePool())
+    monkeypatch.setattr(main, "SCORE_BATCH_WAIT", 0.01)
+    jobs = [
+        {"title": "ML Engineer", "url": "https://a.com/1", "description": "Python and PyTorch"},
+        {"title": "Data Scientist", "url": "https://a.com/2", "description": ""}
+    ]
+    retry_urls = []
+
+    async def run():
+        return [job async for job in main.iter_scored_jobs_async(stream(jobs), "resume.pdf", retry_urls)]
+
+    scored = asyncio.run(run())
+    assert [job["url"] for job in scored] == ["https://a.com/1"]
+    assert scored[0]["match_score"] == 72.5
+    assert scored[0]["matched_skills"] == ["python", "pytorch"]
+    assert scored[0]["missing_skills"] == ["sagemaker"]
+    assert scored[0]["ats_feedback"] == "Consider adding: sagemaker"
+    # Only the posting the worker could not score is re-emitted next cycle
+    assert retry_urls == ["https://a.com/2"]
+
+def test_batches_in_flight_are_bounded_by_worker_count(monkeypatch):
+    state = {"running": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class SlowPool(FakePool):
+        def score_batch(self, job_descriptions, resume_path):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.05)
+            with lock:
+                state["running"] -= 1
+            return super().score_batch(job_descriptions, resume_path)
+
+    monkeypatch.setattr(main, "get_worker_pool", lambda: SlowPool())
+    monkeypatch.setattr(main, "SCORE_BATCH_SIZE", 1)
+    monkeypatch.setattr(main, "ATS_WORKER_COUNT", 2)
+    jobs = [{"title": f"ML Engineer {i}", "url": f"https://a.com/{i}", "description": "Python"} for i in range(8)]
+
+    async def run():
+        return [job async for job in main.iter_scored_jobs_async(stream(jobs), "resume.pdf", [])]
+
+    assert len(asyncio.run(run())) == 8
+    assert state["peak"] == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,104 @@
+import sys
+import os
+import json
+import subprocess
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Seconds allowed for `import main`; override on slow CI machines
+STARTUP_IMPORT_BUDGET = float(os.getenv("STARTUP_IMPORT_BUDGET", "3.0"))
+
+# Subsystems that must load on first use, never at API startup
+HEAVY_MODULES = [
+    "gradio", "pandas", "openai", "torch", "sentence_transformers", "spacy",
+    "fitz", "pytesseract", "docx2pdf", "playwright"
+]
+
+BENCHMARK_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "loaded": [m for m in %r if m in sys.modules]
+}))
+""" % (HEAVY_MODULES,)
+
+def measure_startup():
+    """Import main.py in a fresh interpreter and report import time and heavy modules loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", BENCHMARK_SCRIPT],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+@pytest.fixture(scope="module")
+def startup():
+    pytest.importorskip("fastapi")
+    return measure_startup()
+
+@pytest.fixture
+def main_module(monkeypatch):
+    pytest.importorskip("fastapi")
+    sys.path.append(PROJECT_ROOT)
+    monkeypatch.chdir(PROJECT_ROOT)
+    import main
+    # Each test gets a UI that has not been built yet
+    monkeypatch.setattr(main.gradio_ui, "_app", None)
+    return main
+
+def test_no_heavy_imports_at_startup(startup):
+    assert startup["loaded"] == [], f"Heavy modules imported at startup: {startup['loaded']}"
+
+def test_import_time_budget(startup):
+    assert startup["seconds"] < STARTUP_IMPORT_BUDGET, (
+        f"import main took {startup['seconds']:.2f}s (budget {STARTUP_IMPORT_BUDGET:.2f}s)"
+    )
+
+def test_gradio_paths_reach_the_lazy_ui_not_the_spa(main_module):
+    from fastapi.testclient import TestClient
+
+    async def build():
+        async def ui(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+            await send({"type": "http.response.body", "body": b"gradio"})
+        return ui
+
+    main_module.gradio_ui._build = build
+    try:
+        response = TestClient(main_module.app).get("/gradio/config")
+    finally:
+        del main_module.gradio_ui._build
+    assert response.status_code == 200 and response.text == "gradio"
+
+def test_gradio_ui_is_mounted_on_first_request(main_module, monkeypatch):
+    gr = pytest.importorskip("gradio")
+    from fastapi.testclient import TestClient
+
+    built = []
+
+    def build_ui():
+        built.append(True)
+        with gr.Blocks() as demo:
+            gr.Textbox(label="Job title")
+        return demo
+
+    monkeypatch.setattr(main_module.gradio_ui, "_blocks_factory", build_ui)
+    with TestClient(main_module.app) as client:
+        assert built == []
+        response = client.get("/gradio/config")
+        assert response.status_code == 200
+        assert any(c.get("props", {}).get("label") == "Job title" for c in response.json()["components"])
+        assert client.get("/gradio/").status_code == 200
+    assert built == [True]
+
+if __name__ == "__main__":
+    report = measure_startup()
+    print(f"import main: {report['seconds']:.3f}s (budget {STARTUP_IMPORT_BUDGET:.2f}s)")
+    print(f"heavy modules loaded: {report['loaded'] or 'none'}")
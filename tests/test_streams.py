@@ -0,0 +1,63 @@
+import sys
+import os
+import asyncio
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from scrapers.streams import merge, map_unordered, batched, filter_batched
+
+async def produce(prefix, count, delay):
+    for i in range(count):
+        await asyncio.sleep(delay)
+        yield f"{prefix}{i}"
+
+async def failing():
+    yield "f0"
+    raise ValueError("board down")
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+def test_merge_interleaves_and_survives_failing_source():
+    items = asyncio.run(collect(merge([produce("slow", 2, 0.05), produce("fast", 2, 0.001), failing()])))
+    assert sorted(items) == ["f0", "fast0", "fast1", "slow0", "slow1"]
+    # Fast sources are not held back by slow ones
+    assert items.index("fast1") < items.index("slow0")
+
+def test_map_unordered_yields_in_completion_order_and_drops_failures():
+    async def work(item):
+        if item == "x1":
+            raise RuntimeError("bad page")
+        await asyncio.sleep(0.05 if item == "x0" else 0.001)
+        return item.upper()
+
+    assert asyncio.run(collect(map_unordered(produce("x", 3, 0), work))) == ["X2", "X0"]
+
+def test_batched_flushes_on_size_and_timeout():
+    batches = asyncio.run(collect(batched(produce("j", 5, 0.001), 2, 10)))
+    assert batches == [["j0", "j1"], ["j2", "j3"], ["j4"]]
+
+    async def stalled():
+        yield "a"
+        await asyncio.sleep(0.3)
+        yield "b"
+
+    # The first item must not wait for the stalled source
+    assert asyncio.run(collect(batched(stalled(), 10, 0.05))) == [["a"], ["b"]]
+
+def test_filter_batched_keeps_order_and_counts_dropped():
+    batches = []
+
+    async def keep_even(batch):
+        batches.append(len(batch))
+        return [item for item in batch if int(item[1:]) % 2 == 0]
+
+    stats = {"skipped": 0}
+    items = asyncio.run(collect(filter_batched(produce("j", 5, 0), keep_even, 2, 1.0, stats)))
+    assert items == ["j0", "j2", "j4"]
+    assert batches == [2, 2, 1] and stats["skipped"] == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
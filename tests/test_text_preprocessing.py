@@ -0,0 +1,26 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from llm_modules.text_preprocessing import preprocess, preprocess_many, tokenize_terms
+
+def test_preprocess_strips_punctuation_and_stopwords():
+    text = "We are hiring ML engineers with Python and PyTorch. You'll build CI/CD pipelines!"
+    assert preprocess(text) == "hiring ml engineers python pytorch youll build cicd pipelines"
+
+def test_preprocess_drops_split_contractions():
+    """word_tokenize split "cannot" into two stopwords, so it never survived."""
+    assert preprocess("We cannot wait") == "wait"
+
+def test_preprocess_many_matches_preprocess():
+    texts = ["Requires SQL and Excel.", "Docker, Kubernetes", "Requires SQL and Excel."]
+    assert preprocess_many(texts) == [preprocess(t) for t in texts]
+
+def test_tokenize_terms_keeps_skill_punctuation():
+    assert tokenize_terms("C++, C#, Node.js and CI/CD.") == ["c++", "c#", "node.js", "and", "ci/cd"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,122 @@
+# utils/disk_cache.py
+
+import os
+import json
+import time
+import hashlib
+
+# Root folder for all on-disk caches (resume analysis, embeddings, OCR, HTTP, ...)
+CACHE_ROOT = os.getenv("APP_CACHE_DIR", ".cache")
+# Runs recording or replaying scrapes (scrapers/replay.py) keep their postings
+# index, breakers, host rates and detection results apart from live runs
+if any(os.getenv(name) for name in ("SCRAPER_RECORD", "SCRAPER_REPLAY", "SCRAPER_REPLAY_SERVER")):
+    CACHE_ROOT = os.path.join(CACHE_ROOT, "replay")
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_text(text):
+    return sha256_bytes(text.encode("utf-8"))
+
+
+def sha256_file(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_dir(namespace):
+    path = os.path.join(CACHE_ROOT, namespace)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class JsonDiskCache:
+    """
+    Minimal persistent key/value store.
+
+    Each key is stored as its own JSON file under CACHE_ROOT/<namespace>,
+    sharded by the first two hex digits of the key's hash. Writes are atomic
+    (temp file + rename) so concurrent worker processes never see partial files.
+    """
+
+    def __init__(self, namespace):
+        self.root = cache_dir(namespace)
+
+    def _path(self, key):
+        digest = sha256_text(key)
+        return os.path.join(self.root, digest[:2], digest + ".json")
+
+    def get(self, key, default=None):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default
+
+    def set(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARN] Could not write cache entry {path}: {e}")
+
+    def touch(self, key):
+        """Mark an entry as used now (for mtime-based expiry)."""
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+
+class FileLock:
+    """
+    Cross-process lock based on exclusive creation of a lock file.
+
+    Works the same on Windows and POSIX. A lock older than `stale_after`
+    seconds is assumed to belong to a crashed process and is broken.
+    """
+
+    def __init__(self, path, timeout=30.0, stale_after=60.0):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for lock {self.path}")
+                time.sleep(0.05)
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass